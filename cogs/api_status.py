@@ -3,7 +3,7 @@
 
 import logging
 from discord.ext import commands
-from modules import api_provider
+from modules import api_provider, discord_poster, football_memory, memory_queue, render_cache, storage
 from modules.discord_poster import post_new_message_to_context
 from utils.time_utils import bot_now
 
@@ -97,6 +97,53 @@ class ApiStatus(commands.Cog):
         )
         if tennis_status.get("last_success_utc"):
             lines.append(f"Tennis last success: {tennis_status['last_success_utc']}")
+        cache_parts = []
+        for cache_stats in (football_memory.espn_cache_stats(), status.get("team_search_cache")):
+            if not cache_stats:
+                continue
+            hit_rate = cache_stats.get("hit_rate")
+            cache_parts.append(
+                f"{cache_stats['name']} {cache_stats['entries']}/{cache_stats['max_entries']} "
+                f"({cache_stats['hits']} hit, {cache_stats['misses']} miss, "
+                f"{cache_stats['evictions']} evicted"
+                + (f", {hit_rate:.0%} hit rate)" if hit_rate is not None else ")")
+            )
+        if cache_parts:
+            lines.append("ESPN response caches: " + "; ".join(cache_parts))
+        outbound = discord_poster.outbound.stats()
+        if outbound["sent"] or outbound["failed"] or outbound["depth"]:
+            avg_latency = outbound["avg_latency_sec"]
+            lines.append(
+                f"Discord outbound queue: depth {outbound['depth']} (max {outbound['max_depth']}), "
+                f"{outbound['sent']} sent, {outbound['failed']} failed ({outbound['timed_out']} timed out), "
+                f"{outbound['coalesced']} coalesced edits; "
+                f"latency avg {avg_latency if avg_latency is not None else 'n/a'}s, max {outbound['max_latency_sec']}s."
+            )
+        tracker = discord_poster.message_tracker.stats()
+        if tracker["memory_hits"] or tracker["history_fetches"]:
+            lines.append(
+                f"Message index: {tracker['channels']} channel(s), {tracker['memory_hits']} lookups from memory, "
+                f"{tracker['history_fetches']} history reads, {tracker['invalidations']} invalidations."
+            )
+        memory_updates = memory_queue.get_status()
+        if memory_updates["queued"] or memory_updates["batches"]:
+            lines.append(
+                f"Memory update queue: {memory_updates['queued']} queued, {memory_updates['batches']} batches, "
+                f"{memory_updates['applied']} applied, {memory_updates['failed']} failed"
+                f"{'' if memory_updates['worker_running'] else ' (worker not running)'}."
+            )
+        renders = render_cache.football_renders.stats()
+        if renders["hits"] or renders["misses"]:
+            lines.append(
+                f"Render cache: {renders['entries']}/{renders['max_entries']} lines, "
+                f"{renders['hits']} hits, {renders['misses']} renders (hit rate {renders['hit_rate']})."
+            )
+        writer = storage.get_writer_status()
+        if writer["submitted"]:
+            lines.append(
+                f"Storage writer: {writer['pending']} pending, {writer['written']} written, "
+                f"{writer['coalesced']} coalesced, {writer['failed']} failed."
+            )
         await post_new_message_to_context(ctx, content="\n".join(lines))
 
 
@@ -8,7 +8,6 @@ from urllib.parse import urlparse
 
 import aiohttp
 from discord.ext import commands
-from ddgs import DDGS
 
 from config import (
     LEAGUE_NAME_MAP,
@@ -26,7 +25,10 @@ from modules.admin import owner_only
 from modules.football_memory import (
     load_memory,
     check_memory_staleness,
+    get_league_leaders,
     get_league_standings,
+    get_team_form,
+    get_team_top_scorers,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,15 @@ logger = logging.getLogger(__name__)
 _HISTORY_MAXLEN = 10
 _MAX_TOOL_ROUNDS = 6
 _MAX_WEB_RESULTS = 5
+_LEADER_TABLES = (
+    ("goals", "Top Scorers", "goals"),
+    ("assists", "Top Assists", "assists"),
+    ("yellow_cards", "Most Yellow Cards", "yellow cards"),
+    ("red_cards", "Most Red Cards", "red cards"),
+)
+_LEADER_KEYWORDS = (
+    "scorer", "goals", "assist", "card", "booking", "leader", "capocannoniere", "marcatori",
+)
 
 TOOLS = [
     {
@@ -84,13 +95,16 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "get_memory",
-            "description": "Retrieve stored facts (standings, team stats, players) from bot memory. Use this FIRST for factual questions.",
+            "description": (
+                "Retrieve stored facts (standings, league scorer/assist/card leaders, team stats, form, players) "
+                "from bot memory. Use this FIRST for factual questions."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
                     "entity_type": {
                         "type": "string",
-                        "enum": ["league", "team"],
+                        "enum": ["league", "league_leaders", "team"],
                         "description": "Type of entity to retrieve from memory.",
                     },
                     "entity_name": {
@@ -373,6 +387,10 @@ class Ask(commands.Cog):
         trusted_results: list[dict] = []
         fallback_results: list[dict] = []
 
+        # Imported on first search: ddgs and its HTTP/parsing stack stay out of
+        # startup time and memory on days !ask is not used.
+        from ddgs import DDGS
+
         with DDGS() as ddgs:
             if domain_mode in {"trusted_first", "trusted_only"} and TRUSTED_SPORT_DOMAINS:
                 trusted_query = f"{query} ({' OR '.join(f'site:{d}' for d in TRUSTED_SPORT_DOMAINS)})"
@@ -465,6 +483,20 @@ class Ask(commands.Cog):
                                     "sources": [],
                                 }
 
+                elif entity_type == "league_leaders":
+                    for league_id, league_name in LEAGUE_NAME_MAP.items():
+                        if league_name.lower() == entity_name.lower():
+                            lines = self._format_league_leaders(league_id, league_name, limit=5)
+                            if not lines:
+                                return {
+                                    "content": f"No leaderboard data found in memory for {entity_name}.",
+                                    "sources": [],
+                                }
+                            return {
+                                "content": f"FINAL ANSWER FROM MEMORY:\n" + "\n".join(lines) + "\n\nDO NOT CALL ANY MORE TOOLS.",
+                                "sources": [{"href": "", "domain": "Bot Memory"}],
+                            }
+
                 elif entity_type == "team":
                     # Find team by name (case-insensitive)
                     memory = load_memory()
@@ -479,17 +511,18 @@ class Ask(commands.Cog):
                                     f"L{stats.get('losses', 0)} GF{stats.get('goals_for', 0)} "
                                     f"GA{stats.get('goals_against', 0)}"
                                 )
+                            form_line = self._format_form(team_data)
+                            if form_line:
+                                lines.append(form_line)
                             # Top 3 scorers
                             players = team_data.get("players", {})
                             if players:
-                                sorted_players = sorted(
-                                    players.items(),
-                                    key=lambda x: x[1].get("goals", 0),
-                                    reverse=True,
-                                )[:3]
-                                if sorted_players:
+                                top_scorers = get_team_top_scorers(team_data, limit=3)
+                                if top_scorers:
                                     lines.append("  Top Scorers:")
-                                    for pname, pdata in sorted_players:
+                                    for row in top_scorers:
+                                        pname = row["name"]
+                                        pdata = players.get(pname, {})
                                         lines.append(
                                             f"    - {pname}: {pdata.get('goals', 0)} goals, "
                                             f"{pdata.get('assists', 0)} assists, "
@@ -511,6 +544,35 @@ class Ask(commands.Cog):
 
         return {"content": f"Unknown tool: {name}", "sources": []}
 
+    def _format_league_leaders(
+        self,
+        league_id: int,
+        league_name: str,
+        limit: int = 5,
+        memory: dict | None = None,
+    ) -> list[str]:
+        lines = [f"{league_name} Leaders:"]
+        for stat, title, unit in _LEADER_TABLES:
+            rows = get_league_leaders(league_id, stat, limit=limit, memory=memory)
+            if not rows:
+                continue
+            lines.append(f"  {title}:")
+            for rank, row in enumerate(rows, start=1):
+                lines.append(f"    {rank}. {row['name']} ({row.get('team_name', 'Unknown')}) - {row['value']} {unit}")
+        return lines if len(lines) > 1 else []
+
+    def _format_form(self, team_data: dict) -> str:
+        form = get_team_form(team_data)
+        if not form:
+            return ""
+        results = "".join(entry.get("result", "?") for entry in form)
+        recent = "; ".join(
+            f"{entry.get('result', '?')} {entry.get('score', '?')} "
+            f"{'vs' if entry.get('venue') == 'home' else 'at'} {entry.get('opponent') or 'Unknown'}"
+            for entry in form
+        )
+        return f"  Form (last {len(form)}, newest first): {results} - {recent}"
+
     def _format_memory_context(self, question: str, memory: dict) -> str:
         """
         Extract relevant entities from the question and format memory context for LLM.
@@ -554,7 +616,12 @@ class Ask(commands.Cog):
                                 f"  {team['position']}. {team['name']} - {team['points']}pts "
                                 f"(P{team['played']} W{team['won']} D{team['drawn']} L{team['lost']})"
                             )
-                        break
+                    if any(keyword in question_lower for keyword in _LEADER_KEYWORDS):
+                        leader_lines = self._format_league_leaders(league_id, league_name, limit=5, memory=memory)
+                        if leader_lines:
+                            lines.append(f"\n{league_name} Leaders (from memory):")
+                            lines.extend(leader_lines[1:])
+                    break
 
         # Add team info if requested
         for team_name in entities["teams"]:
@@ -574,17 +641,18 @@ class Ask(commands.Cog):
                         f"L{stats.get('losses', 0)} GF{stats.get('goals_for', 0)} "
                         f"GA{stats.get('goals_against', 0)}"
                     )
+                form_line = self._format_form(team_info)
+                if form_line:
+                    lines.append(form_line)
                 # Top 3 scorers
                 players = team_info.get("players", {})
                 if players:
-                    sorted_players = sorted(
-                        players.items(),
-                        key=lambda x: x[1].get("goals", 0),
-                        reverse=True,
-                    )[:3]
-                    if sorted_players:
+                    top_scorers = get_team_top_scorers(team_info, limit=3)
+                    if top_scorers:
                         lines.append("  Top Scorers:")
-                        for pname, pdata in sorted_players:
+                        for row in top_scorers:
+                            pname = row["name"]
+                            pdata = players.get(pname, {})
                             lines.append(
                                 f"    - {pname}: {pdata.get('goals', 0)} goals, "
                                 f"{pdata.get('assists', 0)} assists"
@@ -108,7 +108,7 @@ def build_match_state_detail(fixture: dict, now_utc: datetime) -> str:
         f"Last seen UTC: {fixture.get('last_seen_utc') or 'n/a'}",
         f"Terminal UTC: {fixture.get('terminal_utc') or 'n/a'}",
         f"FT announced: {'yes' if fixture.get('ft_announced') else 'no'}",
-        f"Memory updated: {'yes' if fixture.get('memory_updated') else 'no'}",
+        f"Memory updated: {'yes' if fixture.get('memory_updated') else ('gave up' if fixture.get('memory_update_failed') else 'no')}",
         f"Live message ID: {fixture.get('live_message_id') or 'n/a'}",
         f"Prunable now: {'yes' if prunable else 'no'}",
         f"Expected FT due: {'yes' if due else 'no'}",
@@ -153,6 +153,16 @@ def build_match_state_list(state: dict, now_utc: datetime, limit: int = LIST_LIM
     return _truncate("\n".join(lines))
 
 
+def _fmt_cycle(status: dict) -> str:
+    if not status.get("cycles"):
+        return "n/a"
+    return (
+        f"{status.get('cycles')} run(s), last {status.get('last_cycle_duration_sec')}s, "
+        f"late {status.get('last_cycle_lateness_sec')}s, "
+        f"overruns {status.get('cycle_overruns', 0)}, failures {status.get('cycle_failures', 0)}"
+    )
+
+
 def build_lifecycle_summary(state: dict, now_utc: datetime) -> str:
     fixtures = list((state.get("fixtures", {}) or {}).values())
     status = api_provider.get_status()
@@ -190,6 +200,7 @@ def build_lifecycle_summary(state: dict, now_utc: datetime) -> str:
         f"Wake detail: {scheduler_status.get('wake_reason_detail') or 'n/a'}",
         f"Sleep reason: {scheduler_status.get('sleep_reason') or 'n/a'}",
         f"Sleep detail: {scheduler_status.get('sleep_reason_detail') or 'n/a'}",
+        f"Football cycle: {_fmt_cycle(scheduler_status)}",
         f"Tennis scheduler: {tennis_scheduler_status.get('mode', 'unknown')}",
         f"Next tennis check: {_fmt_utc_value(tennis_scheduler_status.get('next_tennis_check_utc'))}",
         f"Next tennis schedule refresh: {_fmt_utc_value(tennis_scheduler_status.get('next_schedule_refresh_utc'))}",
@@ -199,6 +210,7 @@ def build_lifecycle_summary(state: dict, now_utc: datetime) -> str:
         f"Tennis wake detail: {tennis_scheduler_status.get('wake_reason_detail') or 'n/a'}",
         f"Tennis sleep reason: {tennis_scheduler_status.get('sleep_reason') or 'n/a'}",
         f"Tennis sleep detail: {tennis_scheduler_status.get('sleep_reason_detail') or 'n/a'}",
+        f"Tennis cycle: {_fmt_cycle(tennis_scheduler_status)}",
         f"Timezone: {OPERATIONS_TIMEZONE}",
         f"Display lookup: +/-{FOOTBALL_DISPLAY_LOOKUP_WINDOW_HOURS}h",
         (
@@ -4,8 +4,9 @@
 
 import logging
 import re
+from datetime import datetime, timedelta, timezone
 
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from cogs.matches import fetch_combined_matches_snapshot
 from config import CHANNEL_ID, OPERATIONS_TIMEZONE
@@ -13,13 +14,20 @@ from modules.bot_mode import get_mode, is_verbose
 from modules.discord_poster import post_new_general_message, post_new_message_to_context
 from modules.admin import is_operator
 from modules.ft_handler import seed_already_announced_ft
+from modules.job_scheduler import Job
 from modules.live_loop import seed_already_posted
 from modules.runtime_settings import get_morning_schedule, set_morning_schedule
+from modules.scheduler import operations_jobs
 from utils.personality import get_greeting
-from utils.time_utils import bot_now
+from utils.time_utils import bot_now, to_bot_tz, utc_now
 
 logger = logging.getLogger(__name__)
 
+MORNING_JOB = "morning_broadcast"
+# The schedule can change from the dashboard process, so it is re-read this often.
+_SETTINGS_RECHECK_SEC = 60
+_MORNING_MAX_RUNTIME_SEC = 300
+
 def _load() -> dict:
     return get_morning_schedule()
 
@@ -47,21 +55,39 @@ def _parse_time(time_str: str) -> tuple[int, int]:
     return hour, minute
 
 
+def _next_morning_check(cfg: dict, now_utc: datetime) -> datetime:
+    """Next exact fire time when it is within the settings recheck interval."""
+    recheck = now_utc + timedelta(seconds=_SETTINGS_RECHECK_SEC)
+    if not cfg.get("enabled", False):
+        return recheck
+    local_now = to_bot_tz(now_utc)
+    fire_at = local_now.replace(hour=cfg["hour"], minute=cfg["minute"], second=0, microsecond=0)
+    if fire_at <= local_now:
+        fire_at += timedelta(days=1)
+    return min(recheck, fire_at.astimezone(timezone.utc))
+
+
 class GoodMorning(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._last_sent_date: str | None = None
-        self.morning_check.start()
+        operations_jobs.register(Job(
+            MORNING_JOB,
+            self.morning_check,
+            interval_sec=_SETTINGS_RECHECK_SEC,
+            max_runtime_sec=_MORNING_MAX_RUNTIME_SEC,
+        ))
 
     def cog_unload(self):
-        self.morning_check.cancel()
+        operations_jobs.unregister(MORNING_JOB)
 
-    @tasks.loop(minutes=1)
-    async def morning_check(self):
+    async def morning_check(self, now_utc: datetime) -> datetime:
         cfg = _load()
-        if not cfg.get("enabled", False):
-            return
+        if cfg.get("enabled", False):
+            await self._send_if_due(cfg)
+        return _next_morning_check(cfg, utc_now())
 
+    async def _send_if_due(self, cfg: dict) -> None:
         now = bot_now()
         if now.hour != cfg["hour"] or now.minute != cfg["minute"]:
             return
@@ -89,10 +115,6 @@ class GoodMorning(commands.Cog):
         except Exception as e:
             logger.error(f"GoodMorning: failed to send message: {e}", exc_info=True)
 
-    @morning_check.before_loop
-    async def before_morning_check(self):
-        await self.bot.wait_until_ready()
-
     @commands.command(
         name="goodmorning",
         aliases=["gm"],
@@ -1,6 +1,6 @@
 import logging
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import discord
@@ -15,6 +15,8 @@ from config import (
 )
 from modules.discord_poster import post_new_message_to_context
 from modules.admin import owner_only
+from modules.log_index import search_logs
+from modules.log_reader import iter_log_lines_reversed
 from utils.redaction import redact_text
 from utils.time_utils import bot_now
 
@@ -23,44 +25,73 @@ logger = logging.getLogger(__name__)
 _LEVEL_PATTERN = re.compile(r"\[(WARNING|ERROR|CRITICAL)\s*\]")
 _MODULE_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{2,80}$")
 _LINE_TS_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}:\d{2}\]")
-def _iter_log_paths(base_path: Path) -> list[Path]:
+_CLOCK_PATTERN = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+_RANGE_USAGE = "Usage: `!log range [yesterday|YYYY-MM-DD] HH:MM HH:MM [errors | module <module_name>]`"
+
+
+def _read_today_lines(
+    base_path: Path,
+    today_str: str,
+    *,
+    mode: str = "today",
+    value: str | None = None,
+    limit: int | None = None,
+) -> list[str]:
     """
-    Return log files in chronological order:
-    bot.log.N (highest N -> oldest first) ... bot.log.1 ... bot.log (current).
+    Return today's matching lines oldest first, at most the newest `limit`.
+    Reads backwards from the current log and stops at the first earlier date.
     """
-    parent = base_path.parent
-    base_name = base_path.name
-    candidates = [p for p in parent.glob(f"{base_name}*") if p.is_file()]
-
-    rotated: list[tuple[int, Path]] = []
-    current: list[Path] = []
-    for path in candidates:
-        if path.name == base_name:
-            current.append(path)
+    lines: list[str] = []
+    for line in iter_log_lines_reversed(base_path):
+        m = _LINE_TS_PATTERN.match(line)
+        if not m:
+            continue
+        line_date = m.group(1)
+        if line_date < today_str:
+            break
+        if line_date != today_str or not _matches_mode(line, mode, value):
             continue
-        m = re.match(rf"^{re.escape(base_name)}\.(\d+)$", path.name)
-        if m:
-            rotated.append((int(m.group(1)), path))
+        lines.append(line)
+        if limit is not None and len(lines) >= limit:
+            break
+    lines.reverse()
+    return lines
 
-    rotated.sort(key=lambda t: t[0], reverse=True)
-    ordered = [p for _, p in rotated] + current
-    return ordered
 
+def _matches_mode(line: str, mode: str, value: str | None) -> bool:
+    if mode == "errors":
+        return bool(_LEVEL_PATTERN.search(line))
+    if mode == "module":
+        return f"[{value}" in line
+    return True
 
-def _read_today_lines(base_path: Path, today_str: str) -> list[str]:
-    lines: list[str] = []
-    for path in _iter_log_paths(base_path):
-        try:
-            with path.open("r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    m = _LINE_TS_PATTERN.match(line)
-                    if not m:
-                        continue
-                    if m.group(1) == today_str:
-                        lines.append(line)
-        except Exception:
-            continue
-    return lines
+
+def _parse_range(value: str | None, today: date) -> dict:
+    """
+    Parse `[yesterday|YYYY-MM-DD] HH:MM HH:MM [errors | module <name>]` into
+    search_logs arguments. An end before the start runs past midnight.
+    """
+    tokens = (value or "").split()
+    day = today
+    if tokens and tokens[0].lower() == "yesterday":
+        day = today - timedelta(days=1)
+        tokens.pop(0)
+    elif tokens and re.fullmatch(r"\d{4}-\d{2}-\d{2}", tokens[0]):
+        day = date.fromisoformat(tokens.pop(0))
+    if len(tokens) < 2 or not all(_CLOCK_PATTERN.match(token) for token in tokens[:2]):
+        raise ValueError(_RANGE_USAGE)
+    start, end = tokens[0], tokens[1]
+    end_day = day + timedelta(days=1) if end < start else day
+    parsed = {"start": f"{day} {start}", "end": f"{end_day} {end}", "min_level": None, "module": None}
+
+    rest = tokens[2:]
+    if rest == ["errors"]:
+        parsed["min_level"] = "WARNING"
+    elif len(rest) == 2 and rest[0] == "module" and _MODULE_PATTERN.match(rest[1]):
+        parsed["module"] = rest[1]
+    elif rest:
+        raise ValueError(_RANGE_USAGE)
+    return parsed
 
 
 def _redact_line(line: str) -> str:
@@ -107,7 +138,7 @@ class LogCog(commands.Cog):
 
     @commands.command(
         name="log",
-        help="Export runtime logs: !log | !log errors | !log module <module_name>",
+        help="Export runtime logs: !log | !log errors | !log module <module_name> | !log range [yesterday|YYYY-MM-DD] HH:MM HH:MM",
     )
     @owner_only()
     async def log_export(
@@ -120,13 +151,21 @@ class LogCog(commands.Cog):
         mode = mode.lower().strip()
         value = (value or "").strip() or None
 
-        if mode not in {"today", "recent", "errors", "module"}:
+        if mode not in {"today", "recent", "errors", "module", "range"}:
             await post_new_message_to_context(
                 ctx,
-                content="Usage: `!log`, `!log today`, `!log errors`, `!log module <module_name>`",
+                content="Usage: `!log`, `!log today`, `!log errors`, `!log module <module_name>`, `!log range HH:MM HH:MM`",
             )
             return
 
+        search = None
+        if mode == "range":
+            try:
+                search = _parse_range(value, bot_now().date())
+            except ValueError as e:
+                await post_new_message_to_context(ctx, content=str(e))
+                return
+
         if mode == "module":
             if not value:
                 await post_new_message_to_context(
@@ -150,19 +189,24 @@ class LogCog(commands.Cog):
 
         try:
             today_str = bot_now().date().isoformat()
-            raw_lines = _read_today_lines(self.log_path, today_str)
-
-            if mode in {"today", "recent"}:
-                selected = raw_lines
-            elif mode == "errors":
-                selected = [line for line in raw_lines if _LEVEL_PATTERN.search(line)]
+            limit = max(1, min(LOG_EXPORT_DEFAULT_LINES, LOG_EXPORT_MAX_LINES))
+            if search is not None:
+                selected = search_logs(self.log_path, limit=limit, **search)["lines"]
+                scope = f"{search['start']} - {search['end']}"
             else:
-                selected = [line for line in raw_lines if f"[{value}" in line]
+                selected = _read_today_lines(
+                    self.log_path,
+                    today_str,
+                    mode=mode,
+                    value=value,
+                    limit=limit,
+                )
+                scope = today_str
 
             if not selected:
                 await post_new_message_to_context(
                     ctx,
-                    content=f"No matching log entries found for {today_str} (bot local date).",
+                    content=f"No matching log entries found for {scope} (bot local date).",
                 )
                 return
 
@@ -174,7 +218,7 @@ class LogCog(commands.Cog):
             )
 
             stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            suffix = value.replace(".", "_") if value else mode
+            suffix = value.replace(".", "_") if value and mode == "module" else mode
             export_path = self.export_dir / f"log_export_{suffix}_{stamp}.txt"
             export_path.write_text(payload, encoding="utf-8")
 
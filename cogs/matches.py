@@ -1,4 +1,5 @@
 # cogs/matches.py
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import timedelta
@@ -15,6 +16,7 @@ from utils.event_formatter import (
     prune_goal_events_to_score,
 )
 from modules.discord_poster import post_new_message_to_context
+from modules.render_cache import football_renders, render_inputs
 from utils.tennis_formatter import format_tennis_snapshot_line
 from utils.tennis_lifecycle import tennis_final_data_ready
 
@@ -117,6 +119,20 @@ def filter_upcoming_football_fixtures(fixtures: list, now_utc) -> list:
 
 
 def _format_football_fixture_line(match: dict) -> str:
+    # Completeness reads persisted fixture state, so it is resolved on every call and
+    # becomes part of the render key instead of being cached with the line.
+    show_warning = (
+        match_lifecycle.status_short(match) != "NS"
+        and api_provider.event_completeness_status(match)["status"] == api_provider.EVENTS_EXHAUSTED_MISSING
+    )
+    return football_renders.render(
+        "fixture_line",
+        {"match": render_inputs(match), "show_missing_warning": show_warning},
+        lambda: _render_football_fixture_line(match, show_missing_warning=show_warning),
+    )
+
+
+def _render_football_fixture_line(match: dict, *, show_missing_warning: bool) -> str:
     match, pruned_goal_events = prune_goal_events_to_score(match)
     if pruned_goal_events:
         logger.info(
@@ -136,12 +152,7 @@ def _format_football_fixture_line(match: dict) -> str:
         events = match.get("events", [])
         ft_event_parts = format_match_events(events, home, away)
         score_str = f"{home} {goals.get('home', '?')}-{goals.get('away', '?')} {away}"
-        completeness = api_provider.event_completeness_status(match)
-        note = event_completeness_note(
-            goals,
-            events,
-            show_warning=completeness["status"] == api_provider.EVENTS_EXHAUSTED_MISSING,
-        )
+        note = event_completeness_note(goals, events, show_warning=show_missing_warning)
         shootout_segments = format_shootout_segments(match, final=True)
         if ft_event_parts:
             line = f"- FT: {score_str} ({'; '.join(ft_event_parts)})"
@@ -162,12 +173,7 @@ def _format_football_fixture_line(match: dict) -> str:
     events = match.get("events", [])
     event_parts = format_match_events(events, home, away)
     score_str = f"{home} {goals.get('home', '?')}-{goals.get('away', '?')} {away}"
-    completeness = api_provider.event_completeness_status(match)
-    note = event_completeness_note(
-        goals,
-        events,
-        show_warning=completeness["status"] == api_provider.EVENTS_EXHAUSTED_MISSING,
-    )
+    note = event_completeness_note(goals, events, show_warning=show_missing_warning)
     shootout_segments = format_shootout_segments(match, final=False)
     if event_parts:
         line = f"- LIVE [{minute_str}]: {score_str} ({'; '.join(event_parts)})"
@@ -303,26 +309,36 @@ async def build_combined_matches_message_from_api(session) -> str:
     return content
 
 
-async def fetch_combined_matches_snapshot(session) -> tuple[list, list, str]:
-    now = utc_now()
-    football_fixtures = []
-    tennis_matches = []
-
+async def fetch_football_snapshot(session, now=None) -> list:
+    """Today's enriched football fixtures; [] (logged) when the providers fail."""
+    now = now or utc_now()
     try:
         football_fixtures = filter_football_for_local_matchday(
             await api_provider.fetch_day(session),
             now,
         )
         football_fixtures = await api_provider.enrich_fixtures(session, football_fixtures)
-        football_fixtures = _apply_persisted_ft_events(football_fixtures)
+        return _apply_persisted_ft_events(football_fixtures)
     except Exception as e:
         logger.error(f"Failed to fetch football snapshot: {e}", exc_info=True)
+        return []
 
+
+async def fetch_tennis_snapshot(session) -> list:
+    """Today's tennis matches; [] (logged) when ESPN fails."""
     try:
-        tennis_matches = await api_provider.fetch_tennis_day(session)
+        return await api_provider.fetch_tennis_day(session)
     except Exception as e:
         logger.error(f"Failed to fetch tennis snapshot: {e}", exc_info=True)
+        return []
+
 
+async def fetch_combined_matches_snapshot(session) -> tuple[list, list, str]:
+    now = utc_now()
+    football_fixtures, tennis_matches = await asyncio.gather(
+        fetch_football_snapshot(session, now),
+        fetch_tennis_snapshot(session),
+    )
     return (
         football_fixtures,
         tennis_matches,
@@ -147,6 +147,8 @@ TENNIS_FINISHED_RETENTION_HOURS = _expect_int_range(
 LIVE_UPDATE_EDIT_WINDOW_MESSAGES = int(
     _expect(ops_cfg, "live_update_edit_window_messages", int, "operations")
 )
+LIVE_BOARD_ENABLED = bool(_expect(ops_cfg, "live_board_enabled", bool, "operations"))
+LIVE_BOARD_INCLUDE_TENNIS = bool(_expect(ops_cfg, "live_board_include_tennis", bool, "operations"))
 OPERATIONS_TIMEZONE = _validate_timezone_name(_expect(ops_cfg, "timezone", str, "operations"))
 FOOTBALL_PREMATCH_WINDOW_HOURS = _expect_int_range(ops_cfg, "football_prematch_window_hours", 0, "operations")
 FOOTBALL_DISPLAY_LOOKUP_WINDOW_HOURS = _load_display_lookup_window_hours(ops_cfg)
@@ -187,6 +189,7 @@ LOG_EXPORT_MAX_BYTES = int(_expect(log_cfg, "export_max_bytes", int, "log"))
 MEMORY_STALE_THRESHOLD_DAYS = int(_expect(memory_cfg, "stale_threshold_days", int, "memory"))
 ESPN_CACHE_TTL_SEC = int(_expect(memory_cfg, "espn_cache_ttl_sec", int, "memory"))
 ROSTER_UNSUPPORTED_RETRY_DAYS = int(_expect(memory_cfg, "roster_unsupported_retry_days", int, "memory"))
+COMPRESS_FOOTBALL_MEMORY = bool(_expect(memory_cfg, "compress_football_memory", bool, "memory"))
 
 LLM_BASE_URL = _expect(llm_cfg, "base_url", str, "llm")
 LLM_MODEL = _expect(llm_cfg, "model", str, "llm")
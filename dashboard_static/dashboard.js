@@ -1,4 +1,4 @@
-const state={csrf:null,snapshot:null,draft:null,original:null,dirty:false,page:'overview',session:null};
+const state={csrf:null,snapshot:null,draft:null,original:null,dirty:false,page:'overview',session:null,status:null,stream:null,auditCursor:null};
 const $=s=>document.querySelector(s);const $$=s=>[...document.querySelectorAll(s)];
 async function api(path,options={}){const headers={'Content-Type':'application/json',...(options.headers||{})};if(state.csrf&&options.method&&options.method!=='GET')headers['X-CSRF-Token']=state.csrf;const response=await fetch(path,{...options,headers});let data={};try{data=await response.json()}catch{}if(!response.ok)throw Object.assign(new Error(data.error||`Request failed (${response.status})`),{status:response.status,data});return data}
 function toast(message,bad=false){const el=$('#toast');el.textContent=message;el.style.background=bad?'#5b2029':'#194838';el.classList.remove('hidden');setTimeout(()=>el.classList.add('hidden'),3500)}
@@ -15,14 +15,16 @@ function bindFields(){$$('#config-fields [data-path]').forEach(input=>input.addE
 function showPage(page){state.page=page;$$('#nav button').forEach(b=>b.classList.toggle('active',b.dataset.page===page));$$('.page').forEach(p=>p.classList.remove('active'));let target=page;if(['bot','administration','tracking','operations','llm','log'].includes(page)){target='config';sectionFields(page)}$(`#page-${target}`).classList.add('active');const active=$(`#nav button[data-page="${page}"]`);$('#page-title').textContent=active?.textContent||'Overview';$('.sidebar').classList.remove('open');if(page==='advanced')syncJson();if(page==='audit')loadAudit();if(page==='service')loadLogs();if(page==='admins')loadAdmins()}
 function renderWarnings(){if(!state.session)return;const warnings=[];if(state.session.default_password)warnings.push(['critical','Default admin/admin credentials are active. Change this password before delegating access.']);if(!state.session.https)warnings.push(['','This connection is unencrypted. Use only on a trusted LAN/VPN, or add an HTTPS reverse proxy.']);if(state.dirty)warnings.push(['','Configuration has unsaved changes.']);if(state.snapshot)for(const [name,status] of Object.entries(state.snapshot.secrets))if(!status.configured)warnings.push(['critical',`${name} is missing.`]);$('#warnings').innerHTML=warnings.map(([c,t])=>`<div class="warning ${c}">${escapeHtml(t)}</div>`).join('')}
 async function loadConfig(){state.snapshot=await api('/api/config');state.draft=structuredClone(state.snapshot.config);state.original=structuredClone(state.snapshot.config);setDirty();renderSecrets();syncJson()}
-async function loadOverview(){const [status,runtime]=await Promise.all([api('/api/status'),api('/api/runtime')]);const h=status.health,stale=h.stale,tp=h.tennis_provider||{},tr=tp.requests||{};$('#overall-status').textContent=stale?'!':'✓';$('#overall-status').style.borderColor=stale?'#d92035':'#338b68';const cards=[['Bot health',stale?'Stale / unavailable':'Online',h.timestamp||'No snapshot yet'],['Bot service',status.services.bot||'Unknown',status.services.supported?'systemd managed':'Portable mode'],['Provider',h.provider?.active_provider||h.provider?.mode||'Unknown',h.provider?.espn_healthy===false?'Fallback active':'ESPN status'],['Tennis ESPN',`${tr.total||0} requests`,`${tr.targeted||0} targeted · ${tr.discovery||0} discovery · ${tr.timeout||0} timeout`],['Football scheduler',h.football_scheduler?.mode||'Unknown',h.football_scheduler?.wake_reason||h.football_scheduler?.sleep_reason||'No reason'],['Tennis scheduler',h.tennis_scheduler?.mode||'Unknown',h.tennis_scheduler?.wake_reason||h.tennis_scheduler?.sleep_reason||'No reason'],['Commit',h.commit?.sha||'Unknown',h.commit?.message||'Running version']];$('#status-cards').innerHTML=cards.map(c=>`<article class="card"><p class="eyebrow">${escapeHtml(c[0])}</p><div class="metric">${escapeHtml(c[1])}</div><p class="muted">${escapeHtml(c[2])}</p></article>`).join('');renderRuntime(runtime);if(stale){const el=document.createElement('div');el.className='warning critical';el.textContent='Bot health is stale. The bot may be stopped or unable to update its snapshot.';$('#warnings').append(el)}}
+async function loadOverview(){const [status,runtime]=await Promise.all([api('/api/status'),api('/api/runtime')]);state.status=status;renderStatus();renderRuntime(runtime);watchStatus()}
+function renderStatus(){const status=state.status,h=status.health,stale=h.stale,tp=h.tennis_provider||{},tr=tp.requests||{},jobs=h.jobs||[],startup=h.startup;$('#overall-status').textContent=stale?'!':'✓';$('#overall-status').style.borderColor=stale?'#d92035':'#338b68';const cards=[['Bot health',stale?'Stale / unavailable':'Online',h.timestamp||'No snapshot yet'],['Bot service',status.services.bot||'Unknown',status.services.supported?'systemd managed':'Portable mode'],['Provider',h.provider?.active_provider||h.provider?.mode||'Unknown',h.provider?.espn_healthy===false?'Fallback active':'ESPN status'],['Tennis ESPN',`${tr.total||0} requests`,`${tr.targeted||0} targeted · ${tr.discovery||0} discovery · ${tr.timeout||0} timeout`],['Football scheduler',h.football_scheduler?.mode||'Unknown',h.football_scheduler?.wake_reason||h.football_scheduler?.sleep_reason||'No reason'],['Tennis scheduler',h.tennis_scheduler?.mode||'Unknown',h.tennis_scheduler?.wake_reason||h.tennis_scheduler?.sleep_reason||'No reason'],['Upcoming jobs',jobs[0]?.name||'None',jobs.slice(0,5).map(j=>`${j.name} ${j.running?'running':(j.next_due_utc||'').slice(11,19)}`).join(' · ')||'No jobs registered'],['Startup',startup?`${Math.round(startup.total_ms)} ms`:'Unknown',startup?[...startup.steps].sort((a,b)=>(b.duration_ms||0)-(a.duration_ms||0)).slice(0,3).map(s=>s.status==='ok'?`${s.name} ${Math.round(s.duration_ms)} ms`:`${s.name} ${s.status}`).join(' · '):'No startup report yet'],['Commit',h.commit?.sha||'Unknown',h.commit?.message||'Running version']];$('#status-cards').innerHTML=cards.map(c=>`<article class="card"><p class="eyebrow">${escapeHtml(c[0])}</p><div class="metric">${escapeHtml(c[1])}</div><p class="muted">${escapeHtml(c[2])}</p></article>`).join('');renderWarnings();if(stale){const el=document.createElement('div');el.className='warning critical';el.textContent='Bot health is stale. The bot may be stopped or unable to update its snapshot.';$('#warnings').append(el)}}
+function watchStatus(){if(state.stream||!window.EventSource)return;const stream=new EventSource('/api/status/stream');state.stream=stream;stream.addEventListener('snapshot',e=>{state.status=JSON.parse(e.data);renderStatus()});stream.addEventListener('delta',e=>{for(const [section,changes] of Object.entries(JSON.parse(e.data)))state.status[section]={...state.status[section],...changes};renderStatus()});stream.onerror=()=>{if(stream.readyState===EventSource.CLOSED)state.stream=null}}
 function renderRuntime(runtime){const m=runtime.morning;$('#runtime-controls').innerHTML=`<div class="runtime-control"><strong>Broadcast mode</strong><select id="runtime-mode"><option ${runtime.mode==='verbose'?'selected':''}>verbose</option><option ${runtime.mode==='normal'?'selected':''}>normal</option><option ${runtime.mode==='silent'?'selected':''}>silent</option></select><button id="apply-mode" class="secondary">Apply now</button></div><div class="runtime-control"><strong>Morning message</strong><div class="row"><select id="morning-enabled"><option value="true" ${m.enabled?'selected':''}>On</option><option value="false" ${!m.enabled?'selected':''}>Off</option></select><input id="morning-time" type="time" value="${String(m.hour).padStart(2,'0')}:${String(m.minute).padStart(2,'0')}"></div><button id="apply-morning" class="secondary">Apply now</button></div>`;$('#apply-mode').onclick=async()=>{await api('/api/runtime/mode',{method:'PUT',body:JSON.stringify({mode:$('#runtime-mode').value})});toast('Broadcast mode updated')};$('#apply-morning').onclick=async()=>{const [hour,minute]=$('#morning-time').value.split(':').map(Number);await api('/api/runtime/morning',{method:'PUT',body:JSON.stringify({enabled:$('#morning-enabled').value==='true',hour,minute,timezone:state.draft.operations.timezone})});toast('Morning schedule updated')}}
 function renderSecrets(){if(!state.snapshot)return;$('#secret-list').innerHTML=Object.entries(state.snapshot.secrets).map(([name,s])=>`<article class="card secret-card"><p class="eyebrow">Secret</p><h3>${escapeHtml(name)}</h3><span class="badge ${s.configured?'good':'bad'}">${s.configured?`Configured ${escapeHtml(s.masked)}`:'Missing'}</span><input type="password" data-secret="${escapeHtml(name)}" placeholder="Enter replacement value"><button data-replace-secret="${escapeHtml(name)}" class="secondary">Replace secret</button></article>`).join('');$$('[data-replace-secret]').forEach(btn=>btn.onclick=async()=>{const input=$(`[data-secret="${btn.dataset.replaceSecret}"]`);if(!input.value||!confirm(`Replace ${btn.dataset.replaceSecret}? The stored value cannot be recovered.`))return;await api(`/api/secrets/${btn.dataset.replaceSecret}`,{method:'PUT',body:JSON.stringify({value:input.value})});input.value='';toast('Secret replaced. Restart the bot to apply it.');await loadConfig()})}
 function syncJson(){$('#json-editor').value=JSON.stringify(state.draft,null,2);$('#json-error').textContent=''}
 async function save(restart){try{const editor=$('#json-editor');if(state.page==='advanced'){state.draft=JSON.parse(editor.value);setDirty()}await api('/api/config/validate',{method:'POST',body:JSON.stringify({config:state.draft})});const paths=changedPaths(state.original,state.draft);if(!paths.length){toast('No configuration changes to save');return}$('#change-list').innerHTML=paths.map(p=>`<div>• ${escapeHtml(p)}</div>`).join('');$('#confirm-title').textContent=restart?'Save and restart the bot?':'Save configuration?';const dialog=$('#confirm-dialog');dialog.showModal();const result=await new Promise(resolve=>dialog.addEventListener('close',()=>resolve(dialog.returnValue),{once:true}));if(result!=='confirm')return;const response=await api('/api/config',{method:'PUT',body:JSON.stringify({config:state.draft,revision:state.snapshot.revision,restart})});toast(restart?'Saved; bot restart requested':'Configuration saved');await loadConfig();if(restart)setTimeout(loadOverview,4000)}catch(e){toast(e.message,true);if(e.status===409){await loadConfig();toast('Another administrator changed the configuration. The latest version was loaded.',true)}else $('#json-error').textContent=e.message}}
 async function loadAdmins(){const data=await api('/api/admins');$('#admin-list').innerHTML=data.users.map(u=>`<div class="admin-row"><div><strong>${escapeHtml(u.username)}</strong> <span class="badge ${u.active?'good':'bad'}">${u.active?'Active':'Disabled'}</span>${u.bootstrap_password?' <span class="badge bad">admin/admin</span>':''}</div><div class="admin-actions"><button class="secondary" data-password="${escapeHtml(u.username)}">Password</button><button class="ghost" data-active="${escapeHtml(u.username)}" data-value="${!u.active}">${u.active?'Disable':'Enable'}</button><button class="danger" data-delete="${escapeHtml(u.username)}">Delete</button></div></div>`).join('');$$('[data-password]').forEach(b=>b.onclick=async()=>{const password=prompt(`New password for ${b.dataset.password} (10+ characters):`);if(!password)return;const data=await api(`/api/admins/${encodeURIComponent(b.dataset.password)}/password`,{method:'PUT',body:JSON.stringify({password})});if(data.reauthenticate){location.reload()}else{toast('Password changed');loadAdmins()}});$$('[data-active]').forEach(b=>b.onclick=async()=>{await api(`/api/admins/${encodeURIComponent(b.dataset.active)}/active`,{method:'PUT',body:JSON.stringify({active:b.dataset.value==='true'})});toast('Administrator updated');loadAdmins()});$$('[data-delete]').forEach(b=>b.onclick=async()=>{if(!confirm(`Delete ${b.dataset.delete}?`))return;await api(`/api/admins/${encodeURIComponent(b.dataset.delete)}`,{method:'DELETE'});toast('Administrator deleted');loadAdmins()})}
-async function loadLogs(){try{const mode=$('#log-mode').value,module=$('#log-module').value;const data=await api(`/api/logs?mode=${encodeURIComponent(mode)}&module=${encodeURIComponent(module)}&limit=400`);$('#log-output').textContent=data.lines.join('\n')||'No matching log lines.'}catch(e){$('#log-output').textContent=e.message}}
-async function loadAudit(){const data=await api('/api/audit?limit=300');$('#audit-list').innerHTML=data.entries.map(e=>`<div class="audit-row"><span>${escapeHtml(new Date(e.timestamp).toLocaleString())}</span><strong>${escapeHtml(e.administrator)}</strong><code>${escapeHtml(e.action)}</code><span class="badge ${e.result==='success'||e.result==='started'?'good':'bad'}">${escapeHtml(e.result)}</span></div>`).join('')||'<div class="panel">No audit entries yet.</div>'}
+async function loadLogs(){try{const mode=$('#log-mode').value,module=$('#log-module').value,from=$('#log-from').value,to=$('#log-to').value;const range=from&&to?`&from=${encodeURIComponent(from)}&to=${encodeURIComponent(to)}`:'';const data=await api(`/api/logs?mode=${encodeURIComponent(mode)}&module=${encodeURIComponent(module)}&limit=400${range}`);$('#log-output').textContent=(data.lines.join('\n')||'No matching log lines.')+(data.truncated?'\n[showing the newest 400 matching entries; narrow the range for more]':'')}catch(e){$('#log-output').textContent=e.message}}
+async function loadAudit(older=false){const cursor=older&&state.auditCursor?`&cursor=${encodeURIComponent(state.auditCursor)}`:'';const data=await api(`/api/audit?limit=300${cursor}`);state.auditCursor=data.next_cursor;$('#audit-more').classList.toggle('hidden',!data.next_cursor);const rows=data.entries.map(e=>`<div class="audit-row"><span>${escapeHtml(new Date(e.timestamp).toLocaleString())}</span><strong>${escapeHtml(e.administrator)}</strong><code>${escapeHtml(e.action)}</code><span class="badge ${e.result==='success'||e.result==='started'?'good':'bad'}">${escapeHtml(e.result)}</span></div>`).join('');if(older){$('#audit-list').insertAdjacentHTML('beforeend',rows);return}$('#audit-list').innerHTML=rows||'<div class="panel">No audit entries yet.</div>'}
 async function boot(){try{const session=await api('/api/session');if(!session.authenticated)return;state.session=session;state.csrf=session.csrf;$('#login-view').classList.add('hidden');$('#app-view').classList.remove('hidden');$('#welcome').textContent=`Welcome, ${session.username}`;await loadConfig();renderWarnings();await loadOverview()}catch(e){toast(e.message,true)}}
 $('#login-form').onsubmit=async e=>{e.preventDefault();const data=Object.fromEntries(new FormData(e.target));try{const result=await api('/api/login',{method:'POST',body:JSON.stringify(data)});state.csrf=result.csrf;location.reload()}catch(err){$('#login-error').textContent=err.message}};
-$('#logout').onclick=async()=>{await api('/api/logout',{method:'POST',body:'{}'});location.reload()};$$('#nav button').forEach(b=>b.onclick=()=>showPage(b.dataset.page));$('#menu-toggle').onclick=()=>$('.sidebar').classList.toggle('open');$('#save').onclick=()=>save(false);$('#save-restart').onclick=()=>save(true);$('#json-editor').addEventListener('input',()=>{try{state.draft=JSON.parse($('#json-editor').value);$('#json-error').textContent='';setDirty()}catch(e){$('#json-error').textContent=e.message}});$('#add-admin').onsubmit=async e=>{e.preventDefault();const data=Object.fromEntries(new FormData(e.target));try{await api('/api/admins',{method:'POST',body:JSON.stringify(data)});e.target.reset();toast('Administrator added');loadAdmins()}catch(err){toast(err.message,true)}};$('#refresh-logs').onclick=loadLogs;$('#restart-bot').onclick=async()=>{if(!confirm('Restart the Discord bot now?'))return;try{await api('/api/operations/restart',{method:'POST',body:'{}'});toast('Bot restart requested')}catch(e){toast(e.message,true)}};$('#update-bot').onclick=async()=>{if(!confirm('Pull the latest release and restart both services?'))return;try{await api('/api/operations/update',{method:'POST',body:'{}'});toast('Managed update started. This page will reconnect.')}catch(e){toast(e.message,true)}};window.addEventListener('beforeunload',e=>{if(state.dirty){e.preventDefault();e.returnValue=''}});boot();
+$('#logout').onclick=async()=>{await api('/api/logout',{method:'POST',body:'{}'});location.reload()};$$('#nav button').forEach(b=>b.onclick=()=>showPage(b.dataset.page));$('#menu-toggle').onclick=()=>$('.sidebar').classList.toggle('open');$('#save').onclick=()=>save(false);$('#save-restart').onclick=()=>save(true);$('#json-editor').addEventListener('input',()=>{try{state.draft=JSON.parse($('#json-editor').value);$('#json-error').textContent='';setDirty()}catch(e){$('#json-error').textContent=e.message}});$('#add-admin').onsubmit=async e=>{e.preventDefault();const data=Object.fromEntries(new FormData(e.target));try{await api('/api/admins',{method:'POST',body:JSON.stringify(data)});e.target.reset();toast('Administrator added');loadAdmins()}catch(err){toast(err.message,true)}};$('#refresh-logs').onclick=loadLogs;$('#audit-more').onclick=()=>loadAudit(true);$('#restart-bot').onclick=async()=>{if(!confirm('Restart the Discord bot now?'))return;try{await api('/api/operations/restart',{method:'POST',body:'{}'});toast('Bot restart requested')}catch(e){toast(e.message,true)}};$('#update-bot').onclick=async()=>{if(!confirm('Pull the latest release and restart both services?'))return;try{await api('/api/operations/update',{method:'POST',body:'{}'});toast('Managed update started. This page will reconnect.')}catch(e){toast(e.message,true)}};window.addEventListener('beforeunload',e=>{if(state.dirty){e.preventDefault();e.returnValue=''}});boot();
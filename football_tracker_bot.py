@@ -4,11 +4,11 @@ import logging
 import sys
 import traceback
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
 
 import os
 import asyncio
 from datetime import time
+from time import perf_counter
 
 import discord
 from discord.ext import commands, tasks
@@ -32,18 +32,22 @@ from modules.admin import (
 )
 from modules.scheduler import run_local_daily_routines, run_operations_loop
 from modules.bot_mode import is_verbose, get_mode
-from modules.discord_poster import post_new_general_message, post_new_message_to_context
+from modules.log_index import IndexedRotatingFileHandler
+from modules.discord_poster import message_tracker, post_new_general_message, post_new_message_to_context
 from modules.ft_handler import seed_already_announced_ft
+from modules import api_provider, match_state, memory_queue, metrics, tennis_loop
+from modules.football_memory import espn_cache
 from modules.live_loop import seed_already_posted
-from cogs.matches import fetch_combined_matches_snapshot
+from modules.startup import StartupPipeline
+from cogs.matches import build_combined_matches_message, fetch_football_snapshot, fetch_tennis_snapshot
 from cogs.version import get_version_info
-from utils.time_utils import bot_tz
+from utils.time_utils import bot_tz, utc_now
 
 logger = logging.getLogger(__name__)
 
 
 def _configure_logging() -> None:
-    """Configure root logger to stdout + rotating file."""
+    """Configure root logger to stdout + rotating file with its per-minute index."""
     # Windows consoles can default to a legacy code page. Keep Unicode log
     # messages from raising handler errors when the bot is run there.
     if os.name == "nt" and hasattr(sys.stdout, "reconfigure"):
@@ -63,7 +67,7 @@ def _configure_logging() -> None:
 
     log_path = Path(LOG_FILE_PATH)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = RotatingFileHandler(
+    file_handler = IndexedRotatingFileHandler(
         filename=log_path,
         maxBytes=LOG_FILE_MAX_BYTES,
         backupCount=LOG_FILE_BACKUP_COUNT,
@@ -75,8 +79,6 @@ def _configure_logging() -> None:
     root.addHandler(file_handler)
 
 
-_configure_logging()
-
 # --- Intents & bot setup ---
 intents = discord.Intents.default()
 intents.message_content = True
@@ -92,7 +94,7 @@ async def ensure_http_session(bot_instance: commands.Bot):
     Creates a new session if one doesn't exist or if the existing one is closed.
     """
     if not hasattr(bot_instance, 'http_session') or bot_instance.http_session is None or bot_instance.http_session.closed:
-        bot_instance.http_session = aiohttp.ClientSession()
+        bot_instance.http_session = aiohttp.ClientSession(trace_configs=[metrics.http_trace_config()])
         logger.info("🚀 Global aiohttp.ClientSession (re)created.")
     return bot_instance.http_session
 
@@ -229,11 +231,12 @@ def _command_error_action(error: commands.CommandError | Exception) -> dict:
 
 
 # --- Task Management for Scheduler ---
-async def launch_operations_manager(bot_instance: commands.Bot):
+async def launch_operations_manager(bot_instance: commands.Bot, *, hold_until: dict[str, asyncio.Future] | None = None):
     """Start the long-running operations loop if it is not already active."""
     global operations_task
 
     await ensure_http_session(bot_instance)
+    memory_queue.start_worker(bot_instance)
 
     if operations_task and not operations_task.done():
         logger.info("Operations loop is already running.")
@@ -246,7 +249,7 @@ async def launch_operations_manager(bot_instance: commands.Bot):
             logger.error(f"Previous operations task ended with error: {e}", exc_info=True)
 
     logger.info("Launching operations loop task...")
-    operations_task = asyncio.create_task(run_operations_loop(bot_instance))
+    operations_task = asyncio.create_task(run_operations_loop(bot_instance, hold_until=hold_until))
 
     def _log_task_result(task: asyncio.Task) -> None:
         try:
@@ -270,6 +273,73 @@ async def eleven_am_daily_trigger():
     await launch_operations_manager(bot)
     await run_local_daily_routines(bot)
 
+# --- Startup Steps ---
+async def _load_cogs(bot_instance: commands.Bot) -> None:
+    cogs_path = "cogs"
+    if not (os.path.exists(cogs_path) and os.path.isdir(cogs_path)):
+        logger.warning(f"ℹ️ Cogs directory '{cogs_path}' not found. No cogs loaded.")
+        return
+    cog_load_ms: dict[str, float] = {}
+    for fname in sorted(os.listdir(cogs_path)):
+        if fname.endswith(".py") and fname != "__init__.py":
+            started = perf_counter()
+            try:
+                await bot_instance.load_extension(f"{cogs_path}.{fname[:-3]}")
+                cog_load_ms[fname[:-3]] = (perf_counter() - started) * 1000
+            except commands.ExtensionError as e:
+                logger.error(f"❌ Failed to load cog {cogs_path}.{fname[:-3]}: {e}", exc_info=True)
+    if not cog_load_ms:
+        logger.warning("ℹ️ No cogs were loaded from the 'cogs' directory.")
+        return
+    slowest = sorted(cog_load_ms.items(), key=lambda item: item[1], reverse=True)[:3]
+    logger.info(
+        "Loaded %d cogs in %.0f ms (slowest: %s).",
+        len(cog_load_ms),
+        sum(cog_load_ms.values()),
+        ", ".join(f"{name} {ms:.0f} ms" for name, ms in slowest),
+    )
+
+
+def _load_startup_state() -> None:
+    """Load persisted dedupe state the scheduler and the broadcast both read."""
+    match_state.migrate_ft_state_if_needed()
+    tennis_loop.ensure_tennis_state_loaded()
+    get_mode()
+
+
+def _warm_caches() -> None:
+    """Restore disk-backed provider caches before the first cycle looks them up."""
+    espn_cache.warm()
+    api_provider.team_search_cache.warm()
+
+
+def _startup_holds(startup: StartupPipeline, broadcast: bool) -> dict[str, asyncio.Future]:
+    """Every job that posts or polls football waits for the greeting; tennis only for its discovery."""
+    if not broadcast:
+        return {}
+    broadcast_done = startup.done("broadcast")
+    return {
+        "daily_memory": broadcast_done,
+        "provider_notice": broadcast_done,
+        "football": broadcast_done,
+        "tennis": startup.done("tennis_discovery"),
+    }
+
+
+async def _post_startup_broadcast(startup: StartupPipeline, now) -> None:
+    football_fixtures = startup.result("football_discovery")
+    tennis_matches = startup.result("tennis_discovery")
+    content = f"{greet_message()}\n\n{build_combined_matches_message(football_fixtures, tennis_matches, now_utc=now)}"
+    try:
+        sent = await post_new_general_message(bot, CHANNEL_ID, content=content)
+    except discord.Forbidden:
+        logger.error(f"❌ Missing permissions to send greeting message to channel ID: {CHANNEL_ID}.")
+        return
+    if sent is not None:
+        seed_already_announced_ft(football_fixtures)
+        seed_already_posted(football_fixtures)
+
+
 # --- Bot Events ---
 @bot.event
 async def on_ready():
@@ -289,42 +359,37 @@ async def on_ready():
         )
 
     channel = bot.get_channel(CHANNEL_ID)
-    if channel:
-        if not is_verbose():
-            logger.info(f"📢 Startup broadcast skipped (mode: {get_mode()}).")
-        else:
-            try:
-                football_fixtures, _, snapshot = await fetch_combined_matches_snapshot(bot.http_session)
-                content = f"{greet_message()}\n\n{snapshot}"
-                sent = await post_new_general_message(bot, CHANNEL_ID, content=content)
-                if sent is not None:
-                    seed_already_announced_ft(football_fixtures)
-                    seed_already_posted(football_fixtures)
-            except discord.Forbidden:
-                logger.error(f"❌ Missing permissions to send greeting message to channel ID: {CHANNEL_ID}.")
-            except Exception as e:
-                logger.error(f"❌ Failed to send greeting message: {e}", exc_info=True)
-    else:
+    if not channel:
         logger.error(f"❌ Could not find channel with ID: {CHANNEL_ID}. Greeting and updates will not be sent.")
-
-    # Load cogs
-    cogs_path = "cogs"
-    if os.path.exists(cogs_path) and os.path.isdir(cogs_path):
-        loaded_cogs_count = 0
-        for fname in os.listdir(cogs_path):
-            if fname.endswith(".py") and fname != "__init__.py":
-                try:
-                    await bot.load_extension(f"{cogs_path}.{fname[:-3]}")
-                    loaded_cogs_count += 1
-                except commands.ExtensionError as e:
-                    logger.error(f"❌ Failed to load cog {cogs_path}.{fname[:-3]}: {e}", exc_info=True)
-        if loaded_cogs_count == 0:
-            logger.warning("ℹ️ No cogs were loaded from the 'cogs' directory.")
-    else:
-        logger.warning(f"ℹ️ Cogs directory '{cogs_path}' not found. No cogs loaded.")
-
-    logger.info("Bot ready. Starting operations loop.")
-    asyncio.create_task(launch_operations_manager(bot))
+    elif not is_verbose():
+        logger.info(f"📢 Startup broadcast skipped (mode: {get_mode()}).")
+    broadcast = channel is not None and is_verbose()
+
+    # Steps start as soon as the steps they name have finished. The scheduler
+    # waits only for state and caches. Its football job is held until the
+    # broadcast has seeded FT/live dedupe state, daily memory and provider
+    # notices until the greeting is out, and its tennis job until the startup
+    # discovery has filled the tennis cache it would otherwise repeat.
+    startup = StartupPipeline()
+    startup.add("cogs", lambda: _load_cogs(bot))
+    startup.add("state", lambda: asyncio.to_thread(_load_startup_state))
+    startup.add("caches", lambda: asyncio.to_thread(_warm_caches))
+    if broadcast:
+        snapshot_time = utc_now()
+        startup.add("football_discovery", lambda: fetch_football_snapshot(bot.http_session, snapshot_time))
+        startup.add("tennis_discovery", lambda: fetch_tennis_snapshot(bot.http_session))
+        startup.add(
+            "broadcast",
+            lambda: _post_startup_broadcast(startup, snapshot_time),
+            after=("football_discovery", "tennis_discovery", "state"),
+        )
+    startup.add(
+        "scheduler",
+        lambda: launch_operations_manager(bot, hold_until=_startup_holds(startup, broadcast)),
+        after=("state", "caches"),
+    )
+    await startup.run()
+    logger.info("Bot ready.")
 
     if not midnight_trigger.is_running():
         try:
@@ -376,6 +441,22 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError):
         await post_new_message_to_context(ctx, content=action["user_message"])
 
 
+@bot.listen("on_message")
+async def track_channel_message(message: discord.Message):
+    """Keep the live-upsert message index current without reading channel history."""
+    message_tracker.record(message.channel.id, message.id)
+
+
+@bot.listen("on_raw_message_delete")
+async def track_channel_message_delete(payload: discord.RawMessageDeleteEvent):
+    message_tracker.forget(payload.channel_id, [payload.message_id])
+
+
+@bot.listen("on_raw_bulk_message_delete")
+async def track_channel_bulk_delete(payload: discord.RawBulkMessageDeleteEvent):
+    message_tracker.forget(payload.channel_id, payload.message_ids)
+
+
 @bot.event
 async def on_resumed():
     """Called when the bot successfully resumes a session after a disconnection."""
@@ -389,6 +470,8 @@ async def on_disconnect():
     This could be for a number of reasons. Reconnects are usually automatic.
     """
     logger.info("Discord gateway disconnected; discord.py will attempt automatic reconnect.")
+    # Create/delete events may be missed until we reconnect; re-read history on next use.
+    message_tracker.invalidate()
 
 async def main():
     try:
@@ -416,6 +499,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Configured here rather than at import so importing the module (tests, the
+    # import profiler) never opens bot_memory/logs/bot.log or its index.
+    _configure_logging()
     try:
         asyncio.run(main())
     except Exception as e:
@@ -35,6 +35,8 @@ from config import (
     build_league_slugs,
 )
 from modules import match_lifecycle, match_state
+from modules.response_cache import ResponseCache
+from modules.storage import BOT_MEMORY_DIR
 from utils import espn_client
 from utils import espn_tennis_client
 from utils import api_client
@@ -101,6 +103,13 @@ _tennis_stats = {
 }
 _tennis_last_success_ts: datetime | None = None
 _TRACKED_SLUGS: set[str] = set(LEAGUE_SLUG_MAP.values())
+TEAM_SEARCH_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+team_search_cache = ResponseCache(
+    "espn_team_search",
+    max_entries=256,
+    default_ttl_sec=TEAM_SEARCH_CACHE_TTL_SEC,
+    path=BOT_MEMORY_DIR / "espn_team_search_cache.json",
+)
 _enrich_attempted_date: str | None = None
 _enrich_tick_key: str | None = None
 _enrich_tick_count: int = 0
@@ -109,6 +118,8 @@ _api_fixture_id_cache: dict[str, int] = {}
 _api_fixture_id_cache_date: str | None = None
 _api_live_fixtures_cache: dict | None = None
 _api_live_fixtures_cache_ts: datetime | None = None
+# Shared by concurrent live-fixture workers so one /fixtures?live=all call serves them all.
+_api_live_fixtures_inflight: asyncio.Future | None = None
 _api_fixture_events_cache: dict[int, dict] = {}
 _api_fixture_id_negative_cache: dict[str, dict] = {}
 _api_fixture_id_prelink_negative_cache: dict[str, dict] = {}
@@ -176,6 +187,11 @@ def get_status() -> dict:
             "active_refresh": _espn_active_league_requests,
             "total": _espn_full_league_requests + _espn_active_league_requests,
         },
+        "enrichment_calls_today": {
+            "used": _enrich_api_call_count if _enrich_api_call_count_date == get_bot_local_date_string() else 0,
+            "budget": API_ENRICH_DAILY_CALL_BUDGET,
+        },
+        "team_search_cache": team_search_cache.stats(),
     }
 
 
@@ -907,12 +923,28 @@ async def fetch_fixture(session: aiohttp.ClientSession, fixture_id) -> dict | No
         return None
     return await api_client.fetch_fixture_by_id(session, fixture_id)
 
+async def _search_team_cached(session: aiohttp.ClientSession, team_name: str) -> tuple | None:
+    """Resolve a team name to (ESPN team ID, primary slug), caching only successful lookups."""
+    cache_key = f"{' '.join(team_name.lower().split())}|{','.join(sorted(_TRACKED_SLUGS))}"
+    cached = team_search_cache.get(cache_key)
+    if cached is not None:
+        return tuple(cached)
+    result = await espn_client.search_team_espn(session, team_name, _TRACKED_SLUGS)
+    if result:
+        team_search_cache.set(cache_key, list(result))
+        try:
+            team_search_cache.persist(background=True)
+        except Exception as e:
+            logger.warning("[APIProvider] Failed to persist team search cache: %s", type(e).__name__)
+    return result
+
+
 async def fetch_next_match_for_team(session: aiohttp.ClientSession, team_name: str) -> dict | None:
     """
     Find a team's next fixture using ESPN search and competition-aware slugs.
     Returns a normalized match dict or None when team/match is not found.
     """
-    result = await espn_client.search_team_espn(session, team_name, _TRACKED_SLUGS)
+    result = await _search_team_cached(session, team_name)
     if not result:
         return None
     espn_team_id, primary_slug = result
@@ -1573,7 +1605,7 @@ def _fresh_age_seconds(fetched_at: datetime | None, now_local: datetime) -> floa
 
 
 async def _get_api_football_live_payload(session: aiohttp.ClientSession) -> dict | None:
-    global _api_live_fixtures_cache, _api_live_fixtures_cache_ts
+    global _api_live_fixtures_inflight
     now_local = bot_now()
     age = _fresh_age_seconds(_api_live_fixtures_cache_ts, now_local)
     if (
@@ -1587,6 +1619,17 @@ async def _get_api_football_live_payload(session: aiohttp.ClientSession) -> dict
         )
         return _api_live_fixtures_cache
 
+    inflight = _api_live_fixtures_inflight
+    if inflight is None or inflight.done() or inflight.get_loop() is not asyncio.get_running_loop():
+        inflight = asyncio.ensure_future(_fetch_api_football_live_payload(session, now_local))
+        _api_live_fixtures_inflight = inflight
+    else:
+        logger.info("[Enrich] Joining in-flight API-Football /fixtures?live=all request.")
+    return await asyncio.shield(inflight)
+
+
+async def _fetch_api_football_live_payload(session: aiohttp.ClientSession, now_local: datetime) -> dict | None:
+    global _api_live_fixtures_cache, _api_live_fixtures_cache_ts
     if not _consume_enrichment_api_call("live fixture mapping payload"):
         return None
 
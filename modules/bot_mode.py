@@ -5,23 +5,28 @@
 # normal  — match updates only: live events, FT results, commands (no startup/morning broadcasts)
 # silent  — commands only: bot never posts automatically
 
-from modules.storage import load, save
+#
+# The mode is held in memory; a change saved by the dashboard process is picked
+# up within a second through WatchedJSONFile's stat check.
+
+from modules.storage import WatchedJSONFile
 
 _STATE_FILE = "state.json"
 _DEFAULTS = {"mode": "verbose"}
 _VALID_MODES = ("verbose", "normal", "silent")
+_state = WatchedJSONFile(_STATE_FILE, _DEFAULTS)
 
 
 def get_mode() -> str:
-    return load(_STATE_FILE, _DEFAULTS).get("mode", "verbose")
+    return _state.get().get("mode", "verbose")
 
 
 def set_mode(mode: str) -> None:
     if mode not in _VALID_MODES:
         raise ValueError(f"Invalid mode: {mode!r}. Must be one of {_VALID_MODES}.")
-    state = load(_STATE_FILE, _DEFAULTS)
+    state = _state.get()
     state["mode"] = mode
-    save(_STATE_FILE, state)
+    _state.save(state)
 
 
 def is_verbose() -> bool:
@@ -6,6 +6,7 @@ import json
 import hashlib
 import os
 import re
+import threading
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
@@ -35,6 +36,10 @@ _FIELD_DESCRIPTIONS = {
     "operations.live_update_edit_window_messages": (
         "Number of recent channel messages searched before a fresh live update is posted."
     ),
+    "operations.live_board_enabled": (
+        "Show all live football in one rolling live board message, edited once per cycle, instead of one message per match."
+    ),
+    "operations.live_board_include_tennis": "Also list live tennis matches on the live board when it is enabled.",
     "operations.tennis_pre_announce_hours": "Lead time in hours for the early tennis start-watch phase.",
     "operations.tennis_early_watch_poll_interval_sec": "Polling interval while a scheduled match is in early start watch.",
     "operations.tennis_imminent_window_minutes": "Minutes before scheduled start when faster imminent polling begins.",
@@ -44,6 +49,9 @@ _FIELD_DESCRIPTIONS = {
     "operations.tennis_idle_discovery_interval_sec": "Maximum interval between tennis discovery refreshes while idle.",
     "operations.tennis_post_start_watch_hours": "Hours after scheduled start to keep watching a delayed match.",
     "memory.roster_unsupported_retry_days": "Days before retrying an ESPN roster endpoint known to be unsupported.",
+    "memory.compress_football_memory": (
+        "Store football_memory.json gzip-compressed. Smaller and faster to sync on SD cards, but not human-readable."
+    ),
 }
 _FIELD_LABELS = {
     "operations.tennis_pre_announce_hours": "Early Start-Watch Lead Time (Hours)",
@@ -84,10 +92,32 @@ _FIELD_BOUNDS = {
 }
 
 
+# Parsed, validated results keyed by the source files' stat signatures, so the
+# dashboard re-reads and re-validates only after config.json, config.local.json
+# or .env actually change. Writes below also clear it explicitly.
+_cache_lock = threading.Lock()
+_effective_cache: dict[tuple, dict] = {}
+_snapshot_cache: dict = {}
+
+
 class ConfigurationError(RuntimeError):
     pass
 
 
+def _file_signature(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (os.path.abspath(path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def invalidate_configuration_cache() -> None:
+    with _cache_lock:
+        _effective_cache.clear()
+        _snapshot_cache.clear()
+
+
 def _read_json_object(path: Path, *, required: bool) -> dict:
     try:
         raw = json.loads(path.read_text(encoding="utf-8-sig"))
@@ -267,7 +297,7 @@ def validate_config(cfg: dict) -> dict:
         "tennis_full_discovery_interval_sec", "tennis_idle_discovery_interval_sec",
         "tennis_post_start_watch_hours",
         "tennis_finished_retention_hours", "live_update_edit_window_messages",
-        "api_provider",
+        "live_board_enabled", "live_board_include_tennis", "api_provider",
     }, "operations")
     timezone_name = _required(operations, "timezone", str, "operations")
     try:
@@ -295,6 +325,8 @@ def validate_config(cfg: dict) -> dict:
         "live_update_edit_window_messages": 1,
     }.items():
         _positive_int(operations, key, "operations", minimum)
+    _required(operations, "live_board_enabled", bool, "operations")
+    _required(operations, "live_board_include_tennis", bool, "operations")
     if not (
         operations["tennis_early_watch_poll_interval_sec"]
         >= operations["tennis_imminent_poll_interval_sec"]
@@ -339,10 +371,14 @@ def validate_config(cfg: dict) -> dict:
         raise ConfigurationError("log.export_default_lines cannot exceed log.export_max_lines.")
 
     memory = _required(cfg, "memory", dict, "")
-    _exact_keys(memory, {"stale_threshold_days", "espn_cache_ttl_sec", "roster_unsupported_retry_days"}, "memory")
+    _exact_keys(memory, {
+        "stale_threshold_days", "espn_cache_ttl_sec", "roster_unsupported_retry_days",
+        "compress_football_memory",
+    }, "memory")
     _positive_int(memory, "stale_threshold_days", "memory")
     _positive_int(memory, "espn_cache_ttl_sec", "memory")
     _positive_int(memory, "roster_unsupported_retry_days", "memory")
+    _required(memory, "compress_football_memory", bool, "memory")
 
     llm = _required(cfg, "llm", dict, "")
     _exact_keys(llm, {"base_url", "model", "system_prompt"}, "llm")
@@ -365,6 +401,20 @@ def load_effective_config(
     default_path: Path = DEFAULT_CONFIG_PATH,
     local_path: Path = LOCAL_CONFIG_PATH,
 ) -> dict:
+    key = (_file_signature(default_path), _file_signature(local_path), os.getenv("CHANNEL_ID", "").strip())
+    with _cache_lock:
+        cached = _effective_cache.get(key)
+    if cached is not None and key[0] is not None:
+        return deepcopy(cached)
+    effective = _load_effective_config(default_path, local_path)
+    with _cache_lock:
+        # Only the newest signature pair matters; older entries are stale.
+        _effective_cache.clear()
+        _effective_cache[key] = deepcopy(effective)
+    return effective
+
+
+def _load_effective_config(default_path: Path, local_path: Path) -> dict:
     base = _read_json_object(default_path, required=True)
     local = _read_json_object(local_path, required=False)
     _assert_known_keys(local, base)
@@ -392,7 +442,10 @@ def write_local_overrides(
         raise ConfigurationError("Local configuration overrides must be an object.")
     _assert_known_keys(overrides, base)
     validate_config(_deep_merge(base, overrides))
-    save_json_path(local_path, overrides, ensure_ascii=False)
+    try:
+        save_json_path(local_path, overrides, ensure_ascii=False)
+    finally:
+        invalidate_configuration_cache()
 
 
 def save_complete_config(
@@ -508,11 +561,39 @@ def replace_secret(name: str, value: str, env_path: Path = ENV_PATH) -> None:
             updated.append(line)
     if not replaced:
         updated.append(replacement)
-    save_text_path(env_path, "\n".join(updated) + "\n", mode=0o600)
+    try:
+        save_text_path(env_path, "\n".join(updated) + "\n", mode=0o600)
+    finally:
+        invalidate_configuration_cache()
 
 
 def configuration_snapshot() -> dict:
     """Return the effective non-secret config plus masked secret status."""
+    return cached_configuration_snapshot()[0]
+
+
+def cached_configuration_snapshot() -> tuple[dict, str]:
+    """Return (snapshot, etag); both are reused until a source file or secret changes."""
+    key = (
+        _file_signature(DEFAULT_CONFIG_PATH),
+        _file_signature(LOCAL_CONFIG_PATH),
+        _file_signature(ENV_PATH),
+        tuple(os.getenv(name, "") for name in ("CHANNEL_ID", *SECRET_NAMES)),
+    )
+    with _cache_lock:
+        if _snapshot_cache.get("key") == key:
+            return deepcopy(_snapshot_cache["snapshot"]), _snapshot_cache["etag"]
+    snapshot = _build_configuration_snapshot()
+    secrets_digest = hashlib.sha256(
+        json.dumps(snapshot["secrets"], sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+    etag = f'"{snapshot["revision"][:32]}-{secrets_digest}"'
+    with _cache_lock:
+        _snapshot_cache.update(key=key, snapshot=deepcopy(snapshot), etag=etag)
+    return snapshot, etag
+
+
+def _build_configuration_snapshot() -> dict:
     defaults = _read_json_object(DEFAULT_CONFIG_PATH, required=True)
     local = _read_json_object(LOCAL_CONFIG_PATH, required=False)
     effective = load_effective_config()
@@ -8,10 +8,12 @@ import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+from modules.log_reader import iter_offset_lines_reversed
 from modules.storage import BOT_MEMORY_DIR
 from utils.redaction import redact_text
 
 AUDIT_PATH = BOT_MEMORY_DIR / "logs" / "dashboard_audit.jsonl"
+PAGE_LIMIT = 1000
 
 
 class AuditLog:
@@ -20,9 +22,17 @@ class AuditLog:
         self.max_bytes = max_bytes
         self.backups = backups
         self._lock = threading.Lock()
+        # Bytes in the current file, tracked from the first write on instead of
+        # a stat per record. This process is the only writer.
+        self._size: int | None = None
 
     def _rotate(self) -> None:
-        if not self.path.exists() or self.path.stat().st_size < self.max_bytes:
+        if self._size is None:
+            try:
+                self._size = self.path.stat().st_size
+            except FileNotFoundError:
+                self._size = 0
+        if self._size < self.max_bytes:
             return
         oldest = self.path.with_name(f"{self.path.name}.{self.backups}")
         oldest.unlink(missing_ok=True)
@@ -31,7 +41,9 @@ class AuditLog:
             target = self.path.with_name(f"{self.path.name}.{number + 1}")
             if source.exists():
                 os.replace(source, target)
-        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        if self.path.exists():
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        self._size = 0
 
     def record(self, *, username: str, ip: str, action: str, paths: list[str] | None = None, result: str = "success") -> None:
         entry = {
@@ -42,24 +54,72 @@ class AuditLog:
             "paths": [redact_text(path)[:160] for path in (paths or [])][:100],
             "result": redact_text(result)[:160],
         }
-        payload = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        payload = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
         with self._lock:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             self._rotate()
-            with self.path.open("a", encoding="utf-8") as handle:
+            with self.path.open("ab") as handle:
                 handle.write(payload)
                 handle.flush()
                 os.fsync(handle.fileno())
+            self._size += len(payload)
 
     def recent(self, limit: int = 200) -> list[dict]:
-        limit = max(1, min(int(limit), 1000))
-        if not self.path.exists():
-            return []
-        lines = self.path.read_text(encoding="utf-8", errors="replace").splitlines()[-limit:]
-        entries = []
-        for line in reversed(lines):
+        return self.page(limit)["entries"]
+
+    def page(self, limit: int = 200, cursor: str | None = None) -> dict:
+        """
+        Return up to `limit` entries, newest first, and the cursor for the next
+        older page (None once history is exhausted). Reads seek back from the end
+        of the current file into the rotated backups, so a page costs the same
+        however much history exists.
+        """
+        limit = max(1, min(int(limit), PAGE_LIMIT))
+        entries: list[dict] = []
+        last = None
+        for position, line in self._iter_lines_reversed(_parse_cursor(cursor)):
             try:
-                entries.append(json.loads(line))
+                entry = json.loads(line)
             except json.JSONDecodeError:
                 continue
-        return entries
+            if len(entries) == limit:
+                return {"entries": entries, "next_cursor": f"{last[0]}:{last[1]}"}
+            entries.append(entry)
+            last = position
+        return {"entries": entries, "next_cursor": None}
+
+    def _paths(self) -> list[Path]:
+        """Current file first, then backups from newest to oldest."""
+        return [self.path] + [self.path.with_name(f"{self.path.name}.{number}") for number in range(1, self.backups + 1)]
+
+    def _iter_lines_reversed(self, cursor: tuple[int, int] | None):
+        # Cursors name a file by inode, which survives the renames in _rotate,
+        # so paging keeps its place while new entries arrive.
+        resumed = cursor is None
+        for path in self._paths():
+            try:
+                with path.open("rb") as handle:
+                    stat = os.fstat(handle.fileno())
+                    if resumed:
+                        end = stat.st_size
+                    elif stat.st_ino == cursor[0]:
+                        resumed, end = True, min(cursor[1], stat.st_size)
+                    else:
+                        continue
+                    for offset, line in iter_offset_lines_reversed(handle, end):
+                        if line:
+                            yield (stat.st_ino, offset), line
+            except FileNotFoundError:
+                continue
+
+
+def _parse_cursor(cursor: str | None) -> tuple[int, int] | None:
+    if not cursor:
+        return None
+    try:
+        inode, offset = (int(part) for part in str(cursor).split(":"))
+    except ValueError:
+        raise ValueError("Audit history cursor is invalid.") from None
+    if inode < 0 or offset < 0:
+        raise ValueError("Audit history cursor is invalid.")
+    return inode, offset
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -10,9 +12,12 @@ import re
 import secrets
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
+from modules import metrics
 from modules.storage import BOT_MEMORY_DIR, save_text_path
 
 USERS_PATH = BOT_MEMORY_DIR / "dashboard_users.json"
@@ -20,12 +25,40 @@ USERNAME_RE = re.compile(r"^[A-Za-z0-9._-]{3,32}$")
 SCRYPT_N = 2**14
 SCRYPT_R = 8
 SCRYPT_P = 1
+# scrypt runs on this many threads so a login burst never blocks the event loop;
+# beyond PASSWORD_QUEUE_LIMIT waiting calls, new ones are refused.
+PASSWORD_WORKERS = 2
+PASSWORD_QUEUE_LIMIT = 16
+
+_password_pool = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="dashboard-password")
+_password_pending = 0
 
 
 class AuthenticationError(ValueError):
     pass
 
 
+class PasswordQueueFull(AuthenticationError):
+    pass
+
+
+async def run_password_task(operation: str, fn: Callable[..., Any], *args) -> Any:
+    """Run a scrypt-bound UserStore call on the bounded password pool."""
+    global _password_pending
+    if _password_pending >= PASSWORD_WORKERS + PASSWORD_QUEUE_LIMIT:
+        metrics.dashboard_password_rejected.inc(operation=operation)
+        raise PasswordQueueFull("Too many password checks are in progress. Try again in a moment.")
+    _password_pending += 1
+    metrics.dashboard_password_pending.set(_password_pending)
+    started = time.monotonic()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_pool, functools.partial(fn, *args))
+    finally:
+        _password_pending -= 1
+        metrics.dashboard_password_pending.set(_password_pending)
+        metrics.dashboard_password_seconds.observe(time.monotonic() - started, operation=operation)
+
+
 def _hash_password(password: str, salt: bytes | None = None) -> dict:
     salt = salt or secrets.token_bytes(16)
     digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
@@ -99,9 +132,13 @@ class UserStore:
     def authenticate(self, username: str, password: str) -> dict | None:
         key = str(username or "").lower()
         with self._lock:
-            for user in self._read()["users"]:
-                if user["username"].lower() == key and user.get("active", True):
-                    return self._public(user) if _verify_password(password, user["password"]) else None
+            user = next(
+                (u for u in self._read()["users"] if u["username"].lower() == key and u.get("active", True)),
+                None,
+            )
+        # Verify outside the lock so concurrent logins hash in parallel.
+        if user is not None:
+            return self._public(user) if _verify_password(password, user["password"]) else None
         # Keep missing-user timing closer to normal verification.
         _verify_password(password or "", _hash_password("invalid"))
         return None
@@ -112,13 +149,14 @@ class UserStore:
             raise AuthenticationError("Username must be 3-32 letters, numbers, dots, underscores, or hyphens.")
         if not isinstance(password, str) or len(password) < 10:
             raise AuthenticationError("Password must contain at least 10 characters.")
+        hashed = _hash_password(password)
         with self._lock:
             data = self._read()
             if any(user["username"].lower() == username.lower() for user in data["users"]):
                 raise AuthenticationError("Username already exists.")
             user = {
                 "username": username,
-                "password": _hash_password(password),
+                "password": hashed,
                 "active": True,
                 "bootstrap_password": False,
                 "created_at": int(time.time()),
@@ -130,11 +168,12 @@ class UserStore:
     def change_password(self, username: str, password: str) -> dict:
         if not isinstance(password, str) or len(password) < 10:
             raise AuthenticationError("Password must contain at least 10 characters.")
+        hashed = _hash_password(password)
         with self._lock:
             data = self._read()
             for user in data["users"]:
                 if user["username"].lower() == username.lower():
-                    user["password"] = _hash_password(password)
+                    user["password"] = hashed
                     user["bootstrap_password"] = False
                     self._write(data)
                     return self._public(user)
@@ -189,7 +228,8 @@ class SessionStore:
             self._sessions[token] = session
         return token, session
 
-    def get(self, token: str | None, now: float | None = None) -> Session | None:
+    def get(self, token: str | None, now: float | None = None, *, touch: bool = True) -> Session | None:
+        """Return a live session; touch=False checks it without counting as activity."""
         if not token:
             return None
         now = now or time.time()
@@ -200,7 +240,8 @@ class SessionStore:
             if now - session.last_seen > self.IDLE_SECONDS or now - session.created > self.ABSOLUTE_SECONDS:
                 self._sessions.pop(token, None)
                 return None
-            session.last_seen = now
+            if touch:
+                session.last_seen = now
             return session
 
     def delete(self, token: str | None) -> None:
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from modules.storage import BOT_MEMORY_DIR, save_json_path
+from modules.storage import BOT_MEMORY_DIR, WatchedJSONFile, submit_json_path
 
 HEALTH_PATH = BOT_MEMORY_DIR / "dashboard_health.json"
+METRICS_PATH = BOT_MEMORY_DIR / "bot_metrics.json"
+# The dashboard re-reads the snapshots only after the bot replaces them.
+_health_file = WatchedJSONFile(HEALTH_PATH.name, {})
+_metrics_file = WatchedJSONFile(METRICS_PATH.name, {})
 
 
 def _json_safe(value: Any) -> Any:
@@ -31,22 +36,40 @@ def write_bot_health(
     football_scheduler: dict,
     tennis_scheduler: dict,
     mode: str,
+    jobs: list[dict] | None = None,
+    startup: dict | None = None,
 ) -> None:
-    save_json_path(HEALTH_PATH, _json_safe({
+    # Queued rather than awaited: a newer snapshot supersedes one still waiting on disk.
+    submit_json_path(HEALTH_PATH, _json_safe({
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "commit": commit,
         "provider": provider,
         "tennis_provider": tennis_provider,
         "football_scheduler": football_scheduler,
         "tennis_scheduler": tennis_scheduler,
+        "jobs": jobs or [],
         "mode": mode,
+        "startup": startup,
     }), ensure_ascii=False)
 
 
-def read_bot_health(path: Path = HEALTH_PATH, stale_after_seconds: int = 120) -> dict:
+def write_bot_metrics(snapshot: dict) -> None:
+    submit_json_path(METRICS_PATH, {"timestamp": datetime.now(timezone.utc).isoformat(), "metrics": snapshot}, ensure_ascii=False)
+
+
+def read_bot_metrics() -> dict:
+    """The bot's last published registry snapshot and when it was taken (None before the first one)."""
+    value = _metrics_file.get()
+    metrics = value.get("metrics")
+    return {"timestamp": value.get("timestamp"), "metrics": metrics if isinstance(metrics, dict) else {}}
+
+
+def read_bot_health(path: Path | None = None, stale_after_seconds: int = 120) -> dict:
     try:
-        import json
-        value = json.loads(path.read_text(encoding="utf-8"))
+        if path is None:
+            value = _health_file.get()
+        else:
+            value = json.loads(path.read_text(encoding="utf-8"))
         stamp = datetime.fromisoformat(value["timestamp"].replace("Z", "+00:00"))
         age = max(0, (datetime.now(timezone.utc) - stamp.astimezone(timezone.utc)).total_seconds())
         value["age_seconds"] = round(age)
@@ -5,24 +5,59 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from modules.log_index import search_logs
+from modules.log_reader import iter_lines_reversed
 from utils.redaction import redact_text
 
 LEVEL_RE = re.compile(r"\[(WARNING|ERROR|CRITICAL)\s*\]")
 MODULE_RE = re.compile(r"^[A-Za-z0-9_.-]{2,80}$")
 
 
-def read_logs(path: Path, *, mode: str = "recent", module: str | None = None, limit: int = 300) -> dict:
+def _matches(line: str, mode: str, module: str | None) -> bool:
+    if mode == "errors":
+        return bool(LEVEL_RE.search(line))
+    if mode == "module":
+        return f"[{module}" in line
+    return True
+
+
+def read_logs(
+    path: Path,
+    *,
+    mode: str = "recent",
+    module: str | None = None,
+    limit: int = 300,
+    start: str | None = None,
+    end: str | None = None,
+) -> dict:
     limit = max(1, min(int(limit), 1000))
     if mode not in {"recent", "errors", "module"}:
         raise ValueError("Unsupported log mode.")
     if mode == "module" and (not module or not MODULE_RE.fullmatch(module)):
         raise ValueError("Invalid module filter.")
+    if start or end:
+        if not (start and end):
+            raise ValueError("A time range needs both a start and an end.")
+        result = search_logs(
+            path,
+            start=start,
+            end=end,
+            min_level="WARNING" if mode == "errors" else None,
+            module=module if mode == "module" else None,
+            limit=limit,
+        )
+        return {
+            "lines": [redact_text(line) for line in result["lines"]],
+            "missing": not path.exists(),
+            "truncated": result["truncated"],
+        }
+    lines: list[str] = []
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        for line in iter_lines_reversed(path):
+            if _matches(line, mode, module):
+                lines.append(line)
+                if len(lines) >= limit:
+                    break
     except FileNotFoundError:
         return {"lines": [], "missing": True}
-    if mode == "errors":
-        lines = [line for line in lines if LEVEL_RE.search(line)]
-    elif mode == "module":
-        lines = [line for line in lines if f"[{module}" in line]
-    return {"lines": [redact_text(line) for line in lines[-limit:]], "missing": False}
+    return {"lines": [redact_text(line) for line in reversed(lines)], "missing": False}
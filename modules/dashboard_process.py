@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import os
 import shutil
+import time
 from pathlib import Path
 
 from dotenv import dotenv_values
@@ -13,6 +14,8 @@ from utils.redaction import redact_text
 
 REPO_DIR = Path(__file__).resolve().parent.parent
 OUTPUT_LIMIT = 6000
+# Service state is shared by every open dashboard for this long.
+STATUS_CACHE_SECONDS = 5
 
 
 class ProcessController:
@@ -22,6 +25,8 @@ class ProcessController:
         self.dashboard_service = str(values.get("DASHBOARD_SERVICE_NAME") or "marco_van_botten_dashboard")
         self.update_service = str(values.get("UPDATE_SERVICE_NAME") or "marco_van_botten_update")
         self.supported = os.name != "nt" and shutil.which("systemctl") is not None and shutil.which("sudo") is not None
+        self._status: tuple[float, dict] | None = None
+        self._status_lock = asyncio.Lock()
 
     async def _run(self, *args: str, timeout: int = 30) -> dict:
         if not self.supported:
@@ -41,13 +46,19 @@ class ProcessController:
     async def status(self) -> dict:
         if not self.supported:
             return {"supported": False, "bot": "unsupported", "dashboard": "running"}
-        result = {}
-        for label, service in (("bot", self.bot_service), ("dashboard", self.dashboard_service)):
-            check = await self._run("sudo", "systemctl", "is-active", service)
-            result[label] = "active" if check["ok"] else "inactive"
-        return {"supported": True, **result}
+        # Concurrent callers wait for one systemctl round instead of starting their own.
+        async with self._status_lock:
+            if self._status is not None and time.monotonic() - self._status[0] < STATUS_CACHE_SECONDS:
+                return dict(self._status[1])
+            result = {}
+            for label, service in (("bot", self.bot_service), ("dashboard", self.dashboard_service)):
+                check = await self._run("sudo", "systemctl", "is-active", service)
+                result[label] = "active" if check["ok"] else "inactive"
+            self._status = (time.monotonic(), {"supported": True, **result})
+            return dict(self._status[1])
 
     async def restart_bot(self) -> dict:
+        self._status = None
         return await self._run("sudo", "systemctl", "restart", self.bot_service)
 
     async def start_update(self) -> dict:
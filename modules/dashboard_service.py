@@ -2,32 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import json
 import logging
+import time
 from copy import deepcopy
+from datetime import datetime, timezone
 from pathlib import Path
 
 from aiohttp import web
 
 from modules.configuration import (
     ConfigurationError,
-    configuration_snapshot,
+    cached_configuration_snapshot,
     load_effective_config,
     replace_secret,
     save_complete_config,
     validate_config,
 )
 from modules.dashboard_audit import AuditLog
-from modules.dashboard_auth import AuthenticationError, LoginLimiter, SessionStore, UserStore
-from modules.dashboard_health import read_bot_health
+from modules.dashboard_auth import (
+    AuthenticationError,
+    LoginLimiter,
+    PasswordQueueFull,
+    SessionStore,
+    UserStore,
+    run_password_task,
+)
+from modules import metrics
+from modules.dashboard_health import read_bot_health, read_bot_metrics
 from modules.dashboard_logs import read_logs
 from modules.dashboard_process import ProcessController
+from modules.dashboard_stream import StatusBroadcaster
 from modules.runtime_settings import get_runtime_settings, set_morning_schedule, set_runtime_mode
 
 logger = logging.getLogger(__name__)
 ROOT = Path(__file__).resolve().parent.parent
 STATIC_DIR = ROOT / "dashboard_static"
 SESSION_COOKIE = "mvb_dashboard_session"
+# Comment line sent on quiet status streams so proxies keep the connection open.
+STREAM_KEEPALIVE_SECONDS = 15
 
 
 def _client_ip(request: web.Request) -> str:
@@ -109,10 +124,14 @@ def _normalize_dashboard_config(config: dict) -> dict:
 
 
 def _dashboard_snapshot() -> dict:
-    snapshot = configuration_snapshot()
+    return _tagged_dashboard_snapshot()[0]
+
+
+def _tagged_dashboard_snapshot() -> tuple[dict, str]:
+    snapshot, etag = cached_configuration_snapshot()
     for key in ("config", "defaults", "overrides"):
         snapshot[key] = _dashboard_safe_config(snapshot[key])
-    return snapshot
+    return snapshot, etag
 
 
 def _json_error(message: str, status: int = 400, **extra) -> web.Response:
@@ -125,6 +144,9 @@ async def error_middleware(request: web.Request, handler):
         return await handler(request)
     except web.HTTPException:
         raise
+    except PasswordQueueFull as exc:
+        # Before AuthenticationError, its base: a full queue is load, not bad input.
+        return _json_error(str(exc), 429, retry_after=1)
     except (ConfigurationError, AuthenticationError, ValueError) as exc:
         return _json_error(str(exc))
     except json.JSONDecodeError:
@@ -134,14 +156,50 @@ async def error_middleware(request: web.Request, handler):
         return _json_error("The dashboard could not complete this request.", 500)
 
 
-@web.middleware
-async def security_headers_middleware(request: web.Request, handler):
-    response = await handler(request)
+def _apply_security_headers(request: web.Request, response: web.StreamResponse) -> None:
     response.headers["X-Content-Type-Options"] = "nosniff"
     response.headers["X-Frame-Options"] = "DENY"
     response.headers["Referrer-Policy"] = "no-referrer"
     response.headers["Content-Security-Policy"] = "default-src 'self'; style-src 'self'; script-src 'self'; img-src 'self' data:; connect-src 'self'"
-    response.headers["Cache-Control"] = "no-store" if request.path.startswith("/api/") else "no-cache"
+    if not request.path.startswith("/api/"):
+        response.headers["Cache-Control"] = "no-cache"
+    elif "ETag" in response.headers:
+        # Let the browser keep the body and revalidate it with If-None-Match.
+        response.headers["Cache-Control"] = "private, no-cache"
+    else:
+        response.headers["Cache-Control"] = "no-store"
+
+
+@web.middleware
+async def metrics_middleware(request: web.Request, handler):
+    started = time.monotonic()
+    response = None
+    try:
+        response = await handler(request)
+        return response
+    finally:
+        # Long-lived streams would only skew the request-time histogram.
+        if not (response is not None and response.prepared):
+            resource = request.match_info.route.resource
+            route = resource.canonical if resource is not None else "unmatched"
+            metrics.dashboard_request_seconds.observe(time.monotonic() - started, route=route)
+
+
+def _loopback_scrape(request: web.Request) -> bool:
+    """A direct request from this host; proxied requests must log in instead."""
+    if "X-Forwarded-For" in request.headers or "Forwarded" in request.headers:
+        return False
+    try:
+        return ipaddress.ip_address(_client_ip(request)).is_loopback
+    except ValueError:
+        return False
+
+
+@web.middleware
+async def security_headers_middleware(request: web.Request, handler):
+    response = await handler(request)
+    if not response.prepared:
+        _apply_security_headers(request, response)
     return response
 
 
@@ -158,9 +216,19 @@ def create_dashboard_app(
     limiter = limiter or LoginLimiter()
     audit = audit or AuditLog()
     controller = controller or ProcessController()
-    app = web.Application(middlewares=[security_headers_middleware, error_middleware], client_max_size=2 * 1024 * 1024)
+    app = web.Application(middlewares=[metrics_middleware, security_headers_middleware, error_middleware], client_max_size=2 * 1024 * 1024)
     routes = web.RouteTableDef()
 
+    async def current_status() -> dict:
+        return {"health": read_bot_health(), "services": await controller.status()}
+
+    status_feed = StatusBroadcaster(current_status)
+
+    async def close_status_feed(_app):
+        await status_feed.close()
+
+    app.on_shutdown.append(close_status_feed)
+
     def session_for(request: web.Request):
         return sessions.get(request.cookies.get(SESSION_COOKIE))
 
@@ -206,7 +274,7 @@ def create_dashboard_app(
         if retry:
             audit.record(username=username or "unknown", ip=ip, action="login", result="rate_limited")
             return _json_error("Too many failed attempts. Try again later.", 429, retry_after=retry)
-        user = users.authenticate(username, password)
+        user = await run_password_task("login", users.authenticate, username, password)
         if user is None:
             limiter.fail(username, ip)
             audit.record(username=username or "unknown", ip=ip, action="login", result="denied")
@@ -230,7 +298,10 @@ def create_dashboard_app(
     @routes.get("/api/config")
     async def get_config(request):
         require_session(request)
-        return web.json_response(_dashboard_snapshot())
+        snapshot, etag = _tagged_dashboard_snapshot()
+        if etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(snapshot, headers={"ETag": etag})
 
     @routes.post("/api/config/validate")
     async def validate_draft(request):
@@ -313,19 +384,57 @@ def create_dashboard_app(
     @routes.get("/api/status")
     async def status(request):
         require_session(request)
-        return web.json_response({"health": read_bot_health(), "services": await controller.status()})
+        return web.json_response(await current_status())
+
+    @routes.get("/metrics")
+    async def metrics_export(request):
+        if not _loopback_scrape(request):
+            require_session(request)
+        bot = read_bot_metrics()
+        if bot["timestamp"]:
+            published = datetime.fromisoformat(bot["timestamp"])
+            metrics.bot_metrics_age_seconds.set(round((datetime.now(timezone.utc) - published).total_seconds(), 3))
+        text = metrics.render_prometheus([({"process": "bot"}, bot["metrics"]), ({"process": "dashboard"}, metrics.registry.snapshot())])
+        return web.Response(body=text.encode("utf-8"), headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+    @routes.get("/api/status/stream")
+    async def status_stream(request):
+        require_session(request)
+        token = request.cookies.get(SESSION_COOKIE)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "X-Accel-Buffering": "no"})
+        _apply_security_headers(request, response)
+        await response.prepare(request)
+        queue = status_feed.subscribe()
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    event, data = "keepalive", None
+                # Streaming is not activity: an idle session still expires.
+                if event == "close" or sessions.get(token, touch=False) is None:
+                    break
+                if event == "keepalive":
+                    await response.write(b": keepalive\n\n")
+                else:
+                    await response.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+        except ConnectionResetError:
+            pass
+        finally:
+            status_feed.unsubscribe(queue)
+        return response
 
     @routes.get("/api/logs")
     async def logs(request):
         require_session(request)
         config = load_effective_config()
-        result = read_logs(Path(config["log"]["file_path"]), mode=request.query.get("mode", "recent"), module=request.query.get("module"), limit=int(request.query.get("limit", "300")))
+        result = read_logs(Path(config["log"]["file_path"]), mode=request.query.get("mode", "recent"), module=request.query.get("module"), limit=int(request.query.get("limit", "300")), start=request.query.get("from"), end=request.query.get("to"))
         return web.json_response(result)
 
     @routes.get("/api/audit")
     async def audit_history(request):
         require_session(request)
-        return web.json_response({"entries": audit.recent(int(request.query.get("limit", "200")))})
+        return web.json_response(audit.page(int(request.query.get("limit", "200")), request.query.get("cursor")))
 
     @routes.get("/api/admins")
     async def admins_get(request):
@@ -336,7 +445,7 @@ def create_dashboard_app(
     async def admins_add(request):
         session = require_session(request, csrf=True)
         body = await request.json()
-        user = users.add_user(body.get("username"), body.get("password"))
+        user = await run_password_task("add_user", users.add_user, body.get("username"), body.get("password"))
         record(request, session, "administrator.add", [f"dashboard_users.{user['username']}"])
         return web.json_response({"ok": True, "user": user}, status=201)
 
@@ -346,9 +455,9 @@ def create_dashboard_app(
         body = await request.json()
         username = request.match_info["username"]
         if username.lower() == session.username.lower() and body.get("current_password") is not None:
-            if users.authenticate(username, str(body.get("current_password"))) is None:
+            if await run_password_task("verify_current", users.authenticate, username, str(body.get("current_password"))) is None:
                 raise AuthenticationError("Current password is incorrect.")
-        user = users.change_password(username, body.get("password"))
+        user = await run_password_task("change_password", users.change_password, username, body.get("password"))
         sessions.delete_user(username)
         record(request, session, "administrator.password", [f"dashboard_users.{username}.password"])
         return web.json_response({"ok": True, "user": user, "reauthenticate": username.lower() == session.username.lower()})
@@ -0,0 +1,98 @@
+"""Shared dashboard status feed pushed to browsers as server-sent events."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 2.0
+QUEUE_LIMIT = 16
+# Fields that change on every read without the bot doing anything.
+_VOLATILE_FIELDS = {"age_seconds"}
+
+
+def status_delta(before: dict | None, after: dict) -> dict:
+    """Top-level changes per section ({"health": {...}, "services": {...}}); removed keys map to None."""
+    delta = {}
+    for section, current in after.items():
+        previous = (before or {}).get(section) or {}
+        changed = {key: value for key, value in current.items() if previous.get(key, object()) != value}
+        changed.update({key: None for key in previous if key not in current})
+        if changed:
+            delta[section] = changed
+    return delta
+
+
+class StatusBroadcaster:
+    """One poller per dashboard process, however many browsers are connected.
+
+    Reads status every POLL_SECONDS while at least one subscriber is connected
+    and queues only what changed. A subscriber that falls QUEUE_LIMIT events
+    behind is resynchronized with a full snapshot.
+    """
+
+    def __init__(self, read_status: Callable[[], Awaitable[dict]], *, poll_seconds: float = POLL_SECONDS):
+        self._read_status = read_status
+        self.poll_seconds = poll_seconds
+        self._subscribers: set[asyncio.Queue] = set()
+        self._last: dict | None = None
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_LIMIT)
+        self._subscribers.add(queue)
+        if self._last is not None:
+            queue.put_nowait(("snapshot", self._last))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="dashboard-status-stream")
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    async def close(self) -> None:
+        """End every open stream and stop polling (dashboard shutdown)."""
+        for queue in list(self._subscribers):
+            self._offer(queue, ("close", None))
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _offer(self, queue: asyncio.Queue, event: tuple) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(event if event[0] == "close" else ("snapshot", self._last))
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                status = await self._read_status()
+                status["health"] = {
+                    key: value for key, value in status.get("health", {}).items() if key not in _VOLATILE_FIELDS
+                }
+                if self._last is None:
+                    self._last = status
+                    for queue in list(self._subscribers):
+                        self._offer(queue, ("snapshot", status))
+                else:
+                    delta = status_delta(self._last, status)
+                    self._last = status
+                    if delta:
+                        for queue in list(self._subscribers):
+                            self._offer(queue, ("delta", delta))
+            except Exception:
+                logger.exception("Dashboard status stream poll failed.")
+            await asyncio.sleep(self.poll_seconds)
+        # Nobody is watching; the next subscriber starts from a fresh snapshot.
+        self._last = None
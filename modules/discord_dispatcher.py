@@ -0,0 +1,227 @@
+# modules/discord_dispatcher.py
+# Outbound lanes for Discord writes, one per channel. Within a channel requests run
+# one at a time in priority order (FT posts and command replies before live edits),
+# are paced below Discord's message limits, and queued edits of one message
+# collapse to the newest content. Channels drain independently, so a throttled or
+# slow channel never holds up another, and every request has a time limit.
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from modules import metrics
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_URGENT = 0   # FT announcements and command replies
+PRIORITY_NORMAL = 1   # edits of posted announcements
+PRIORITY_LIVE = 2     # live scoreboard upserts
+
+_PRIORITY_NAMES = {PRIORITY_URGENT: "urgent", PRIORITY_NORMAL: "normal", PRIORITY_LIVE: "live"}
+# Discord allows roughly 5 messages per 5 seconds per channel: at most
+# _CHANNEL_LIMIT calls start in any sliding _CHANNEL_WINDOW_SEC window.
+_CHANNEL_LIMIT = 5
+_CHANNEL_WINDOW_SEC = 5.0
+# Long enough for discord.py to sit out a short 429 back-off, short enough that a
+# stalled call cannot park a channel's FT posts behind it indefinitely.
+_OPERATION_TIMEOUT_SEC = 30.0
+_SLOW_SEND_LOG_SEC = 10.0
+
+
+class OutboundDispatcher:
+    """Per-channel priority queues that pace Discord requests and bound their runtime."""
+
+    def __init__(
+        self,
+        *,
+        limit: int = _CHANNEL_LIMIT,
+        window_sec: float = _CHANNEL_WINDOW_SEC,
+        timeout_sec: float = _OPERATION_TIMEOUT_SEC,
+    ):
+        self.limit = limit
+        self.window_sec = window_sec
+        self.timeout_sec = timeout_sec
+        # channel_id -> {"heap": [(priority, seq, request)], "task": Task | None, "wakeup": Future | None}
+        self._lanes: dict[Any, dict] = {}
+        self._pending_by_key: dict[Any, dict] = {}
+        self._seq = itertools.count()
+        self._sent_at: dict[Any, deque[float]] = {}
+        self._stats = {
+            "sent": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "coalesced": 0,
+            "max_depth": 0,
+            "last_latency_sec": None,
+            "max_latency_sec": 0.0,
+            "total_latency_sec": 0.0,
+        }
+
+    async def run(
+        self,
+        priority: int,
+        operation: Callable[[], Awaitable[Any]],
+        *,
+        channel_id: Any = None,
+        coalesce_key: Any = None,
+        calls: int = 1,
+    ) -> Any:
+        """Queue operation and return its result once the dispatcher has run it.
+
+        calls is the number of Discord requests the operation makes (a history
+        read plus an edit is two); that many pacing slots are claimed before it
+        starts. With coalesce_key, a still-queued request for the same key is
+        replaced by this operation and both callers receive its result.
+        """
+        loop = asyncio.get_running_loop()
+        queued = self._pending_by_key.get(coalesce_key) if coalesce_key is not None else None
+        if queued is not None and queued["future"].get_loop() is loop:
+            queued["operation"] = operation
+            queued["calls"] = calls
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(queued["future"])
+
+        request = {
+            "priority": priority,
+            "operation": operation,
+            "channel_id": channel_id,
+            "coalesce_key": coalesce_key,
+            "calls": calls,
+            "enqueued_at": time.monotonic(),
+            "future": loop.create_future(),
+        }
+        lane = self._lanes.setdefault(channel_id, {"heap": [], "task": None, "wakeup": None})
+        heapq.heappush(lane["heap"], (priority, next(self._seq), request))
+        if coalesce_key is not None:
+            self._pending_by_key[coalesce_key] = request
+        self._stats["max_depth"] = max(self._stats["max_depth"], self._depth())
+        wakeup = lane["wakeup"]
+        if wakeup is not None and not wakeup.done() and wakeup.get_loop() is loop:
+            wakeup.set_result(None)
+        task = lane["task"]
+        if task is None or task.done() or task.get_loop() is not loop:
+            lane["task"] = loop.create_task(self._drain(channel_id, lane))
+        return await asyncio.shield(request["future"])
+
+    def _depth(self) -> int:
+        return sum(len(lane["heap"]) for lane in self._lanes.values())
+
+    def _reserve(self, channel_id: Any, calls: int = 1) -> float:
+        """Claim calls send slots for channel_id: 0.0 if taken, else seconds until they free up."""
+        if channel_id is None:
+            return 0.0
+        calls = max(1, min(calls, self.limit))
+        now = time.monotonic()
+        sent = self._sent_at.setdefault(channel_id, deque())
+        while sent and now - sent[0] >= self.window_sec:
+            sent.popleft()
+        if len(sent) + calls > self.limit:
+            return self.window_sec - (now - sent[len(sent) + calls - self.limit - 1])
+        sent.extend([now] * calls)
+        return 0.0
+
+    def _forget(self, request: dict) -> None:
+        key = request["coalesce_key"]
+        if key is not None and self._pending_by_key.get(key) is request:
+            del self._pending_by_key[key]
+
+    async def _drain(self, channel_id: Any, lane: dict) -> None:
+        loop = asyncio.get_running_loop()
+        heap = lane["heap"]
+        try:
+            while heap:
+                request = heap[0][2]
+                future = request["future"]
+                if future.done() or future.get_loop() is not loop:
+                    heapq.heappop(heap)
+                    self._forget(request)
+                    continue
+                wait = self._reserve(channel_id, request["calls"])
+                if wait > 0:
+                    # Sleep until slots free up or a request (maybe more urgent) arrives.
+                    lane["wakeup"] = loop.create_future()
+                    try:
+                        await asyncio.wait_for(lane["wakeup"], wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        lane["wakeup"] = None
+                    continue
+                heapq.heappop(heap)
+                self._forget(request)
+                await self._execute(request)
+        except BaseException:
+            # The lane is going away (e.g. loop shutdown): release everyone still waiting.
+            for _priority, _seq, request in heap:
+                self._forget(request)
+                if not request["future"].done():
+                    request["future"].cancel()
+            heap.clear()
+            raise
+
+    async def _execute(self, request: dict) -> None:
+        future = request["future"]
+        priority_name = _PRIORITY_NAMES.get(request["priority"], str(request["priority"]))
+        started = time.monotonic()
+        outcome = "failed"
+        try:
+            result = await asyncio.wait_for(request["operation"](), self.timeout_sec)
+        except asyncio.TimeoutError as e:
+            self._stats["timed_out"] += 1
+            logger.warning(
+                "discord_dispatcher: %s request to channel %s timed out after %gs.",
+                priority_name,
+                request["channel_id"],
+                self.timeout_sec,
+            )
+            future.set_exception(e)
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            # The operation cancelled itself; the lane carries on.
+            future.cancel()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            outcome = "sent"
+            future.set_result(result)
+        finally:
+            if not future.done():
+                future.cancel()
+            self._stats[outcome] += 1
+            metrics.discord_seconds.observe(time.monotonic() - started, priority=priority_name, outcome=outcome)
+            self._record_latency(request)
+
+    def _record_latency(self, request: dict) -> None:
+        latency = time.monotonic() - request["enqueued_at"]
+        self._stats["last_latency_sec"] = round(latency, 3)
+        self._stats["max_latency_sec"] = max(self._stats["max_latency_sec"], round(latency, 3))
+        self._stats["total_latency_sec"] += latency
+        if latency >= _SLOW_SEND_LOG_SEC:
+            logger.warning(
+                "discord_dispatcher: %s request waited %.1fs to complete (queue depth %d).",
+                _PRIORITY_NAMES.get(request["priority"], request["priority"]),
+                latency,
+                self._depth(),
+            )
+
+    def stats(self) -> dict:
+        completed = self._stats["sent"] + self._stats["failed"]
+        depth_by_priority: dict[str, int] = {}
+        for lane in self._lanes.values():
+            for priority, _seq, _request in lane["heap"]:
+                name = _PRIORITY_NAMES.get(priority, str(priority))
+                depth_by_priority[name] = depth_by_priority.get(name, 0) + 1
+        return {
+            "depth": self._depth(),
+            "depth_by_priority": depth_by_priority,
+            **{key: value for key, value in self._stats.items() if key != "total_latency_sec"},
+            "avg_latency_sec": round(self._stats["total_latency_sec"] / completed, 3) if completed else None,
+        }
+
+
+outbound = OutboundDispatcher()
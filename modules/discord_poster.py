@@ -6,10 +6,16 @@ from discord.ext import commands # For commands.Context
 from typing import Sequence
 
 from config import LIVE_UPDATE_EDIT_WINDOW_MESSAGES
+from modules.discord_dispatcher import PRIORITY_LIVE, PRIORITY_NORMAL, PRIORITY_URGENT, outbound
+from modules.message_tracker import ChannelMessageTracker
 
 logger = logging.getLogger(__name__)
 
 _DISCORD_CONTENT_LIMIT = 1900
+# Headroom above the edit window so a few deletions do not force a history refetch.
+_MESSAGE_TRACKER_SLACK = 50
+
+message_tracker = ChannelMessageTracker(LIVE_UPDATE_EDIT_WINDOW_MESSAGES + _MESSAGE_TRACKER_SLACK)
 
 
 def _split_content(content: str, max_len: int = _DISCORD_CONTENT_LIMIT) -> list[str]:
@@ -49,19 +55,50 @@ def _split_content(content: str, max_len: int = _DISCORD_CONTENT_LIMIT) -> list[
     return chunks if chunks else [content[:max_len]]
 
 
+def _send_calls(content: str | None) -> int:
+    """Discord requests needed to send content, one per chunk."""
+    return len(_split_content(content)) if content else 1
+
+
 async def _find_recent_message(
     channel: discord.TextChannel,
     message_id: int,
     limit: int,
 ) -> discord.Message | None:
-    """Return message_id only when it is within the latest limit channel messages."""
+    """Return message_id only when it is within the latest limit channel messages.
+
+    Answered from message_tracker when the channel index is synced; otherwise one
+    history read both answers the question and (re)seeds the index.
+    """
     if limit <= 0:
         return None
 
+    channel_id = getattr(channel, "id", None)
+    if channel_id is not None:
+        recent = message_tracker.is_recent(channel_id, message_id, limit)
+        if recent is False:
+            return None
+        if recent:
+            if hasattr(channel, "get_partial_message"):
+                return channel.get_partial_message(message_id)
+            return await channel.fetch_message(message_id)
+        message_tracker.begin_sync(channel_id)
+
+    found = None
+    history_ids = []
     async for message in channel.history(limit=limit):
+        history_ids.append(message.id)
         if message.id == message_id:
-            return message
-    return None
+            found = message
+    if channel_id is not None:
+        message_tracker.seed(channel_id, history_ids, complete=len(history_ids) < limit)
+    return found
+
+
+def _track_sent(channel, message) -> None:
+    channel_id = getattr(channel, "id", None)
+    if channel_id is not None and message is not None:
+        message_tracker.record(channel_id, message.id)
 
 
 async def upsert_live_message(
@@ -74,7 +111,24 @@ async def upsert_live_message(
     Upsert a live match message.
     Edit only if message_id is still within the latest configured channel messages;
     otherwise send a new message so buried live updates become visible again.
+    Queued behind FT posts and replies; a queued edit of the same message is replaced.
     """
+    return await outbound.run(
+        PRIORITY_LIVE,
+        lambda: _upsert_live_message(bot, channel_id, message_id, content),
+        channel_id=channel_id,
+        coalesce_key=("live", channel_id, message_id) if message_id is not None else None,
+        # Editing may first read the channel history to check the message is recent.
+        calls=2 if message_id is not None else 1,
+    )
+
+
+async def _upsert_live_message(
+    bot: discord.Client,
+    channel_id: int,
+    message_id: int | None,
+    content: str,
+) -> discord.Message | None:
     if not content:
         logger.warning("DiscordPoster: upsert_live_message called with empty content.")
         return None
@@ -104,7 +158,7 @@ async def upsert_live_message(
 
             if existing is not None:
                 try:
-                    await existing.edit(content=content, suppress=True)
+                    edited = await existing.edit(content=content, suppress=True)
                 except discord.NotFound:
                     logger.warning(
                         f"DiscordPoster: Live message {message_id} disappeared before edit in #{channel.name}; "
@@ -124,7 +178,7 @@ async def upsert_live_message(
                         raise
                 else:
                     logger.info(f"DiscordPoster: Edited live message {message_id} in #{channel.name}")
-                    return existing
+                    return edited if isinstance(edited, discord.Message) else existing
 
             logger.info(
                 f"DiscordPoster: Live message {message_id} is not within the last "
@@ -132,6 +186,7 @@ async def upsert_live_message(
             )
 
         created = await channel.send(content=content, suppress_embeds=True)
+        _track_sent(channel, created)
         logger.info(f"DiscordPoster: Created new live message {created.id} in #{channel.name}")
         return created
     except discord.Forbidden:
@@ -153,6 +208,21 @@ async def post_new_general_message(
     Sends a new message to the specified channel.
     Used for FT results or other announcements that should always be new.
     """
+    return await outbound.run(
+        PRIORITY_URGENT,
+        lambda: _post_new_general_message(bot, channel_id, content, embed, attachments),
+        channel_id=channel_id,
+        calls=_send_calls(content),
+    )
+
+
+async def _post_new_general_message(
+    bot: discord.Client,
+    channel_id: int,
+    content: str | None,
+    embed: discord.Embed | None,
+    attachments: Sequence[discord.File] | None,
+) -> discord.Message | None:
     if not content and not embed and (not attachments or len(attachments) == 0):
         logger.warning("DiscordPoster: post_new_general_message called with no content, embed, or attachments.")
         return None
@@ -176,6 +246,7 @@ async def post_new_general_message(
                 files=current_attachments if include_payloads else None,
                 suppress_embeds=True,
             )
+            _track_sent(channel, new_message)
         return new_message
     except discord.Forbidden:
         logger.error(f"DiscordPoster: Missing permissions to send general message in #{channel.name}.", exc_info=True)
@@ -195,6 +266,21 @@ async def edit_general_message(
     Edit an existing general bot message by ID.
     Missing/deleted messages are not replaced here to preserve exactly-once announcements.
     """
+    return await outbound.run(
+        PRIORITY_NORMAL,
+        lambda: _edit_general_message(bot, channel_id, message_id, content),
+        channel_id=channel_id,
+        coalesce_key=("edit", channel_id, message_id) if message_id is not None else None,
+        calls=2,  # fetch + edit
+    )
+
+
+async def _edit_general_message(
+    bot: discord.Client,
+    channel_id: int,
+    message_id: int | None,
+    content: str,
+) -> discord.Message | None:
     if message_id is None or not content:
         logger.warning("DiscordPoster: edit_general_message called with missing message_id or content.")
         return None
@@ -244,6 +330,39 @@ async def edit_general_message(
     return None
 
 
+async def delete_general_message(bot: discord.Client, channel_id: int, message_id: int) -> bool:
+    """Delete a bot message by ID; a message that is already gone counts as deleted."""
+    return await outbound.run(
+        PRIORITY_LIVE,
+        lambda: _delete_general_message(bot, channel_id, message_id),
+        channel_id=channel_id,
+    )
+
+
+async def _delete_general_message(bot: discord.Client, channel_id: int, message_id: int) -> bool:
+    channel = bot.get_channel(channel_id)
+    if not isinstance(channel, discord.TextChannel):
+        logger.error(f"DiscordPoster: Channel ID {channel_id} did not yield a valid TextChannel for message delete.")
+        return False
+
+    try:
+        if hasattr(channel, "get_partial_message"):
+            message = channel.get_partial_message(message_id)
+        else:
+            message = await channel.fetch_message(message_id)
+        await message.delete()
+        logger.info(f"DiscordPoster: Deleted message {message_id} in #{channel.name}")
+        return True
+    except discord.NotFound:
+        return True
+    except discord.Forbidden:
+        logger.error(f"DiscordPoster: Missing permissions to delete message in #{channel.name}.", exc_info=True)
+    except Exception as e:
+        logger.error(f"DiscordPoster: Failed to delete message {message_id} in #{channel.name}: {e}", exc_info=True)
+
+    return False
+
+
 async def post_new_message_to_context(
     ctx: commands.Context,
     content: str | None = None,
@@ -254,6 +373,20 @@ async def post_new_message_to_context(
     Sends a new message in response to a command context.
     Used by cogs.
     """
+    return await outbound.run(
+        PRIORITY_URGENT,
+        lambda: _post_new_message_to_context(ctx, content, embed, attachments),
+        channel_id=getattr(getattr(ctx, "channel", None), "id", None),
+        calls=_send_calls(content),
+    )
+
+
+async def _post_new_message_to_context(
+    ctx: commands.Context,
+    content: str | None,
+    embed: discord.Embed | None,
+    attachments: Sequence[discord.File] | None,
+) -> discord.Message | None:
     if not content and not embed and (not attachments or len(attachments) == 0):
         logger.warning("DiscordPoster: post_new_message_to_context called with no content, embed, or attachments.")
         return None
@@ -272,6 +405,7 @@ async def post_new_message_to_context(
                 files=current_attachments if include_payloads else None,
                 suppress_embeds=True,
             )
+            _track_sent(ctx.channel, new_message)
         return new_message
     except discord.Forbidden:
         logger.error(f"DiscordPoster: Missing permissions to send message via context for command '{command_name}' in #{ctx.channel.name}.", exc_info=True)
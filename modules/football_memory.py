@@ -2,14 +2,15 @@
 # Centralized memory management for football data (standings, teams, players, matches).
 # All data is sourced from ESPN API to ensure consistency.
 
-import json
 import logging
 import asyncio
+from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
 from config import (
+    COMPRESS_FOOTBALL_MEMORY,
     TRACKED_LEAGUE_IDS,
     LEAGUE_SLUG_MAP,
     LEAGUE_NAME_MAP,
@@ -18,7 +19,8 @@ from config import (
     ROSTER_UNSUPPORTED_RETRY_DAYS,
 )
 from modules import match_lifecycle
-from modules.storage import load, save, save_json_path
+from modules.response_cache import ResponseCache
+from modules.storage import BOT_MEMORY_DIR, load, load_json_path, save, save_json_path, save_json_path_async
 from utils.event_formatter import is_counted_goal_event, is_shootout_event, prune_goal_events_to_score
 from utils.time_utils import bot_now
 
@@ -29,10 +31,24 @@ MEMORY_PATH = Path("bot_memory/football_memory.json")
 MATCH_RETENTION_DAYS = 30  # Keep matches for last 30 days only
 TEAM_STATS_KEYS = ("wins", "draws", "losses", "goals_for", "goals_against")
 PLAYER_STATS_KEYS = ("goals", "assists", "yellow_cards", "red_cards")
-
-# --- ESPN Cache (12h TTL) ---
-_espn_cache: Dict[str, Any] = {}
-_espn_cache_ts: Dict[str, datetime] = {}
+LEADERBOARD_SIZE = 10
+FORM_LENGTH = 5
+LEADERBOARDS_VERSION = 1
+
+# --- ESPN Cache (12h TTL, bounded LRU persisted across restarts) ---
+ESPN_CACHE_FILE = "espn_response_cache.json"
+ESPN_CACHE_MAX_ENTRIES = 512
+espn_cache = ResponseCache(
+    "football_memory",
+    max_entries=ESPN_CACHE_MAX_ENTRIES,
+    default_ttl_sec=ESPN_CACHE_TTL_SEC,
+    path=BOT_MEMORY_DIR / ESPN_CACHE_FILE,
+)
+# Every update loads the whole document, awaits ESPN, then saves it whole. The FT
+# queue worker, the daily standings/team refreshes and !refresh_memory run
+# concurrently, so each load -> mutate -> save holds this lock; otherwise the
+# last save silently drops the others' changes.
+_memory_lock = asyncio.Lock()
 _ROSTER_LOOKUP_STATE_FILE = "roster_lookup_state.json"
 _ROSTER_LOOKUP_STATE_DEFAULT = {"version": 1, "unsupported": {}}
 
@@ -48,9 +64,15 @@ def _default_memory() -> Dict[str, Any]:
         "leagues": {},   # {league_id: {"name": str, "standings": list, "last_updated": str}}
         "teams": {},     # {team_id: {"name": str, "coach": str, "players": {player_name: {...}}, "stats": {...}, "last_updated": str}}
         "matches": {},   # {match_id: {"league_id": int, "home": {...}, "away": {...}, "score": {...}, "status": str, "date": str, "events": list}}
+        "leaderboards": _default_leaderboards(),
     }
 
 
+def _default_leaderboards() -> Dict[str, Any]:
+    # {"version": int, "leagues": {league_id: {"players": {team_id|name: {...}}, "top": {stat: [row, ...]}}}}
+    return {"version": LEADERBOARDS_VERSION, "leagues": {}}
+
+
 def _default_team_stats() -> Dict[str, int]:
     return {key: 0 for key in TEAM_STATS_KEYS}
 
@@ -130,8 +152,7 @@ def load_memory() -> Dict[str, Any]:
         logger.info("No football memory found. Initializing empty memory.")
         return _default_memory()
     try:
-        with open(MEMORY_PATH, "r", encoding="utf-8") as f:
-            memory = json.load(f)
+        memory = load_json_path(MEMORY_PATH)
         logger.info("Football memory loaded successfully.")
         return memory
     except Exception as e:
@@ -141,26 +162,69 @@ def load_memory() -> Dict[str, Any]:
 
 def save_memory(memory: Dict[str, Any]) -> None:
     """Atomically save memory to disk, raising when persistence fails."""
-    save_json_path(MEMORY_PATH, memory, ensure_ascii=False)
+    save_json_path(
+        MEMORY_PATH,
+        memory,
+        ensure_ascii=False,
+        compact=True,
+        compress=COMPRESS_FOOTBALL_MEMORY,
+    )
+
+
+async def save_memory_async(memory: Dict[str, Any]) -> None:
+    """Save memory on the storage writer thread; returns once it is durable."""
+    await save_json_path_async(
+        MEMORY_PATH,
+        memory,
+        ensure_ascii=False,
+        compact=True,
+        compress=COMPRESS_FOOTBALL_MEMORY,
+    )
     logger.info("Football memory saved successfully.")
 
 
 # --- ESPN Cache Helpers ---
 def _get_espn_cache(key: str) -> Optional[Any]:
     """Get cached ESPN response if still valid (TTL: ESPN_CACHE_TTL_SEC)."""
-    if key not in _espn_cache or key not in _espn_cache_ts:
-        return None
-    if (bot_now() - _espn_cache_ts[key]).total_seconds() > ESPN_CACHE_TTL_SEC:
-        del _espn_cache[key]
-        del _espn_cache_ts[key]
-        return None
-    return _espn_cache[key]
+    return espn_cache.get(key)
 
 
 def _set_espn_cache(key: str, data: Any) -> None:
-    """Cache ESPN response with current timestamp."""
-    _espn_cache[key] = data
-    _espn_cache_ts[key] = bot_now()
+    """Cache ESPN response with the default TTL."""
+    espn_cache.set(key, data)
+
+
+def _persist_espn_cache() -> None:
+    """Best-effort cache write; a failed cache save must not discard a memory update."""
+    try:
+        espn_cache.persist(background=True)
+    except Exception as e:
+        logger.warning("Failed to persist ESPN response cache: %s", type(e).__name__)
+
+
+def invalidate_espn_cache(prefix: str = "") -> int:
+    """Drop cached ESPN responses whose key starts with prefix (all when empty)."""
+    if not prefix:
+        count = espn_cache.stats()["entries"]
+        espn_cache.clear()
+    else:
+        count = espn_cache.invalidate_prefix(prefix)
+    _persist_espn_cache()
+    return count
+
+
+def espn_cache_stats() -> Dict[str, Any]:
+    return espn_cache.stats()
+
+
+def _invalidate_league_standings_cache(league_id: Any) -> None:
+    """A newly counted FT result makes that league's cached table stale."""
+    try:
+        slug = LEAGUE_SLUG_MAP.get(int(league_id))
+    except (TypeError, ValueError):
+        return
+    if slug and espn_cache.invalidate(f"standings_{slug}"):
+        _persist_espn_cache()
 
 
 # --- Staleness Checks ---
@@ -325,6 +389,45 @@ def _team_slug_candidates(memory: Dict[str, Any]) -> Dict[str, list[str]]:
     return candidates
 
 
+def _player_stats_from_events(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Count per-team, per-player goals and cards from one match's events."""
+    player_stats_updates: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for event in events or []:
+        if is_shootout_event(event):
+            continue
+        event_type = event.get("type")
+        if event_type == "Goal" and not is_counted_goal_event(event):
+            continue
+        player_name = event.get("player", {}).get("name")
+        team_id = event.get("team", {}).get("id")
+
+        if not player_name or not team_id:
+            continue
+        team_id = str(team_id)
+
+        if team_id not in player_stats_updates:
+            player_stats_updates[team_id] = {}
+        if player_name not in player_stats_updates[team_id]:
+            player_stats_updates[team_id][player_name] = {
+                "goals": 0,
+                "assists": 0,
+                "yellow_cards": 0,
+                "red_cards": 0,
+            }
+
+        if is_counted_goal_event(event):
+            player_stats_updates[team_id][player_name]["goals"] += 1
+        elif event_type == "Card":
+            detail = event.get("detail", "")
+            if "Yellow" in detail:
+                player_stats_updates[team_id][player_name]["yellow_cards"] += 1
+            elif "Red" in detail:
+                player_stats_updates[team_id][player_name]["red_cards"] += 1
+        # Note: Assists are not always available in ESPN events
+
+    return player_stats_updates
+
+
 async def update_match_data(
     session: Any, match: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -385,39 +488,7 @@ async def update_match_data(
         away_team_update["stats"]["wins"] = 1
 
     # --- Player Stats Updates (by name) ---
-    player_stats_updates = {}
-    for event in match.get("events", []):
-        if is_shootout_event(event):
-            continue
-        event_type = event.get("type")
-        if event_type == "Goal" and not is_counted_goal_event(event):
-            continue
-        player_name = event.get("player", {}).get("name")
-        team_id = event.get("team", {}).get("id")
-
-        if not player_name or not team_id:
-            continue
-        team_id = str(team_id)
-
-        if team_id not in player_stats_updates:
-            player_stats_updates[team_id] = {}
-        if player_name not in player_stats_updates[team_id]:
-            player_stats_updates[team_id][player_name] = {
-                "goals": 0,
-                "assists": 0,
-                "yellow_cards": 0,
-                "red_cards": 0,
-            }
-
-        if is_counted_goal_event(event):
-            player_stats_updates[team_id][player_name]["goals"] += 1
-        elif event_type == "Card":
-            detail = event.get("detail", "")
-            if "Yellow" in detail:
-                player_stats_updates[team_id][player_name]["yellow_cards"] += 1
-            elif "Red" in detail:
-                player_stats_updates[team_id][player_name]["red_cards"] += 1
-        # Note: Assists are not always available in ESPN events
+    player_stats_updates = _player_stats_from_events(match.get("events", []))
 
     return {
         "match": match_data,
@@ -427,12 +498,141 @@ async def update_match_data(
     }
 
 
+# --- Leaderboards ---
+# Aggregates are maintained alongside the per-player counters so readers take
+# the first k rows instead of sorting rosters. Counters only grow, so a bounded
+# top-N list stays exact: a player can only enter it by increasing their total.
+def _update_top_rows(rows: List[Dict[str, Any]], row: Dict[str, Any], size: int = LEADERBOARD_SIZE) -> None:
+    rows[:] = [existing for existing in rows if existing.get("key") != row["key"]]
+    if row["value"] <= 0:
+        return
+    if len(rows) >= size and row["value"] < rows[-1]["value"]:
+        return
+    rows.append(row)
+    rows.sort(key=lambda item: (-item["value"], item.get("name") or ""))
+    del rows[size:]
+
+
+def _update_team_top_scorers(team: Dict[str, Any], player_name: str) -> None:
+    goals = int((team.get("players", {}).get(player_name) or {}).get("goals") or 0)
+    rows = team.setdefault("top_scorers", [])
+    _update_top_rows(rows, {"key": player_name, "name": player_name, "value": goals})
+
+
+def _league_board(memory: Dict[str, Any], league_id: Any) -> Dict[str, Any]:
+    leagues = memory.setdefault("leaderboards", _default_leaderboards()).setdefault("leagues", {})
+    board = leagues.setdefault(str(league_id), {})
+    board.setdefault("players", {})
+    top = board.setdefault("top", {})
+    for stat in PLAYER_STATS_KEYS:
+        top.setdefault(stat, [])
+    return board
+
+
+def _apply_league_player_stats(
+    memory: Dict[str, Any],
+    league_id: Any,
+    team_names: Dict[str, str],
+    player_stats: Dict[str, Dict[str, Dict[str, int]]],
+) -> None:
+    board = _league_board(memory, league_id)
+    for team_id, players in player_stats.items():
+        for player_name, stats in players.items():
+            key = f"{team_id}|{player_name}"
+            record = board["players"].setdefault(key, {
+                "name": player_name,
+                "team_id": team_id,
+                **_default_player_stats(),
+            })
+            record["team_name"] = team_names.get(team_id) or record.get("team_name") or "Unknown"
+            for stat in PLAYER_STATS_KEYS:
+                if not stats.get(stat):
+                    continue
+                record[stat] = int(record.get(stat) or 0) + stats[stat]
+                _update_top_rows(board["top"][stat], {
+                    "key": key,
+                    "name": player_name,
+                    "team_name": record["team_name"],
+                    "value": record[stat],
+                })
+
+
+def _form_entry(match_id: str, match_data: Dict[str, Any], side: str) -> Dict[str, Any]:
+    other = "away" if side == "home" else "home"
+    score = match_data.get("score") or {}
+    goals_for = score.get(side) or 0
+    goals_against = score.get(other) or 0
+    if goals_for > goals_against:
+        result = "W"
+    elif goals_for == goals_against:
+        result = "D"
+    else:
+        result = "L"
+    return {
+        "match_id": match_id,
+        "date": match_data.get("date"),
+        "league_id": match_data.get("league_id"),
+        "opponent": (match_data.get(other) or {}).get("name"),
+        "venue": side,
+        "score": f"{goals_for}-{goals_against}",
+        "result": result,
+    }
+
+
+def _record_team_form(team: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    form = [item for item in team.get("form", []) if item.get("match_id") != entry["match_id"]]
+    form.append(entry)
+    form.sort(key=lambda item: item.get("date") or "", reverse=True)
+    team["form"] = form[:FORM_LENGTH]
+
+
+def _ensure_leaderboards(memory: Dict[str, Any]) -> bool:
+    """Build aggregates once for memory written before leaderboards existed."""
+    leaderboards = memory.get("leaderboards")
+    if isinstance(leaderboards, dict) and leaderboards.get("version") == LEADERBOARDS_VERSION:
+        return False
+
+    memory["leaderboards"] = _default_leaderboards()
+    for team in memory.get("teams", {}).values():
+        if not isinstance(team, dict):
+            continue
+        team["top_scorers"] = []
+        for player_name in (team.get("players") or {}):
+            _update_team_top_scorers(team, player_name)
+        team["form"] = []
+
+    # League tables can only be rebuilt from retained matches; counts grow from here.
+    for match_id, match_data in memory.get("matches", {}).items():
+        league_id = match_data.get("league_id")
+        home = match_data.get("home") or {}
+        away = match_data.get("away") or {}
+        team_names = {str(home.get("id")): home.get("name"), str(away.get("id")): away.get("name")}
+        if league_id is not None:
+            _apply_league_player_stats(
+                memory,
+                league_id,
+                team_names,
+                _player_stats_from_events(match_data.get("events") or []),
+            )
+        for side in ("home", "away"):
+            team = memory.get("teams", {}).get(str((match_data.get(side) or {}).get("id")))
+            if isinstance(team, dict):
+                _record_team_form(team, _form_entry(match_id, match_data, side))
+    logger.info("Rebuilt football memory leaderboards from %d stored match(es).", len(memory.get("matches", {})))
+    return True
+
+
 # --- Public Update Functions ---
 async def update_all_memory(session: Any) -> None:
     """
     Force update all memory data (standings, teams, recent matches).
     Called by !refresh_memory or at startup.
     """
+    async with _memory_lock:
+        await _update_all_memory(session)
+
+
+async def _update_all_memory(session: Any) -> None:
     memory = load_memory()
     league_jobs: list[tuple[int, Any]] = []
 
@@ -493,6 +693,8 @@ async def update_all_memory(session: Any) -> None:
             pruned_matches[match_id] = match_data
     memory["matches"] = pruned_matches
 
+    _ensure_leaderboards(memory)
+
     # Update metadata
     memory["metadata"] = {
         "last_full_update": bot_now().isoformat(),
@@ -500,12 +702,18 @@ async def update_all_memory(session: Any) -> None:
         "last_team_info_update": bot_now().isoformat(),
     }
 
-    save_memory(memory)
+    await save_memory_async(memory)
+    _persist_espn_cache()
     logger.info("All football memory updated successfully.")
 
 
 async def update_standings_only(session: Any) -> None:
     """Update only league standings (called daily at midnight)."""
+    async with _memory_lock:
+        await _update_standings_only(session)
+
+
+async def _update_standings_only(session: Any) -> None:
     memory = load_memory()
     league_jobs: list[tuple[int, Any]] = []
 
@@ -521,12 +729,18 @@ async def update_standings_only(session: Any) -> None:
             memory["leagues"][str(league_id)] = result
 
     memory["metadata"]["last_standings_update"] = bot_now().isoformat()
-    save_memory(memory)
+    await save_memory_async(memory)
+    _persist_espn_cache()
     logger.info("League standings updated successfully.")
 
 
 async def update_team_info_only(session: Any) -> None:
     """Update only team info (called weekly on Sunday)."""
+    async with _memory_lock:
+        await _update_team_info_only(session)
+
+
+async def _update_team_info_only(session: Any) -> None:
     memory = load_memory()
     team_slug_candidates = _team_slug_candidates(memory)
 
@@ -556,7 +770,8 @@ async def update_team_info_only(session: Any) -> None:
             )
 
     memory["metadata"]["last_team_info_update"] = bot_now().isoformat()
-    save_memory(memory)
+    await save_memory_async(memory)
+    _persist_espn_cache()
     logger.info("Team info updated successfully.")
 
 
@@ -572,10 +787,46 @@ def _match_has_required_memory_data(match: Dict[str, Any]) -> bool:
 async def update_match_in_memory(session: Any, match: Dict[str, Any]) -> dict:
     """
     Update memory with a Full-Time match.
-    Called by ft_handler when a match reaches FT status.
     """
+    return (await update_matches_in_memory(session, [match]))[0]
+
+
+async def update_matches_in_memory(session: Any, matches: List[Dict[str, Any]]) -> List[dict]:
+    """
+    Apply a batch of Full-Time matches with one memory load and at most one write.
+    Called by the memory update queue worker; returns one result per match, in order.
+    """
+    async with _memory_lock:
+        return await _update_matches_in_memory(session, matches)
+
+
+async def _update_matches_in_memory(session: Any, matches: List[Dict[str, Any]]) -> List[dict]:
     memory = load_memory()
+    results = []
+    for match in matches:
+        try:
+            results.append(await _apply_match_to_memory(memory, session, match))
+        except Exception as e:
+            logger.error(
+                "Failed to apply FT match %s to football memory: %s",
+                match_lifecycle.fixture_identity(match),
+                e,
+                exc_info=True,
+            )
+            results.append({"updated": False, "reason": "failed_exception"})
+    updated_leagues = {
+        match["league"]["id"]
+        for match, result in zip(matches, results)
+        if result.get("updated")
+    }
+    if updated_leagues:
+        await save_memory_async(memory)
+        for league_id in updated_leagues:
+            _invalidate_league_standings_cache(league_id)
+    return results
 
+
+async def _apply_match_to_memory(memory: Dict[str, Any], session: Any, match: Dict[str, Any]) -> dict:
     if not match_lifecycle.is_ft(match):
         return {"updated": False, "reason": "not_ft"}
 
@@ -601,10 +852,56 @@ async def update_match_in_memory(session: Any, match: Dict[str, Any]) -> dict:
 
     if match_id in memory["matches"]:
         memory["matches"][match_id] = update_result["match"]
-        save_memory(memory)
         logger.info(f"Updated stored FT match without recounting stats: {match_id}")
         return {"updated": True, "reason": "updated_existing"}
 
+    # Bring older memory up to date before counting this match into the aggregates.
+    _ensure_leaderboards(memory)
+
+    # A match that fails halfway must leave no trace: the batch still saves the
+    # others, and a retry of a stored match takes the updated_existing path above,
+    # which would never count the missing stats.
+    touched = _snapshot_match_records(memory, match_id, (home_id, away_id), match["league"]["id"])
+    try:
+        _count_match_into_memory(memory, match, match_id, update_result)
+    except Exception:
+        _restore_match_records(touched)
+        raise
+
+    logger.info(f"Updated memory with FT match: {match_id}")
+    return {"updated": True, "reason": "updated"}
+
+
+def _snapshot_match_records(
+    memory: Dict[str, Any],
+    match_id: str,
+    team_ids: tuple,
+    league_id: Any,
+) -> List[tuple]:
+    """Copies of every record counting one match writes to, for _restore_match_records."""
+    boards = memory["leaderboards"].setdefault("leagues", {})
+    places = [(memory["matches"], match_id), (boards, str(league_id))]
+    places += [(memory["teams"], team_id) for team_id in team_ids]
+    return [(parent, key, key in parent, deepcopy(parent.get(key))) for parent, key in places]
+
+
+def _restore_match_records(touched: List[tuple]) -> None:
+    for parent, key, existed, value in touched:
+        if existed:
+            parent[key] = value
+        else:
+            parent.pop(key, None)
+
+
+def _count_match_into_memory(
+    memory: Dict[str, Any],
+    match: Dict[str, Any],
+    match_id: str,
+    update_result: Dict[str, Any],
+) -> None:
+    home_id = str(match["teams"]["home"]["id"])
+    away_id = str(match["teams"]["away"]["id"])
+
     # Store match and count its team/player stats once.
     memory["matches"][match_id] = update_result["match"]
 
@@ -636,10 +933,18 @@ async def update_match_in_memory(session: Any, match: Dict[str, Any]) -> dict:
                 )
             for stat in PLAYER_STATS_KEYS:
                 memory["teams"][team_id]["players"][player_name][stat] += stats[stat]
-
-    save_memory(memory)
-    logger.info(f"Updated memory with FT match: {match_id}")
-    return {"updated": True, "reason": "updated"}
+            if stats["goals"]:
+                _update_team_top_scorers(memory["teams"][team_id], player_name)
+
+    # Update leaderboards and form alongside the counters above.
+    _apply_league_player_stats(
+        memory,
+        match["league"]["id"],
+        {home_id: match["teams"]["home"]["name"], away_id: match["teams"]["away"]["name"]},
+        update_result.get("player_stats", {}),
+    )
+    _record_team_form(memory["teams"][home_id], _form_entry(match_id, update_result["match"], "home"))
+    _record_team_form(memory["teams"][away_id], _form_entry(match_id, update_result["match"], "away"))
 
 
 # --- Query Helpers ---
@@ -684,3 +989,53 @@ def get_recent_matches(team_id: str, limit: int = 5) -> List[Dict[str, Any]]:
     # Sort by date (newest first) and limit
     matches.sort(key=lambda x: x.get("date", ""), reverse=True)
     return matches[:limit]
+
+
+def get_league_leaders(
+    league_id: int | str,
+    stat: str = "goals",
+    limit: int = 5,
+    memory: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Get the top rows of a league-wide player table (goals, assists, yellow_cards, red_cards)."""
+    if stat not in PLAYER_STATS_KEYS:
+        return []
+    memory = memory if memory is not None else load_memory()
+    board = (memory.get("leaderboards") or {}).get("leagues", {}).get(str(league_id)) or {}
+    return list((board.get("top") or {}).get(stat, [])[:limit])
+
+
+def get_team_top_scorers(
+    team_id_or_data: str | Dict[str, Any],
+    limit: int = 3,
+    memory: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Get a team's top scorers as [{"name", "value"}] rows, highest goal count first."""
+    if isinstance(team_id_or_data, dict):
+        team = team_id_or_data
+    else:
+        memory = memory if memory is not None else load_memory()
+        team = memory.get("teams", {}).get(str(team_id_or_data)) or {}
+    if "top_scorers" in team:
+        return list(team["top_scorers"][:limit])
+    rows: List[Dict[str, Any]] = []
+    for player_name, player in (team.get("players") or {}).items():
+        _update_top_rows(
+            rows,
+            {"key": player_name, "name": player_name, "value": int((player or {}).get("goals") or 0)},
+            size=limit,
+        )
+    return rows
+
+
+def get_team_form(
+    team_id_or_data: str | Dict[str, Any],
+    memory: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Get a team's last FORM_LENGTH results, newest first."""
+    if isinstance(team_id_or_data, dict):
+        team = team_id_or_data
+    else:
+        memory = memory if memory is not None else load_memory()
+        team = memory.get("teams", {}).get(str(team_id_or_data)) or {}
+    return list(team.get("form") or [])
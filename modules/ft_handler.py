@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -5,10 +6,10 @@ from pathlib import Path
 import discord
 
 from config import CHANNEL_ID
-from modules import match_lifecycle, match_state
+from modules import match_lifecycle, match_state, memory_queue
 from modules.bot_mode import is_silent
 from modules.discord_poster import edit_general_message, post_new_general_message
-from modules.football_memory import update_match_in_memory
+from modules.render_cache import football_renders, render_inputs
 from utils.event_formatter import (
     event_completeness_note,
     format_match_events,
@@ -22,6 +23,14 @@ from utils.time_utils import utc_now
 logger = logging.getLogger(__name__)
 
 _past_expected_live_logged: set[str] = set()
+# Terminal fixtures enriched and announced at the same time within one FT check.
+_FT_FIXTURE_CONCURRENCY = 4
+# One lock per fixture keeps check-then-post exactly-once when fixtures run in parallel.
+_fixture_locks: dict[str, asyncio.Lock] = {}
+# FT announcements in progress by fixture. Posting and marking the fixture announced
+# run as one task shielded from the caller: a cycle cancelled by its runtime limit
+# between the two would otherwise leave a sent FT unmarked and post it again.
+_ft_announcements: dict[str, asyncio.Task] = {}
 
 
 def _fixture_status_short(match: dict | None) -> str | None:
@@ -92,6 +101,14 @@ def _has_required_memory_keys(match_details: dict) -> bool:
 
 
 def _build_ft_message(match_details: dict, *, show_missing_warning: bool = False) -> str:
+    return football_renders.render(
+        "ft_message",
+        {"match": render_inputs(match_details), "show_missing_warning": show_missing_warning},
+        lambda: _format_ft_message(match_details, show_missing_warning=show_missing_warning),
+    )
+
+
+def _format_ft_message(match_details: dict, *, show_missing_warning: bool) -> str:
     match_details, pruned_goal_events = prune_goal_events_to_score(match_details)
     if pruned_goal_events:
         logger.info(
@@ -199,6 +216,58 @@ async def _post_ft_from_data(
     return await post_new_general_message(bot, CHANNEL_ID, content=ft_message)
 
 
+def _fixture_lock(fixture_id: str) -> asyncio.Lock:
+    lock = _fixture_locks.get(fixture_id)
+    if lock is None:
+        lock = _fixture_locks[fixture_id] = asyncio.Lock()
+    return lock
+
+
+async def _announce_ft(
+    bot: discord.Client,
+    enriched: dict,
+    fixture_id: str,
+    show_missing_warning: bool,
+    memory_dir: Path | None,
+):
+    sent = await _post_ft_from_data(
+        bot,
+        enriched,
+        show_missing_warning=show_missing_warning,
+    )
+    if sent is not None:
+        ft_content = _build_ft_message(enriched, show_missing_warning=show_missing_warning)
+        match_state.update_ft_message(
+            fixture_id,
+            _message_id_or_none(sent),
+            ft_content,
+            memory_dir=memory_dir,
+        )
+        match_state.mark_ft_announced(fixture_id, memory_dir=memory_dir)
+    return sent
+
+
+def _ft_announcement(
+    bot: discord.Client,
+    enriched: dict,
+    fixture_id: str,
+    show_missing_warning: bool,
+    memory_dir: Path | None,
+) -> asyncio.Task:
+    """Start the FT post for fixture_id, or join the one a cancelled cycle left running."""
+    task = _ft_announcements.get(fixture_id)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_announce_ft(bot, enriched, fixture_id, show_missing_warning, memory_dir))
+        _ft_announcements[fixture_id] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _ft_announcements.get(fixture_id) is done:
+                del _ft_announcements[fixture_id]
+
+        task.add_done_callback(_forget)
+    return task
+
+
 async def process_terminal_fixture(
     bot: discord.Client,
     match_details: dict,
@@ -207,6 +276,20 @@ async def process_terminal_fixture(
 ) -> None:
     if not match_lifecycle.is_terminal(match_details):
         return
+    fixture_id = match_lifecycle.fixture_identity(match_details)
+    if fixture_id is None:
+        await _process_terminal_fixture(bot, match_details, now_utc, memory_dir)
+        return
+    async with _fixture_lock(fixture_id):
+        await _process_terminal_fixture(bot, match_details, now_utc, memory_dir)
+
+
+async def _process_terminal_fixture(
+    bot: discord.Client,
+    match_details: dict,
+    now_utc: datetime | None,
+    memory_dir: Path | None,
+) -> None:
 
     from modules import api_provider
 
@@ -286,28 +369,19 @@ async def process_terminal_fixture(
             )
 
     if match_lifecycle.is_ft(enriched) and not current.get("memory_updated"):
-        if event_status and event_status["status"] == api_provider.EVENTS_PENDING_ENRICHMENT:
+        if current.get("memory_update_failed"):
+            # The memory queue gave up after repeated failures; see memory_queue._MAX_ATTEMPTS.
+            memory_result = {"updated": False, "reason": "gave_up"}
+        elif event_status and event_status["status"] == api_provider.EVENTS_PENDING_ENRICHMENT:
             logger.info(
                 "Deferring football memory update for FT fixture %s while event enrichment is pending.",
                 fixture_id,
             )
             memory_result = {"updated": False, "reason": "event_enrichment_pending"}
         elif _has_required_memory_keys(enriched):
-            try:
-                memory_result = await update_match_in_memory(bot.http_session, enriched)
-            except Exception as e:
-                logger.error("Failed to update football memory for match %s: %s", fixture_id, e)
-                memory_result = {"updated": False, "reason": "failed_exception"}
-            else:
-                if memory_result.get("updated"):
-                    match_state.mark_memory_updated(fixture_id, memory_dir=memory_dir)
-                    logger.info("Updated football memory with FT match: %s", fixture_id)
-                else:
-                    logger.warning(
-                        "Football memory update skipped for FT fixture %s: %s.",
-                        fixture_id,
-                        memory_result.get("reason", "unknown"),
-                    )
+            # Queued once the FT post below is out; the memory worker applies it and
+            # sets memory_updated, so the announcement never waits on memory I/O.
+            memory_result = {"updated": False, "reason": "queued"}
         else:
             logger.warning(
                 "Skipping football memory update for FT fixture %s because required IDs are missing.",
@@ -320,22 +394,11 @@ async def process_terminal_fixture(
     current = match_state.get_fixture_state(fixture_id, memory_dir=memory_dir) or {}
     ft_posted = None
     if match_lifecycle.is_ft(enriched) and not current.get("ft_announced"):
-        sent = await _post_ft_from_data(
-            bot,
-            enriched,
-            show_missing_warning=show_missing_warning,
+        sent = await asyncio.shield(
+            _ft_announcement(bot, enriched, fixture_id, show_missing_warning, memory_dir)
         )
         ft_posted = sent is not None
-        if sent is not None:
-            ft_content = _build_ft_message(enriched, show_missing_warning=show_missing_warning)
-            match_state.update_ft_message(
-                fixture_id,
-                _message_id_or_none(sent),
-                ft_content,
-                memory_dir=memory_dir,
-            )
-            match_state.mark_ft_announced(fixture_id, memory_dir=memory_dir)
-        else:
+        if sent is None:
             logger.warning("FT announcement skipped or failed for fixture %s.", fixture_id)
     elif match_lifecycle.is_ft(enriched):
         ft_posted = "already_announced"
@@ -361,6 +424,14 @@ async def process_terminal_fixture(
                     message_id,
                     fixture_id,
                 )
+
+    if memory_result is not None and memory_result["reason"] == "queued":
+        try:
+            await memory_queue.enqueue(fixture_id, enriched, now_utc=now_utc, memory_dir=memory_dir)
+        except Exception as e:
+            logger.error("Failed to queue football memory update for match %s: %s", fixture_id, e)
+            memory_result = {"updated": False, "reason": "failed_exception"}
+
     logger.info(
         "Terminal fixture processing result: fixture_id=%s memory_update=%s ft_announcement=%s.",
         fixture_id,
@@ -427,6 +498,7 @@ async def fetch_and_post_ft(
         if match_lifecycle.fixture_identity(match)
     }
 
+    terminal_matches: list[dict] = []
     for match in matches:
         fixture_id = match_lifecycle.fixture_identity(match)
         if fixture_id is None:
@@ -451,41 +523,85 @@ async def fetch_and_post_ft(
             ):
                 _past_expected_live_logged.discard(fixture_id)
                 continue
-            await process_terminal_fixture(bot, match, now_utc=now)
+            terminal_matches.append(match)
             _past_expected_live_logged.discard(fixture_id)
+    await _process_terminal_fixtures(bot, terminal_matches, now)
+
+    due_ids = [
+        fixture_id
+        for fixture_id in match_state.expected_ft_due_fixture_ids(now)
+        if fixture_id not in matches_by_id
+    ]
+    if not due_ids:
+        return
+    semaphore = asyncio.Semaphore(_FT_FIXTURE_CONCURRENCY)
 
-    due_ids = match_state.expected_ft_due_fixture_ids(now)
-    for fixture_id in due_ids:
-        if fixture_id in matches_by_id:
-            continue
-        state = match_state.get_fixture_state(fixture_id) or {}
-        provider_ids = state.get("provider_ids", {}) if isinstance(state, dict) else {}
-        fetch_fixture_id = provider_ids.get("api_football") if isinstance(provider_ids, dict) else None
-        if fetch_fixture_id is None:
-            if provider_ids.get("espn") == str(fixture_id) or state.get("provider") == "espn":
-                logger.info(
-                    "Skipping direct FT fetch for ESPN fixture %s because no API-Football alias is known.",
-                    fixture_id,
-                )
-                continue
-            fetch_fixture_id = fixture_id
-        payload = await api_provider.fetch_fixture(bot.http_session, fetch_fixture_id)
-        response = payload.get("response") if isinstance(payload, dict) else None
-        if not isinstance(response, list) or not response:
-            continue
-        normalized = _normalize_api_football_match(response[0])
-        normalized["provider"] = "api_football"
-        normalized["provider_fixture_id"] = str(fetch_fixture_id)
-        normalized["canonical_fixture_id"] = str(fixture_id)
-        normalized["provider_ids"] = {
-            **(provider_ids if isinstance(provider_ids, dict) else {}),
-            "api_football": str(fetch_fixture_id),
-        }
-        if provider_ids.get("espn"):
-            normalized["provider_ids"]["espn"] = str(provider_ids["espn"])
-        if match_lifecycle.is_terminal(normalized):
-            await process_terminal_fixture(bot, normalized, now_utc=now)
+    async def fetch_due(fixture_id: str) -> dict | None:
+        async with semaphore:
+            try:
+                return await _fetch_due_fixture(bot, fixture_id)
+            except Exception:
+                logger.exception("Direct FT fetch failed for fixture %s.", fixture_id)
+                return None
+
+    fetched = await asyncio.gather(*(fetch_due(fixture_id) for fixture_id in due_ids))
+    await _process_terminal_fixtures(bot, [match for match in fetched if match is not None], now)
+
+
+async def _process_terminal_fixtures(bot: discord.Client, fixtures: list[dict], now: datetime) -> None:
+    """Process terminal fixtures with bounded parallelism; one fixture's payloads stay in order."""
+    groups: dict[str, list[dict]] = {}
+    for match in fixtures:
+        groups.setdefault(match_lifecycle.fixture_identity(match), []).append(match)
+    semaphore = asyncio.Semaphore(_FT_FIXTURE_CONCURRENCY)
+
+    async def process_group(fixture_id: str, group: list[dict]) -> None:
+        async with semaphore:
+            for match in group:
+                try:
+                    await process_terminal_fixture(bot, match, now_utc=now)
+                except Exception:
+                    logger.exception("Terminal fixture processing failed for fixture %s.", fixture_id)
+
+    await asyncio.gather(*(process_group(fixture_id, group) for fixture_id, group in groups.items()))
+
+
+async def _fetch_due_fixture(bot: discord.Client, fixture_id: str) -> dict | None:
+    """Fetch a due fixture missing from the rolling window; the normalized payload if terminal."""
+    from modules import api_provider
+
+    state = match_state.get_fixture_state(fixture_id) or {}
+    provider_ids = state.get("provider_ids", {}) if isinstance(state, dict) else {}
+    fetch_fixture_id = provider_ids.get("api_football") if isinstance(provider_ids, dict) else None
+    if fetch_fixture_id is None:
+        if provider_ids.get("espn") == str(fixture_id) or state.get("provider") == "espn":
+            logger.info(
+                "Skipping direct FT fetch for ESPN fixture %s because no API-Football alias is known.",
+                fixture_id,
+            )
+            return None
+        fetch_fixture_id = fixture_id
+    payload = await api_provider.fetch_fixture(bot.http_session, fetch_fixture_id)
+    response = payload.get("response") if isinstance(payload, dict) else None
+    if not isinstance(response, list) or not response:
+        return None
+    normalized = _normalize_api_football_match(response[0])
+    normalized["provider"] = "api_football"
+    normalized["provider_fixture_id"] = str(fetch_fixture_id)
+    normalized["canonical_fixture_id"] = str(fixture_id)
+    normalized["provider_ids"] = {
+        **(provider_ids if isinstance(provider_ids, dict) else {}),
+        "api_football": str(fetch_fixture_id),
+    }
+    if provider_ids.get("espn"):
+        normalized["provider_ids"]["espn"] = str(provider_ids["espn"])
+    return normalized if match_lifecycle.is_terminal(normalized) else None
 
 
 def prune_ft_state(now_utc: datetime | None = None) -> list[str]:
-    return match_state.prune_match_tracking_state(now_utc or utc_now())
+    removed = match_state.prune_match_tracking_state(now_utc or utc_now())
+    for fixture_id in removed or ():
+        lock = _fixture_locks.get(fixture_id)
+        if lock is not None and not lock.locked():
+            del _fixture_locks[fixture_id]
+    return removed
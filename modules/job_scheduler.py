@@ -0,0 +1,269 @@
+# modules/job_scheduler.py
+# Small heap-based job engine for the operations runtime. Each named job owns its
+# next-due time; the dispatcher sleeps until the earliest one instead of keeping
+# hand-maintained timestamps in sync. Jobs may return the datetime they want to
+# run next (planned jobs such as the football sleep planner) or None to repeat
+# on their interval. Every run is its own task; jobs sharing a lane never run
+# concurrently, jobs on different lanes never wait for each other.
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from modules import metrics
+from utils.time_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+OVERLAP_SKIP = "skip"
+OVERLAP_QUEUE = "queue"
+_OVERLAP_POLICIES = {OVERLAP_SKIP, OVERLAP_QUEUE}
+# Upper bound on one dispatcher sleep so clock jumps are noticed promptly.
+_MAX_IDLE_SEC = 60
+_NEVER = datetime.max.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class Job:
+    """A named recurring job.
+
+    action receives the dispatch time and returns the next due time, or None to
+    run again interval_sec after it started. interval_sec may be a callable that
+    is read at each use, for intervals that change at runtime (e.g. the
+    provider's poll interval). When the job is still running at its
+    provisional due time, overlap decides whether that run is dropped ("skip") or
+    started as soon as the current one finishes ("queue").
+    """
+
+    name: str
+    action: Callable[[datetime], Awaitable[datetime | None]]
+    interval_sec: float | Callable[[], float]
+    jitter_sec: float = 0
+    max_runtime_sec: float | None = None
+    overlap: str = OVERLAP_SKIP
+    lane: str | None = None
+    next_due: datetime | None = None
+    running: bool = False
+    queued_run: bool = False
+    last_due_utc: datetime | None = None
+    last_started_utc: datetime | None = None
+    last_lateness_sec: float | None = None
+    last_finished_utc: datetime | None = None
+    last_duration_sec: float | None = None
+    last_error: str | None = None
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    overruns: int = 0
+    _generation: int = field(default=0, repr=False)
+
+    def __post_init__(self):
+        self.interval()
+        if self.overlap not in _OVERLAP_POLICIES:
+            raise ValueError(f"Job {self.name!r} overlap must be one of {sorted(_OVERLAP_POLICIES)}.")
+        self.lane = self.lane or self.name
+
+    def interval(self) -> float:
+        interval = self.interval_sec() if callable(self.interval_sec) else self.interval_sec
+        if interval <= 0:
+            raise ValueError(f"Job {self.name!r} interval_sec must be > 0.")
+        return interval
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "lane": self.lane,
+            "next_due_utc": self.next_due,
+            "running": self.running,
+            "interval_sec": self.interval(),
+            "last_due_utc": self.last_due_utc,
+            "last_started_utc": self.last_started_utc,
+            "last_lateness_sec": self.last_lateness_sec,
+            "last_finished_utc": self.last_finished_utc,
+            "last_duration_sec": self.last_duration_sec,
+            "last_error": self.last_error,
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "overruns": self.overruns,
+        }
+
+
+class JobScheduler:
+    """Priority queue of named jobs dispatched onto per-lane asyncio tasks."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._jobs: dict[str, Job] = {}
+        self._heap: list[tuple[datetime, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._busy_lanes: set[str] = set()
+        self._lane_waiting: dict[str, list[str]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._wakeup: asyncio.Event | None = None
+
+    def register(self, job: Job, *, first_due: datetime | None = None) -> Job:
+        """Add or replace a job; it first runs at first_due (default: now)."""
+        previous = self._jobs.get(job.name)
+        if previous is not None:
+            job._generation = previous._generation + 1
+        self._jobs[job.name] = job
+        self._push(job, first_due or utc_now())
+        return job
+
+    def unregister(self, name: str) -> None:
+        job = self._jobs.pop(name, None)
+        if job is not None:
+            job._generation += 1
+            task = self._tasks.pop(name, None)
+            if task is not None and not task.done():
+                task.cancel()
+        self._wake()
+
+    def reschedule(self, name: str, due: datetime) -> None:
+        """Move a job's next run, e.g. to run it now."""
+        job = self._jobs.get(name)
+        if job is not None and not job.running:
+            self._push(job, due)
+
+    def get_job(self, name: str) -> Job | None:
+        return self._jobs.get(name)
+
+    def upcoming(self, limit: int | None = None) -> list[dict]:
+        """Registered jobs ordered by next due time (running jobs first)."""
+        jobs = sorted(
+            self._jobs.values(),
+            key=lambda job: (not job.running, job.next_due or _NEVER),
+        )
+        return [job.describe() for job in jobs[:limit]]
+
+    def _push(self, job: Job, due: datetime) -> None:
+        job._generation += 1
+        job.next_due = due
+        heapq.heappush(self._heap, (due, next(self._sequence), job.name, job._generation))
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _jittered(self, job: Job, due: datetime) -> datetime:
+        if job.jitter_sec > 0:
+            return due + timedelta(seconds=random.uniform(0, job.jitter_sec))
+        return due
+
+    def _pop_due(self, now: datetime) -> list[Job]:
+        due_jobs = []
+        while self._heap and self._heap[0][0] <= now:
+            _due, _seq, name, generation = heapq.heappop(self._heap)
+            job = self._jobs.get(name)
+            if job is None or job._generation != generation:
+                continue
+            due_jobs.append(job)
+        return due_jobs
+
+    def _dispatch(self, job: Job, now: datetime) -> None:
+        if job.running:
+            if job.overlap == OVERLAP_QUEUE:
+                job.queued_run = True
+            else:
+                job.skipped += 1
+                # Counted in job.skipped; a long cycle would otherwise log on every due time.
+                logger.debug("Job %s is still running at its next due time; skipping that run.", job.name)
+                self._push(job, self._jittered(job, now + timedelta(seconds=job.interval())))
+            return
+        if job.lane in self._busy_lanes:
+            waiting = self._lane_waiting.setdefault(job.lane, [])
+            if job.name not in waiting:
+                waiting.append(job.name)
+            return
+        self._start(job, now)
+
+    def _start(self, job: Job, now: datetime) -> None:
+        job.running = True
+        job.queued_run = False
+        job.last_due_utc = job.next_due or now
+        job.last_started_utc = now
+        job.last_lateness_sec = round(max(0.0, (now - job.last_due_utc).total_seconds()), 3)
+        self._busy_lanes.add(job.lane)
+        # Provisional next run; planned jobs replace it when they finish.
+        self._push(job, self._jittered(job, now + timedelta(seconds=job.interval())))
+        self._tasks[job.name] = asyncio.create_task(self._run_job(job, now), name=f"job:{job.name}")
+
+    async def _run_job(self, job: Job, started: datetime) -> None:
+        next_due = None
+        try:
+            if job.max_runtime_sec:
+                next_due = await asyncio.wait_for(job.action(started), timeout=job.max_runtime_sec)
+            else:
+                next_due = await job.action(started)
+            job.last_error = None
+        except asyncio.TimeoutError:
+            job.timeouts += 1
+            job.last_error = f"exceeded max runtime of {job.max_runtime_sec}s"
+            logger.error("Job %s exceeded its max runtime of %ss and was cancelled.", job.name, job.max_runtime_sec)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            logger.error("Job %s failed: %s", job.name, e, exc_info=True)
+        finally:
+            finished = utc_now()
+            job.runs += 1
+            job.running = False
+            job.last_finished_utc = finished
+            job.last_duration_sec = round((finished - started).total_seconds(), 3)
+            metrics.job_seconds.observe(job.last_duration_sec, job=job.name)
+            if job.last_duration_sec > job.interval():
+                job.overruns += 1
+            self._busy_lanes.discard(job.lane)
+            self._tasks.pop(job.name, None)
+
+        if self._jobs.get(job.name) is not job:
+            self._wake()
+            return
+        if isinstance(next_due, datetime):
+            self._push(job, self._jittered(job, next_due))
+        elif job.queued_run:
+            self._push(job, finished)
+        self._wake()
+
+    def _start_waiting(self, now: datetime) -> None:
+        for lane, waiting in list(self._lane_waiting.items()):
+            while waiting and lane not in self._busy_lanes:
+                job = self._jobs.get(waiting.pop(0))
+                if job is not None and not job.running:
+                    self._start(job, now)
+            if not waiting:
+                self._lane_waiting.pop(lane, None)
+
+    async def run(self) -> None:
+        """Dispatch jobs forever; cancelling this task cancels the running jobs."""
+        self._wakeup = asyncio.Event()
+        logger.info("Job scheduler %s started with %d job(s).", self.name, len(self._jobs))
+        try:
+            while True:
+                self._wakeup.clear()
+                now = utc_now()
+                self._start_waiting(now)
+                for job in self._pop_due(now):
+                    self._dispatch(job, now)
+                timeout = _MAX_IDLE_SEC
+                if self._heap:
+                    timeout = min(timeout, max(0.0, (self._heap[0][0] - utc_now()).total_seconds()))
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0.05))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in list(self._tasks.values()):
+                task.cancel()
+            self._wakeup = None
@@ -0,0 +1,131 @@
+# modules/live_board.py
+# Optional consolidated live scoreboard. With operations.live_board_enabled every
+# live football line (and live tennis when live_board_include_tennis is set) is
+# shown in one rolling board message instead of one message per match. Each sport
+# loop hands over its current lines once per cycle; the board is edited only when
+# the rendered text changed, so a cycle costs at most one Discord write per board
+# part regardless of how many matches are live.
+
+import asyncio
+import logging
+
+from config import CHANNEL_ID, LIVE_BOARD_ENABLED, LIVE_BOARD_INCLUDE_TENNIS
+from modules.discord_poster import _split_content, delete_general_message, upsert_live_message
+from modules.storage import load, save_async
+
+logger = logging.getLogger(__name__)
+
+_BOARD_STATE_FILE = "live_board.json"
+_BOARD_HEADER = "📋 Live board"
+_BOARD_EMPTY_LINE = "No matches live right now."
+_SECTION_ORDER = ("football", "tennis")
+
+_sections: dict[str, dict[str, str]] = {}
+_board_message_ids: list[int] = []
+_published_parts: list[str] | None = None
+_state_loaded = False
+_publish_lock = asyncio.Lock()
+
+
+def is_enabled(sport: str = "football") -> bool:
+    """True when live updates for sport go to the board instead of per-match messages."""
+    if not LIVE_BOARD_ENABLED:
+        return False
+    return sport == "football" or (sport == "tennis" and LIVE_BOARD_INCLUDE_TENNIS)
+
+
+def _load_state_once() -> None:
+    global _state_loaded
+    if _state_loaded:
+        return
+    _state_loaded = True
+    data = load(_BOARD_STATE_FILE, {"message_ids": []})
+    ids = data.get("message_ids") if isinstance(data, dict) else None
+    _board_message_ids[:] = [int(mid) for mid in ids or [] if isinstance(mid, int) and not isinstance(mid, bool)]
+
+
+def set_section(sport: str, lines: dict[str, str]) -> None:
+    """Replace the live lines shown for sport; keys only fix the display order."""
+    _sections[sport] = {str(key): line for key, line in lines.items() if line}
+
+
+def render_board() -> str:
+    """Board text for the current sections, or an empty string when nothing is live."""
+    entries = []
+    for sport in _SECTION_ORDER:
+        lines = _sections.get(sport) or {}
+        entries.extend(lines[key] for key in sorted(lines))
+    if not entries:
+        return ""
+    return _BOARD_HEADER + "\n\n" + "\n\n".join(entries)
+
+
+async def _save_message_ids() -> None:
+    try:
+        await save_async(_BOARD_STATE_FILE, {"message_ids": list(_board_message_ids)})
+    except Exception:
+        logger.warning("live_board: could not persist board message IDs.", exc_info=True)
+
+
+async def publish(bot) -> bool:
+    """Bring the board message(s) in line with the current sections; True if Discord was written."""
+    global _published_parts
+    async with _publish_lock:
+        _load_state_once()
+        content = render_board()
+        if not content:
+            if not _board_message_ids:
+                return False
+            # Keep the board in place so the next live match edits it instead of posting.
+            content = f"{_BOARD_HEADER}\n\n{_BOARD_EMPTY_LINE}"
+        parts = _split_content(content)
+        if parts == _published_parts:
+            return False
+
+        previous_ids = list(_board_message_ids)
+        new_ids: list[int] = []
+        reposted = False
+        for index, part in enumerate(parts):
+            # Once one part had to be reposted below newer messages, later parts follow it
+            # so the board keeps reading top to bottom.
+            existing_id = previous_ids[index] if index < len(previous_ids) and not reposted else None
+            message = await upsert_live_message(
+                bot=bot,
+                channel_id=CHANNEL_ID,
+                message_id=existing_id,
+                content=part,
+            )
+            if message is None:
+                logger.warning(
+                    "live_board: board part %d/%d could not be written; retrying next cycle.",
+                    index + 1,
+                    len(parts),
+                )
+                _board_message_ids[:] = new_ids + previous_ids[len(new_ids):]
+                _published_parts = None
+                await _save_message_ids()
+                return bool(new_ids)
+            if message.id != existing_id:
+                reposted = True
+            new_ids.append(message.id)
+
+        # The board shrank: drop the trailing parts rather than leaving stale lines behind.
+        for stale_id in previous_ids[len(parts):]:
+            await delete_general_message(bot, CHANNEL_ID, stale_id)
+
+        _published_parts = parts
+        if new_ids != previous_ids:
+            _board_message_ids[:] = new_ids
+            await _save_message_ids()
+        entries = sum(len(lines) for lines in _sections.values())
+        logger.info("live_board: published %d part(s) with %d live entr%s.", len(parts), entries, "y" if entries == 1 else "ies")
+        return True
+
+
+def reset() -> None:
+    """Forget in-memory board state (tests and mode changes)."""
+    global _published_parts, _state_loaded
+    _sections.clear()
+    _board_message_ids.clear()
+    _published_parts = None
+    _state_loaded = False
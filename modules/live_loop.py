@@ -2,11 +2,13 @@
 
 import logging
 import asyncio
+import time
 from datetime import timedelta
 
 from config import CHANNEL_ID
-from modules import api_provider, match_lifecycle, match_state
+from modules import api_provider, live_board, match_lifecycle, match_state
 from modules.bot_mode import is_silent
+from modules.render_cache import football_renders, render_inputs
 from utils.time_utils import bot_now, utc_now
 from utils.event_formatter import (
     format_match_events,
@@ -32,6 +34,9 @@ _last_empty_live_log_at = None
 _MISSING_GRACE_SEC = 180
 _REGRESSION_CONFIRM_TICKS = 3
 _EMPTY_LIVE_LOG_INTERVAL = timedelta(minutes=30)
+# Live fixtures enriched and upserted at the same time within one cycle.
+_LIVE_FIXTURE_CONCURRENCY = 4
+_SLOW_LIVE_FIXTURE_SEC = 5.0
 
 
 def _render_live_line(
@@ -43,6 +48,31 @@ def _render_live_line(
     status_short: str,
     *,
     show_missing_warning: bool = False,
+) -> str:
+    inputs = {
+        "match": render_inputs(match),
+        "home": home,
+        "away": away,
+        "score": score,
+        "events": events,
+        "status_short": status_short,
+        "show_missing_warning": show_missing_warning,
+    }
+    return football_renders.render(
+        "live_line",
+        inputs,
+        lambda: _format_live_line(match, home, away, score, events, status_short, show_missing_warning),
+    )
+
+
+def _format_live_line(
+    match: dict,
+    home: str,
+    away: str,
+    score: dict,
+    events: list,
+    status_short: str,
+    show_missing_warning: bool,
 ) -> str:
     event_strings = format_match_events(events, home, away)
     completeness = event_completeness_note(score, events, show_warning=show_missing_warning)
@@ -163,10 +193,212 @@ def seed_already_posted(fixtures: list) -> None:
         logger.info(f"Seeded {count} in-progress match snapshot(s) into live_state_keys.")
 
 
+async def _process_live_fixture(bot, match: dict, now, now_utc, seen_live_ids: set[str], polled_at: float) -> None:
+    """Enrich, dedupe and upsert one live fixture; polled_at is the cycle's monotonic start."""
+    match_id = match_lifecycle.fixture_identity(match)
+    if match_id is None:
+        return
+    seen_live_ids.add(match_id)
+    _missing_since.pop(match_id, None)
+    if not is_tracked_for_ft(match_id):
+        track_match_for_ft(match, now_utc=now_utc)
+    else:
+        match_state.upsert_fixture_from_match(
+            match,
+            now_utc,
+            source=match.get("provider") or "espn",
+        )
+
+    if getattr(bot, "http_session", None) is not None:
+        try:
+            await api_provider.prelink_live_api_football_fixture(bot.http_session, match)
+        except Exception as exc:
+            logger.warning(
+                "Could not prelink API-Football fixture ID for live match %s: %s",
+                match_id,
+                exc,
+            )
+
+    # Enrich first so dedup key and outgoing message reflect final data.
+    enriched = await api_provider.enrich_fixture_events(bot.http_session, match)
+    enriched, pruned_goal_events = prune_goal_events_to_score(enriched)
+    if pruned_goal_events:
+        logger.info(
+            "Pruned %d surplus goal event(s) before live render for match %s.",
+            pruned_goal_events,
+            match_id,
+        )
+    enriched_id = match_lifecycle.fixture_identity(enriched)
+    if enriched_id is not None and enriched_id != match_id:
+        match_id = enriched_id
+        seen_live_ids.add(match_id)
+        _missing_since.pop(match_id, None)
+
+    home = enriched["teams"]["home"]["name"]
+    away = enriched["teams"]["away"]["name"]
+    score = enriched["goals"]
+    events = enriched.get("events", [])
+    elapsed = enriched.get("fixture", {}).get("status", {}).get("elapsed")
+    status_short = match_lifecycle.status_short(enriched)
+    event_status = api_provider.event_completeness_status(enriched)
+    show_missing_warning = event_status["status"] == api_provider.EVENTS_EXHAUSTED_MISSING
+    if event_status.get("score_key"):
+        match_state.update_event_completeness(
+            match_id,
+            event_status.get("score_key"),
+            event_status["status"],
+            event_status.get("missing_goals", 0),
+            now_utc=now_utc,
+        )
+    state_key = (
+        f"{match_id}_{status_short}_{score['home']}-{score['away']}_"
+        f"{len(events)}_{event_status['status']}"
+    )
+
+    previous_observed = _last_observed.get(match_id)
+    if previous_observed:
+        prev_home = previous_observed["home"]
+        prev_away = previous_observed["away"]
+        prev_elapsed = previous_observed.get("elapsed")
+        curr_home = int(score.get("home") or 0)
+        curr_away = int(score.get("away") or 0)
+        prev_total = prev_home + prev_away
+        curr_total = curr_home + curr_away
+        elapsed_regressed = (
+            isinstance(elapsed, int)
+            and isinstance(prev_elapsed, int)
+            and elapsed + 2 < prev_elapsed
+        )
+        score_regressed = curr_home < prev_home or curr_away < prev_away
+        if score_regressed or (elapsed_regressed and curr_total <= prev_total):
+            reason_parts = []
+            if score_regressed:
+                reason_parts.append("score")
+            if elapsed_regressed and curr_total <= prev_total:
+                reason_parts.append("elapsed")
+            regression_context = _regression_guard_context(
+                match_id=match_id,
+                previous_observed=previous_observed,
+                current_score={"home": curr_home, "away": curr_away},
+                current_elapsed=elapsed if isinstance(elapsed, int) else None,
+                current_events_count=len(events),
+                state_key=state_key,
+                reason=",".join(reason_parts),
+            )
+            hold = _regression_hold.get(match_id)
+            if hold and hold.get("state_key") == state_key:
+                hold["ticks"] += 1
+            else:
+                hold = {"state_key": state_key, "ticks": 1}
+            _regression_hold[match_id] = hold
+
+            if hold["ticks"] < _REGRESSION_CONFIRM_TICKS:
+                logger.info(
+                    f"Regression guard: holding match {match_id} state "
+                    f"{state_key} (tick {hold['ticks']}/{_REGRESSION_CONFIRM_TICKS}); "
+                    f"{regression_context}."
+                )
+                return
+
+            logger.warning(
+                f"Regression guard: accepting repeated regressive state for match {match_id} "
+                f"after {hold['ticks']} ticks; {regression_context}."
+            )
+        else:
+            _regression_hold.pop(match_id, None)
+
+    previous_state = live_state_keys.get(match_id)
+    if previous_state == state_key:
+        _last_observed[match_id] = {
+            "home": int(score.get("home") or 0),
+            "away": int(score.get("away") or 0),
+            "elapsed": elapsed if isinstance(elapsed, int) else None,
+            "events_count": len(events),
+        }
+        return
+
+    line_content = _render_live_line(
+        enriched,
+        home,
+        away,
+        score,
+        events,
+        status_short,
+        show_missing_warning=show_missing_warning,
+    )
+
+    last_sent = _last_sent_content.get(match_id)
+    if last_sent:
+        last_content, sent_at = last_sent
+        if last_content == line_content:
+            live_state_keys[match_id] = state_key
+            _last_observed[match_id] = {
+                "home": int(score.get("home") or 0),
+                "away": int(score.get("away") or 0),
+                "elapsed": elapsed if isinstance(elapsed, int) else None,
+                "events_count": len(events),
+            }
+            logger.info(
+                f"Text dedupe: suppressed repeated live content for match {match_id}; "
+                f"last sent at {sent_at.strftime('%H:%M:%S')}."
+            )
+            return
+
+    # In live board mode the board is rebuilt from _last_sent_content after the cycle.
+    board_line = live_board.is_enabled("football")
+    updated_message = None
+    if not board_line:
+        message_id = live_message_ids.get(match_id)
+        if message_id is None:
+            stored_state = match_state.get_fixture_state(match_id) or {}
+            message_id = stored_state.get("live_message_id")
+
+        updated_message = await upsert_live_message(
+            bot=bot,
+            channel_id=CHANNEL_ID,
+            message_id=message_id,
+            content=line_content,
+        )
+
+    if updated_message is not None or board_line:
+        if updated_message is not None:
+            live_message_ids[match_id] = updated_message.id
+            match_state.update_live_message_id(match_id, updated_message.id)
+        live_state_keys[match_id] = state_key
+        _last_sent_content[match_id] = (line_content, now)
+        _last_observed[match_id] = {
+            "home": int(score.get("home") or 0),
+            "away": int(score.get("away") or 0),
+            "elapsed": elapsed if isinstance(elapsed, int) else None,
+            "events_count": len(events),
+        }
+        safe_line_content = line_content.encode("ascii", "backslashreplace").decode("ascii")
+        logger.info(
+            f"Live update {'staged for the live board' if board_line else 'upserted'} for match {match_id} "
+            f"({time.monotonic() - polled_at:.2f}s after poll): {safe_line_content}"
+        )
+
+
+async def _publish_live_board(bot, seen_live_ids: set[str]) -> None:
+    """Hand this cycle's live lines to the board; one edit at most, and only on change."""
+    if not live_board.is_enabled("football"):
+        return
+    live_board.set_section("football", {
+        match_id: _last_sent_content[match_id][0]
+        for match_id in seen_live_ids
+        if match_id in _last_sent_content
+    })
+    try:
+        await live_board.publish(bot)
+    except Exception:
+        logger.exception("Live board update failed.")
+
+
 async def run_live_loop(bot, *, matches=None, now_utc=None):
     """
     Polls live fixtures, enriches event data before dedup checks, and then
-    upserts one live message per match. Also registers matches for FT checking.
+    upserts one live message per match (or one live board for all of them when
+    operations.live_board_enabled is set). Also registers matches for FT checking.
     """
     async with _live_loop_lock:
         if is_silent():
@@ -184,187 +416,45 @@ async def run_live_loop(bot, *, matches=None, now_utc=None):
             _log_empty_live_result(now, now_utc)
             _cleanup_missing_live_state(set(), now)
             prune_live_state(now_utc)
+            await _publish_live_board(bot, set())
             return
         _reset_empty_live_log_state()
 
-        seen_live_ids: set[str] = set()
-
+        groups: dict[str, list[dict]] = {}
         for match in matches:
             match_id = match_lifecycle.fixture_identity(match)
             if match_id is None:
                 continue
-            seen_live_ids.add(match_id)
-            _missing_since.pop(match_id, None)
-            if not is_tracked_for_ft(match_id):
-                track_match_for_ft(match, now_utc=now_utc)
-            else:
-                match_state.upsert_fixture_from_match(
-                    match,
-                    now_utc,
-                    source=match.get("provider") or "espn",
-                )
-
-            if getattr(bot, "http_session", None) is not None:
-                try:
-                    await api_provider.prelink_live_api_football_fixture(bot.http_session, match)
-                except Exception as exc:
-                    logger.warning(
-                        "Could not prelink API-Football fixture ID for live match %s: %s",
-                        match_id,
-                        exc,
-                    )
-
-            # Enrich first so dedup key and outgoing message reflect final data.
-            enriched = await api_provider.enrich_fixture_events(bot.http_session, match)
-            enriched, pruned_goal_events = prune_goal_events_to_score(enriched)
-            if pruned_goal_events:
-                logger.info(
-                    "Pruned %d surplus goal event(s) before live render for match %s.",
-                    pruned_goal_events,
-                    match_id,
-                )
-            enriched_id = match_lifecycle.fixture_identity(enriched)
-            if enriched_id is not None and enriched_id != match_id:
-                match_id = enriched_id
-                seen_live_ids.add(match_id)
-                _missing_since.pop(match_id, None)
-
-            home = enriched["teams"]["home"]["name"]
-            away = enriched["teams"]["away"]["name"]
-            score = enriched["goals"]
-            events = enriched.get("events", [])
-            elapsed = enriched.get("fixture", {}).get("status", {}).get("elapsed")
-            status_short = match_lifecycle.status_short(enriched)
-            event_status = api_provider.event_completeness_status(enriched)
-            show_missing_warning = event_status["status"] == api_provider.EVENTS_EXHAUSTED_MISSING
-            if event_status.get("score_key"):
-                match_state.update_event_completeness(
-                    match_id,
-                    event_status.get("score_key"),
-                    event_status["status"],
-                    event_status.get("missing_goals", 0),
-                    now_utc=now_utc,
-                )
-            state_key = (
-                f"{match_id}_{status_short}_{score['home']}-{score['away']}_"
-                f"{len(events)}_{event_status['status']}"
-            )
+            groups.setdefault(match_id, []).append(match)
 
-            previous_observed = _last_observed.get(match_id)
-            if previous_observed:
-                prev_home = previous_observed["home"]
-                prev_away = previous_observed["away"]
-                prev_elapsed = previous_observed.get("elapsed")
-                curr_home = int(score.get("home") or 0)
-                curr_away = int(score.get("away") or 0)
-                prev_total = prev_home + prev_away
-                curr_total = curr_home + curr_away
-                elapsed_regressed = (
-                    isinstance(elapsed, int)
-                    and isinstance(prev_elapsed, int)
-                    and elapsed + 2 < prev_elapsed
-                )
-                score_regressed = curr_home < prev_home or curr_away < prev_away
-                if score_regressed or (elapsed_regressed and curr_total <= prev_total):
-                    reason_parts = []
-                    if score_regressed:
-                        reason_parts.append("score")
-                    if elapsed_regressed and curr_total <= prev_total:
-                        reason_parts.append("elapsed")
-                    regression_context = _regression_guard_context(
-                        match_id=match_id,
-                        previous_observed=previous_observed,
-                        current_score={"home": curr_home, "away": curr_away},
-                        current_elapsed=elapsed if isinstance(elapsed, int) else None,
-                        current_events_count=len(events),
-                        state_key=state_key,
-                        reason=",".join(reason_parts),
-                    )
-                    hold = _regression_hold.get(match_id)
-                    if hold and hold.get("state_key") == state_key:
-                        hold["ticks"] += 1
-                    else:
-                        hold = {"state_key": state_key, "ticks": 1}
-                    _regression_hold[match_id] = hold
-
-                    if hold["ticks"] < _REGRESSION_CONFIRM_TICKS:
-                        logger.info(
-                            f"Regression guard: holding match {match_id} state "
-                            f"{state_key} (tick {hold['ticks']}/{_REGRESSION_CONFIRM_TICKS}); "
-                            f"{regression_context}."
-                        )
-                        continue
-
-                    logger.warning(
-                        f"Regression guard: accepting repeated regressive state for match {match_id} "
-                        f"after {hold['ticks']} ticks; {regression_context}."
-                    )
-                else:
-                    _regression_hold.pop(match_id, None)
-
-            previous_state = live_state_keys.get(match_id)
-            if previous_state == state_key:
-                _last_observed[match_id] = {
-                    "home": int(score.get("home") or 0),
-                    "away": int(score.get("away") or 0),
-                    "elapsed": elapsed if isinstance(elapsed, int) else None,
-                    "events_count": len(events),
-                }
-                continue
-
-            line_content = _render_live_line(
-                enriched,
-                home,
-                away,
-                score,
-                events,
-                status_short,
-                show_missing_warning=show_missing_warning,
-            )
-
-            last_sent = _last_sent_content.get(match_id)
-            if last_sent:
-                last_content, sent_at = last_sent
-                if last_content == line_content:
-                    live_state_keys[match_id] = state_key
-                    _last_observed[match_id] = {
-                        "home": int(score.get("home") or 0),
-                        "away": int(score.get("away") or 0),
-                        "elapsed": elapsed if isinstance(elapsed, int) else None,
-                        "events_count": len(events),
-                    }
-                    logger.info(
-                        f"Text dedupe: suppressed repeated live content for match {match_id}; "
-                        f"last sent at {sent_at.strftime('%H:%M:%S')}."
-                    )
-                    continue
-
-            message_id = live_message_ids.get(match_id)
-            if message_id is None:
-                stored_state = match_state.get_fixture_state(match_id) or {}
-                message_id = stored_state.get("live_message_id")
-
-            updated_message = await upsert_live_message(
-                bot=bot,
-                channel_id=CHANNEL_ID,
-                message_id=message_id,
-                content=line_content,
+        seen_live_ids: set[str] = set()
+        semaphore = asyncio.Semaphore(_LIVE_FIXTURE_CONCURRENCY)
+
+        cycle_started = time.monotonic()
+
+        async def process_group(group: list[dict]) -> None:
+            # Payloads for one fixture stay in order; different fixtures overlap.
+            async with semaphore:
+                for match in group:
+                    match_id = match_lifecycle.fixture_identity(match)
+                    try:
+                        await _process_live_fixture(bot, match, now, now_utc, seen_live_ids, cycle_started)
+                    except Exception:
+                        logger.exception("Live update failed for match %s.", match_id)
+                    latency = time.monotonic() - cycle_started
+                    log = logger.info if latency >= _SLOW_LIVE_FIXTURE_SEC else logger.debug
+                    log("Live fixture %s finished %.2fs after the live poll.", match_id, latency)
+
+        await asyncio.gather(*(process_group(group) for group in groups.values()))
+        if groups:
+            logger.debug(
+                "Live cycle processed %d fixture(s) in %.2fs (concurrency %d).",
+                len(groups),
+                time.monotonic() - cycle_started,
+                _LIVE_FIXTURE_CONCURRENCY,
             )
 
-            if updated_message is not None:
-                live_message_ids[match_id] = updated_message.id
-                match_state.update_live_message_id(match_id, updated_message.id)
-                live_state_keys[match_id] = state_key
-                _last_sent_content[match_id] = (line_content, now)
-                _last_observed[match_id] = {
-                    "home": int(score.get("home") or 0),
-                    "away": int(score.get("away") or 0),
-                    "elapsed": elapsed if isinstance(elapsed, int) else None,
-                    "events_count": len(events),
-                }
-                safe_line_content = line_content.encode("ascii", "backslashreplace").decode("ascii")
-                logger.info(f"Live update upserted for match {match_id}: {safe_line_content}")
-
         # Clean volatile live maps when a match is no longer live, after grace window.
         _cleanup_missing_live_state(seen_live_ids, now)
         prune_live_state(now_utc)
+        await _publish_live_board(bot, seen_live_ids)
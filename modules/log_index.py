@@ -0,0 +1,220 @@
+# modules/log_index.py
+# Per-minute sidecar index for the rotating application log. The file handler
+# appends one JSON line to <log>.idx whenever a minute closes: the byte range the
+# minute occupies plus its level and logger counts. Sidecars rotate with their
+# log, so "what happened between 21:40 and 21:55 yesterday" reads only the byte
+# ranges of those minutes. Bytes no index line covers (the still-open minute,
+# logs written before the index existed) are scanned instead.
+
+import json
+import logging
+import os
+import re
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from modules.log_reader import iter_log_paths
+
+INDEX_SUFFIX = ".idx"
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+_RECORD_RE = re.compile(rb"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] \[([A-Z]+)\s*\] \[(\S+?)\s*\]")
+_MINUTE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2})$")
+
+
+def index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+class IndexedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that also maintains the per-minute sidecar index."""
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._block: dict | None = None
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self._count(record)
+            logging.FileHandler.emit(self, record)
+        except Exception:
+            self.handleError(record)
+
+    def _count(self, record) -> None:
+        converter = getattr(self.formatter, "converter", time.localtime)
+        minute = time.strftime("%Y-%m-%d %H:%M", converter(record.created))
+        if self._block is None or self._block["minute"] != minute:
+            self._close_block()
+            self._block = {"minute": minute, "start": self.stream.tell(), "levels": {}, "modules": {}}
+        levels = self._block["levels"]
+        modules = self._block["modules"]
+        levels[record.levelname] = levels.get(record.levelname, 0) + 1
+        modules[record.name] = modules.get(record.name, 0) + 1
+
+    def _close_block(self) -> None:
+        block, self._block = self._block, None
+        if block is None or self.stream is None:
+            return
+        self.stream.flush()
+        block["end"] = self.stream.tell()
+        if block["end"] <= block["start"]:
+            return
+        line = json.dumps(block, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(index_path(Path(self.baseFilename)), "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def doRollover(self):
+        self._close_block()
+        if self.backupCount > 0:
+            # Mirror RotatingFileHandler: bot.log.idx -> bot.log.1.idx -> ... -> bot.log.N.idx.
+            for i in range(self.backupCount - 1, -1, -1):
+                source = f"{self.baseFilename}.{i}" if i else self.baseFilename
+                target = Path(f"{self.baseFilename}.{i + 1}{INDEX_SUFFIX}")
+                if os.path.exists(source + INDEX_SUFFIX):
+                    os.replace(source + INDEX_SUFFIX, target)
+                else:
+                    target.unlink(missing_ok=True)
+        super().doRollover()
+
+    def close(self):
+        self.acquire()
+        try:
+            self._close_block()
+        except Exception:
+            pass
+        finally:
+            self.release()
+        super().close()
+
+
+def parse_minute(value: str) -> str:
+    """Normalize 'YYYY-MM-DD HH:MM' (or the HTML 'T' form) to 'YYYY-MM-DD HH:MM'."""
+    m = _MINUTE_RE.fullmatch(str(value or "").strip())
+    if not m:
+        raise ValueError("Times must look like YYYY-MM-DD HH:MM.")
+    return f"{m.group(1)} {m.group(2)}"
+
+
+def _read_index(log_path: Path, size: int) -> list[dict]:
+    blocks = []
+    try:
+        with index_path(log_path).open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    block = json.loads(line)
+                    start, end = int(block["start"]), int(block["end"])
+                except (ValueError, KeyError, TypeError):
+                    # A torn last line while the bot is writing.
+                    continue
+                blocks.append({**block, "start": start, "end": end})
+    except FileNotFoundError:
+        return []
+    if any(block["end"] > size for block in blocks):
+        # The log was truncated or replaced underneath its index.
+        return []
+    return sorted(blocks, key=lambda block: block["start"])
+
+
+def _segments(log_path: Path, size: int) -> list[dict]:
+    """Cover [0, size) with indexed blocks and unindexed gaps (minute None)."""
+    segments = []
+    position = 0
+    for block in _read_index(log_path, size):
+        if block["start"] < position:
+            continue
+        if block["start"] > position:
+            segments.append({"minute": None, "start": position, "end": block["start"]})
+        segments.append(block)
+        position = block["end"]
+    if position < size:
+        segments.append({"minute": None, "start": position, "end": size})
+    return segments
+
+
+def _block_may_match(block: dict, first: str, last: str, min_level: int, module: str | None) -> bool:
+    if block["minute"] is None:
+        return True
+    if not first <= block["minute"] <= last:
+        return False
+    if min_level and not any(_LEVELS.get(level, 0) >= min_level for level in block.get("levels", {})):
+        return False
+    if module and not any(name.startswith(module) for name in block.get("modules", {})):
+        return False
+    return True
+
+
+def _read_records(f, start: int, end: int) -> list[list]:
+    """Records in [start, end) as (timestamp, level, logger, text); continuation lines stay with their record."""
+    f.seek(start)
+    data = f.read(end - start)
+    records = []
+    for raw in data.split(b"\n"):
+        m = _RECORD_RE.match(raw)
+        if m:
+            records.append([m.group(1), m.group(2), m.group(3), [raw]])
+        elif records and raw:
+            records[-1][3].append(raw)
+    return records
+
+
+def search_logs(
+    base_path: Path,
+    *,
+    start: str,
+    end: str,
+    min_level: str | None = None,
+    module: str | None = None,
+    limit: int = 300,
+) -> dict:
+    """
+    Return log lines between two 'YYYY-MM-DD HH:MM' minutes (inclusive), oldest
+    first, keeping the newest `limit` matching records.
+    """
+    first, last = parse_minute(start), parse_minute(end)
+    if last < first:
+        raise ValueError("The end time is before the start time.")
+    level_floor = _LEVELS.get((min_level or "").upper(), 0)
+    first_ts, last_ts = f"{first}:00".encode(), f"{last}:59".encode()
+    name_prefix = module.encode() if module else None
+
+    matched: list[list[bytes]] = []
+    bytes_read = 0
+    truncated = False
+    for path in reversed(iter_log_paths(base_path)):
+        try:
+            with path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                segments = _segments(path, size)
+                for segment in reversed(segments):
+                    if not _block_may_match(segment, first, last, level_floor, module):
+                        continue
+                    bytes_read += segment["end"] - segment["start"]
+                    records = _read_records(f, segment["start"], segment["end"])
+                    for ts, level, name, lines in reversed(records):
+                        if not first_ts <= ts <= last_ts:
+                            continue
+                        if level_floor and _LEVELS.get(level.decode(), 0) < level_floor:
+                            continue
+                        if name_prefix and not name.startswith(name_prefix):
+                            continue
+                        if len(matched) >= limit:
+                            truncated = True
+                            break
+                        matched.append(lines)
+                    if truncated:
+                        break
+        except FileNotFoundError:
+            continue
+        if truncated:
+            break
+        oldest = next((segment for segment in segments if segment["minute"] is not None), None)
+        if segments and segments[0] is oldest and oldest["minute"] < first:
+            # Everything in older rotations predates the range.
+            break
+
+    lines = [raw.rstrip(b"\r").decode("utf-8", errors="replace") for record in reversed(matched) for raw in record]
+    return {"lines": lines, "truncated": truncated, "bytes_read": bytes_read}
@@ -0,0 +1,91 @@
+# modules/log_reader.py
+# Newest-first reads of the rotating application log. Files are read in fixed-size
+# blocks seeking back from the end, so the dashboard log view and !log exports
+# cost the same on a 10 MB log as on a 10 KB one: callers filter lines as they
+# stream and stop once they have enough.
+
+import re
+from pathlib import Path
+from typing import Iterator
+
+_BLOCK_SIZE = 64 * 1024
+
+
+def iter_lines_reversed(path: Path, *, block_size: int = _BLOCK_SIZE) -> Iterator[str]:
+    """Yield the lines of path from last to first, without line endings."""
+    with path.open("rb") as f:
+        for _offset, raw in _iter_raw_reversed(f, f.seek(0, 2), block_size):
+            yield _decode(raw)
+
+
+def iter_offset_lines_reversed(f, end: int, *, block_size: int = _BLOCK_SIZE) -> Iterator[tuple[int, str]]:
+    """
+    Yield (offset, line) for the lines of an open binary file that end before
+    byte `end`, last to first. Passing a yielded offset back as `end` resumes
+    just above that line.
+    """
+    for offset, raw in _iter_raw_reversed(f, end, block_size):
+        yield offset, _decode(raw)
+
+
+def _iter_raw_reversed(f, end: int, block_size: int) -> Iterator[tuple[int, bytes]]:
+    position = end
+    remainder = b""
+    at_end = True
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        f.seek(position)
+        buffer = f.read(read_size) + remainder
+        parts = buffer.split(b"\n")
+        # The first part may continue in the previous block.
+        remainder = parts.pop(0)
+        offset = position + len(buffer)
+        if at_end and parts and parts[-1] == b"":
+            parts.pop()
+            offset -= 1
+        at_end = False
+        for raw in reversed(parts):
+            offset -= len(raw)
+            yield offset, raw
+            offset -= 1
+    if remainder or not at_end:
+        yield 0, remainder
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def iter_log_paths(base_path: Path) -> list[Path]:
+    """
+    Return log files in chronological order:
+    bot.log.N (highest N -> oldest first) ... bot.log.1 ... bot.log (current).
+    """
+    parent = base_path.parent
+    base_name = base_path.name
+    candidates = [p for p in parent.glob(f"{base_name}*") if p.is_file()]
+
+    rotated: list[tuple[int, Path]] = []
+    current: list[Path] = []
+    for path in candidates:
+        if path.name == base_name:
+            current.append(path)
+            continue
+        m = re.match(rf"^{re.escape(base_name)}\.(\d+)$", path.name)
+        if m:
+            rotated.append((int(m.group(1)), path))
+
+    rotated.sort(key=lambda t: t[0], reverse=True)
+    ordered = [p for _, p in rotated] + current
+    return ordered
+
+
+def iter_log_lines_reversed(base_path: Path, *, block_size: int = _BLOCK_SIZE) -> Iterator[str]:
+    """Yield lines across the current and rotated log files, newest first."""
+    for path in reversed(iter_log_paths(base_path)):
+        try:
+            yield from iter_lines_reversed(path, block_size=block_size)
+        except FileNotFoundError:
+            # Rotated away between listing and opening.
+            continue
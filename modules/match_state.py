@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Callable
 
 from modules import match_lifecycle
-from modules.storage import BOT_MEMORY_DIR
+from modules.storage import BOT_MEMORY_DIR, encode_json, load_json_path
 from utils.time_utils import parse_provider_utc
 
 logger = logging.getLogger(__name__)
@@ -65,7 +65,7 @@ def load_match_state(memory_dir: Path | None = None) -> dict:
     with _state_lock:
         path = _state_path(memory_dir)
         try:
-            return _normalize_state(json.loads(path.read_text(encoding="utf-8")))
+            return _normalize_state(load_json_path(path))
         except FileNotFoundError:
             return _default_state()
         except json.JSONDecodeError as e:
@@ -80,10 +80,7 @@ def save_match_state(state: dict, memory_dir: Path | None = None) -> None:
         target = _state_path(memory_dir)
         tmp = target_dir / f"{MATCH_STATE_FILE}.{uuid.uuid4().hex}.tmp"
         try:
-            tmp.write_text(
-                json.dumps(_normalize_state(state), indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
+            tmp.write_bytes(encode_json(_normalize_state(state), ensure_ascii=False, compact=True, sort_keys=True))
             os.replace(tmp, target)
         except Exception:
             try:
@@ -139,7 +136,7 @@ def _merge_fixture_records(canonical_id: str, canonical: dict, duplicate: dict)
         **(canonical.get("provider_ids") if isinstance(canonical.get("provider_ids"), dict) else {}),
     }
 
-    for flag in ("ft_announced", "memory_updated"):
+    for flag in ("ft_announced", "memory_updated", "memory_update_failed"):
         canonical[flag] = bool(canonical.get(flag)) or bool(duplicate.get(flag))
 
     if canonical.get("live_message_id") is None and duplicate.get("live_message_id") is not None:
@@ -328,6 +325,18 @@ def mark_memory_updated(fixture_id, memory_dir: Path | None = None) -> None:
     update_match_state(mutator, memory_dir=memory_dir)
 
 
+def mark_memory_update_failed(fixture_id, attempts: int, memory_dir: Path | None = None) -> None:
+    """Record that the memory queue gave up on fixture_id so FT processing stops re-queueing it."""
+    mid = str(fixture_id)
+
+    def mutator(state: dict) -> None:
+        fixture = state["fixtures"].setdefault(mid, {"fixture_id": mid})
+        fixture["memory_update_failed"] = True
+        fixture["memory_update_attempts"] = attempts
+
+    update_match_state(mutator, memory_dir=memory_dir)
+
+
 def update_live_message_id(fixture_id, message_id: int | None, memory_dir: Path | None = None) -> None:
     mid = str(fixture_id)
 
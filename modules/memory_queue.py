@@ -0,0 +1,220 @@
+# modules/memory_queue.py
+# Durable work queue between FT processing and football memory. The FT path only
+# records the canonical fixture ID and its final snapshot in
+# bot_memory/football_memory_queue.json; a background worker applies queued
+# fixtures in batches (one football_memory.json write per batch) and only then
+# marks memory_updated in match_state. Entries survive restarts until applied.
+
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from modules import match_state
+from modules.football_memory import update_matches_in_memory
+from modules.storage import BOT_MEMORY_DIR, load_json_path, save_json_path_async
+from utils.time_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+QUEUE_FILE = "football_memory_queue.json"
+QUEUE_VERSION = 1
+_MAX_BATCH = 10
+_MAX_ATTEMPTS = 5
+# The worker also rechecks on this interval so failed batches are retried.
+_IDLE_RECHECK_SEC = 300
+# Results that retrying the same snapshot cannot change; FT processing re-enqueues
+# a newer snapshot if the fixture is still in the window.
+_DROP_REASONS = {"not_ft", "missing_required_data"}
+
+_queue_lock = asyncio.Lock()
+_drain_lock = asyncio.Lock()
+_wakeup: asyncio.Event | None = None
+_worker_task: asyncio.Task | None = None
+_stats = {"enqueued": 0, "batches": 0, "applied": 0, "dropped": 0, "failed": 0, "last_batch_at": None}
+
+
+def _queue_path(memory_dir: Path | None = None) -> Path:
+    return (memory_dir or BOT_MEMORY_DIR) / QUEUE_FILE
+
+
+def _load_items(memory_dir: Path | None = None) -> dict:
+    try:
+        raw = load_json_path(_queue_path(memory_dir))
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error("memory_queue: could not read %s (%s); treating queue as empty.", QUEUE_FILE, e)
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != QUEUE_VERSION or not isinstance(raw.get("items"), dict):
+        logger.warning("memory_queue: ignoring unsupported queue file %s.", QUEUE_FILE)
+        return {}
+    return {
+        str(fixture_id): item
+        for fixture_id, item in raw["items"].items()
+        if isinstance(item, dict) and isinstance(item.get("snapshot"), dict)
+    }
+
+
+async def _save_items(items: dict, memory_dir: Path | None = None) -> None:
+    await save_json_path_async(
+        _queue_path(memory_dir),
+        {"version": QUEUE_VERSION, "items": items},
+        ensure_ascii=False,
+        compact=True,
+    )
+
+
+def _wake() -> None:
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def enqueue(
+    fixture_id: str,
+    snapshot: dict,
+    *,
+    now_utc: datetime | None = None,
+    memory_dir: Path | None = None,
+) -> None:
+    """Durably queue a fixture's FT snapshot; a queued snapshot for the same fixture is replaced.
+
+    The replacement keeps the failed-attempt count, so a fixture whose snapshot
+    keeps changing still hits _MAX_ATTEMPTS.
+    """
+    fixture_id = str(fixture_id)
+    async with _queue_lock:
+        items = _load_items(memory_dir)
+        existing = items.get(fixture_id)
+        if existing is not None and existing.get("snapshot") == snapshot:
+            return
+        items[fixture_id] = {
+            "snapshot": snapshot,
+            "enqueued_at": (now_utc or utc_now()).isoformat(),
+            "attempts": int((existing or {}).get("attempts") or 0),
+        }
+        await _save_items(items, memory_dir)
+        _stats["enqueued"] += 1
+    logger.info("memory_queue: queued football memory update for fixture %s.", fixture_id)
+    _wake()
+
+
+def is_queued(fixture_id: str, memory_dir: Path | None = None) -> bool:
+    return str(fixture_id) in _load_items(memory_dir)
+
+
+def queued_count(memory_dir: Path | None = None) -> int:
+    return len(_load_items(memory_dir))
+
+
+async def drain(session, *, memory_dir: Path | None = None, max_batch: int = _MAX_BATCH) -> dict:
+    """Apply every queued fixture once, in batches; failures stay queued for the next pass."""
+    async with _drain_lock:
+        return await _drain(session, memory_dir, max_batch)
+
+
+async def _drain(session, memory_dir: Path | None, max_batch: int) -> dict:
+    totals = {"applied": 0, "dropped": 0, "failed": 0}
+    attempted: set[str] = set()
+    while True:
+        async with _queue_lock:
+            items = _load_items(memory_dir)
+        batch = [
+            (fixture_id, item)
+            for fixture_id, item in items.items()
+            if fixture_id not in attempted
+        ][:max_batch]
+        if not batch:
+            return totals
+        attempted.update(fixture_id for fixture_id, _item in batch)
+
+        try:
+            results = await update_matches_in_memory(session, [item["snapshot"] for _fixture_id, item in batch])
+        except Exception as e:
+            logger.error("memory_queue: batch of %d fixture(s) failed; will retry: %s", len(batch), e, exc_info=True)
+            results = [{"updated": False, "reason": "failed_exception"}] * len(batch)
+
+        counts = {"applied": 0, "dropped": 0, "failed": 0}
+        async with _queue_lock:
+            items = _load_items(memory_dir)
+            for (fixture_id, item), result in zip(batch, results):
+                current = items.get(fixture_id)
+                # A newer snapshot queued meanwhile stays for the next batch.
+                superseded = current is None or current.get("snapshot") != item["snapshot"]
+                if result.get("updated"):
+                    match_state.mark_memory_updated(fixture_id, memory_dir=memory_dir)
+                    counts["applied"] += 1
+                    if not superseded:
+                        items.pop(fixture_id, None)
+                elif result.get("reason") in _DROP_REASONS:
+                    logger.warning(
+                        "memory_queue: dropping fixture %s from the memory queue: %s.",
+                        fixture_id,
+                        result.get("reason"),
+                    )
+                    counts["dropped"] += 1
+                    if not superseded:
+                        items.pop(fixture_id, None)
+                else:
+                    counts["failed"] += 1
+                    if current is not None:
+                        # Counted even when superseded: a newer snapshot is a retry, not a fresh start.
+                        current["attempts"] = int(current.get("attempts") or 0) + 1
+                        if current["attempts"] >= _MAX_ATTEMPTS:
+                            logger.error(
+                                "memory_queue: giving up on fixture %s after %d attempts.",
+                                fixture_id,
+                                current["attempts"],
+                            )
+                            items.pop(fixture_id, None)
+                            # Recorded so the FT path does not queue it again from scratch.
+                            match_state.mark_memory_update_failed(
+                                fixture_id, current["attempts"], memory_dir=memory_dir
+                            )
+            await _save_items(items, memory_dir)
+
+        for key, count in counts.items():
+            totals[key] += count
+            _stats[key] += count
+        _stats["batches"] += 1
+        _stats["last_batch_at"] = utc_now().isoformat()
+        logger.info(
+            "memory_queue: applied batch of %d fixture(s) (%d updated, %d dropped, %d failed).",
+            len(batch),
+            counts["applied"],
+            counts["dropped"],
+            counts["failed"],
+        )
+
+
+async def _run_worker(bot) -> None:
+    global _wakeup
+    _wakeup = asyncio.Event()
+    _wakeup.set()
+    while True:
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=_IDLE_RECHECK_SEC)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+        try:
+            await drain(getattr(bot, "http_session", None))
+        except Exception:
+            logger.exception("memory_queue: worker pass failed.")
+
+
+def start_worker(bot) -> asyncio.Task:
+    """Start the background memory worker once; it drains anything left from a previous run."""
+    global _worker_task
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.create_task(_run_worker(bot), name="football-memory-queue")
+        logger.info("memory_queue: worker started.")
+    return _worker_task
+
+
+def get_status(memory_dir: Path | None = None) -> dict:
+    return {
+        "queued": queued_count(memory_dir),
+        "worker_running": _worker_task is not None and not _worker_task.done(),
+        **_stats,
+    }
@@ -0,0 +1,107 @@
+# modules/message_tracker.py
+# In-memory index of the newest message IDs per channel, fed by gateway events and
+# our own sends, so live upserts can tell whether a message is still near the
+# bottom of the channel without paging through channel history.
+
+import bisect
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelMessageTracker:
+    """Newest-N message IDs per channel; answers recency from memory once synced.
+
+    A channel becomes synced after one history fetch (`seed`). From then on every
+    create/delete is applied from gateway events, so the stored IDs are always the
+    exact newest messages. A gateway gap (`invalidate`) drops that guarantee and the
+    next lookup falls back to history again.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("ChannelMessageTracker capacity must be >= 1.")
+        self.capacity = int(capacity)
+        self._channels: dict[int, dict] = {}
+        self._stats = {"memory_hits": 0, "history_fetches": 0, "invalidations": 0}
+
+    def _state(self, channel_id: int) -> dict | None:
+        return self._channels.get(int(channel_id))
+
+    def begin_sync(self, channel_id: int) -> None:
+        """Start buffering events for a channel whose history is about to be fetched."""
+        state = self._state(channel_id)
+        if state is None or not state["synced"]:
+            self._channels[int(channel_id)] = {"ids": [], "deleted": set(), "synced": False, "complete": False}
+
+    def seed(self, channel_id: int, history_ids, *, complete: bool) -> None:
+        """Merge a newest-first history page with events seen while it was fetched."""
+        state = self._state(channel_id)
+        if state is None:
+            self.begin_sync(channel_id)
+            state = self._state(channel_id)
+        merged = (set(history_ids) | set(state["ids"])) - state["deleted"]
+        state["ids"] = sorted(merged)[-self.capacity:]
+        state["deleted"] = set()
+        state["synced"] = True
+        state["complete"] = bool(complete) and len(merged) <= self.capacity
+        self._stats["history_fetches"] += 1
+
+    def record(self, channel_id: int, message_id: int) -> None:
+        """Apply a new message (gateway event or our own send) to a tracked channel."""
+        state = self._state(channel_id)
+        if state is None:
+            return
+        ids = state["ids"]
+        message_id = int(message_id)
+        index = bisect.bisect_left(ids, message_id)
+        if index < len(ids) and ids[index] == message_id:
+            return
+        ids.insert(index, message_id)
+        if len(ids) > self.capacity:
+            del ids[: len(ids) - self.capacity]
+            state["complete"] = False
+
+    def forget(self, channel_id: int, message_ids) -> None:
+        """Apply deletions; older messages shift into the window only as far as we know them."""
+        state = self._state(channel_id)
+        if state is None:
+            return
+        removed = {int(message_id) for message_id in message_ids}
+        if not state["synced"]:
+            state["deleted"].update(removed)
+        state["ids"] = [message_id for message_id in state["ids"] if message_id not in removed]
+
+    def invalidate(self, channel_id: int | None = None) -> None:
+        """Forget synced state after a gateway gap, when create/delete events may be missing."""
+        if channel_id is None:
+            dropped = len(self._channels)
+            self._channels.clear()
+        else:
+            dropped = 1 if self._channels.pop(int(channel_id), None) is not None else 0
+        if dropped:
+            self._stats["invalidations"] += dropped
+            logger.info("message_tracker: invalidated %d channel index(es); next lookup reads history.", dropped)
+
+    def is_recent(self, channel_id: int, message_id: int, limit: int) -> bool | None:
+        """True/False when memory knows whether message_id is within the newest limit; None if unknown."""
+        state = self._state(channel_id)
+        if state is None or not state["synced"] or limit <= 0:
+            return None
+        ids = state["ids"]
+        message_id = int(message_id)
+        index = bisect.bisect_left(ids, message_id)
+        if index < len(ids) and ids[index] == message_id:
+            self._stats["memory_hits"] += 1
+            return len(ids) - index <= limit
+        if len(ids) >= limit or state["complete"]:
+            self._stats["memory_hits"] += 1
+            return False
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "channels": sum(1 for state in self._channels.values() if state["synced"]),
+            "capacity": self.capacity,
+            **self._stats,
+        }
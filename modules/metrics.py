@@ -0,0 +1,240 @@
+# modules/metrics.py
+# Small in-process metrics registry: counters, gauges and fixed-bucket histograms
+# rendered in the Prometheus text format. The bot publishes a snapshot of its
+# registry next to the dashboard health file; the dashboard serves both
+# processes' metrics on /metrics for a local scraper. Recording is a dict update
+# under a lock, cheap enough for every HTTP request, Discord call and state write.
+
+import math
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterable
+
+import aiohttp
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, registry: "Registry", name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = registry._lock
+        self._values: dict[tuple, object] = {}
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"Metric {self.name} takes labels {self.labels}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _samples(self) -> list[dict]:
+        return [
+            {"labels": dict(zip(self.labels, key)), "value": value}
+            for key, value in self._values.items()
+        ]
+
+    def describe(self) -> dict:
+        with self._lock:
+            return {"type": self.kind, "help": self.help, "samples": self._samples()}
+
+
+class Counter(_Metric):
+    kind = COUNTER
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = GAUGE
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    kind = HISTOGRAM
+
+    def __init__(self, registry, name, help_text, labels=(), *, buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(registry, name, help_text, labels)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+            entry["counts"][index] += 1
+            entry["sum"] += value
+            entry["count"] += 1
+
+    def _samples(self) -> list[dict]:
+        return [
+            {"labels": dict(zip(self.labels, key)), "counts": list(entry["counts"]), "sum": entry["sum"], "count": entry["count"]}
+            for key, entry in self._values.items()
+        ]
+
+    def describe(self) -> dict:
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name, help_text, labels, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(self, name, help_text, labels, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}.")
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str, labels: Iterable[str] = (), *, buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labels, buckets=buckets)
+
+    def snapshot(self) -> dict:
+        """JSON-safe copy of every metric, for publishing across processes."""
+        return {name: metric.describe() for name, metric in sorted(self._metrics.items())}
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "mvb_http_requests_total", "Outbound HTTP requests by provider and outcome.", ("provider", "outcome")
+)
+http_seconds = registry.histogram(
+    "mvb_http_request_seconds", "Outbound HTTP request latency until response headers.", ("provider",)
+)
+job_seconds = registry.histogram(
+    "mvb_job_seconds",
+    "Operations job run duration (football and tennis cycles, health, notices).",
+    ("job",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+discord_seconds = registry.histogram(
+    "mvb_discord_call_seconds", "Discord send/edit/delete call duration, excluding queue wait.", ("priority", "outcome")
+)
+cache_lookups = registry.counter(
+    "mvb_cache_lookups_total", "Render and response cache lookups by result.", ("cache", "result")
+)
+storage_write_seconds = registry.histogram(
+    "mvb_storage_write_seconds",
+    "Atomic fsynced state-file writes.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+dashboard_request_seconds = registry.histogram(
+    "mvb_dashboard_request_seconds", "Dashboard HTTP request handling time by route.", ("route",)
+)
+dashboard_password_seconds = registry.histogram(
+    "mvb_dashboard_password_seconds", "Dashboard scrypt work (login, add, change) including pool queue wait.", ("operation",)
+)
+dashboard_password_pending = registry.gauge(
+    "mvb_dashboard_password_pending", "Password operations running or queued on the dashboard scrypt pool."
+)
+dashboard_password_rejected = registry.counter(
+    "mvb_dashboard_password_rejected_total", "Password operations refused because the scrypt queue was full.", ("operation",)
+)
+bot_metrics_age_seconds = registry.gauge(
+    "mvb_bot_metrics_age_seconds", "Age of the bot's published metrics snapshot as seen by the dashboard."
+)
+provider_requests_today = registry.gauge(
+    "mvb_provider_requests_today", "Provider requests counted since local midnight, by kind.", ("provider", "kind")
+)
+
+
+def _provider_for_host(host: str) -> str:
+    host = (host or "").lower()
+    if host.endswith("espn.com"):
+        return "espn"
+    if host.endswith("api-sports.io"):
+        return "api_football"
+    return "other"
+
+
+def http_trace_config() -> aiohttp.TraceConfig:
+    """TraceConfig that records every request made through a ClientSession."""
+
+    async def on_start(_session, context, params):
+        context.metrics = SimpleNamespace(provider=_provider_for_host(params.url.host), started=time.monotonic())
+
+    async def on_end(_session, context, params):
+        http_seconds.observe(time.monotonic() - context.metrics.started, provider=context.metrics.provider)
+        http_requests.inc(provider=context.metrics.provider, outcome=f"{params.response.status // 100}xx")
+
+    async def on_exception(_session, context, params):
+        http_seconds.observe(time.monotonic() - context.metrics.started, provider=context.metrics.provider)
+        outcome = "timeout" if isinstance(params.exception, TimeoutError) else "error"
+        http_requests.inc(provider=context.metrics.provider, outcome=outcome)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_start)
+    config.on_request_end.append(on_end)
+    config.on_request_exception.append(on_exception)
+    return config
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def render_prometheus(sources: Iterable[tuple[dict, dict]]) -> str:
+    """
+    Render (extra_labels, snapshot) pairs as Prometheus text, merging metrics of
+    the same name so bot and dashboard samples share one HELP/TYPE header.
+    """
+    merged: dict[str, dict] = {}
+    for extra, snapshot in sources:
+        for name, metric in (snapshot or {}).items():
+            target = merged.setdefault(name, {**metric, "samples": []})
+            target["samples"].extend({**sample, "labels": {**extra, **sample["labels"]}} for sample in metric["samples"])
+
+    lines = []
+    for name in sorted(merged):
+        metric = merged[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample in metric["samples"]:
+            labels = sample["labels"]
+            if metric["type"] != HISTOGRAM:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(sample['value'])}")
+                continue
+            cumulative = 0
+            for bound, count in zip([*metric["buckets"], math.inf], sample["counts"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+    return "\n".join(lines) + "\n"
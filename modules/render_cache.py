@@ -0,0 +1,96 @@
+# modules/render_cache.py
+# Memoized football message rendering. Live ticks, FT checks and !matches replies
+# format the same fixtures over and over; each rendered line is cached under a
+# fingerprint of exactly the inputs the formatter reads, so an unchanged fixture
+# skips goal-event pruning and event/shootout formatting entirely.
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from modules import metrics
+from modules.storage import encode_json
+
+logger = logging.getLogger(__name__)
+
+_FINGERPRINT_BYTES = 16
+
+
+def render_inputs(match: dict) -> dict:
+    """Match fields read by the football line/FT formatters (teams, score, status, events, shootout)."""
+    fixture = match.get("fixture") or {}
+    return {
+        "teams": match.get("teams"),
+        "goals": match.get("goals"),
+        "events": match.get("events"),
+        "winner": match.get("winner"),
+        "status": fixture.get("status"),
+        "date": fixture.get("date"),
+    }
+
+
+def fingerprint(kind: str, inputs: Any) -> bytes | None:
+    """Stable digest of kind and inputs, or None when inputs are not JSON-serializable."""
+    try:
+        payload = encode_json([kind, inputs], ensure_ascii=False, compact=True, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload, digest_size=_FINGERPRINT_BYTES).digest()
+
+
+class RenderCache:
+    """Bounded LRU of rendered strings keyed by input fingerprint."""
+
+    def __init__(self, name: str, *, max_entries: int):
+        if max_entries < 1:
+            raise ValueError("RenderCache max_entries must be >= 1.")
+        self.name = name
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "uncacheable": 0}
+
+    def render(self, kind: str, inputs: Any, render: Callable[[], str]) -> str:
+        """Return the cached rendering for (kind, inputs), calling render() only on a miss."""
+        key = fingerprint(kind, inputs)
+        if key is None:
+            with self._lock:
+                self._stats["uncacheable"] += 1
+            return render()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                metrics.cache_lookups.inc(cache=self.name, result="hit")
+                return cached
+            self._stats["misses"] += 1
+        metrics.cache_lookups.inc(cache=self.name, result="miss")
+        rendered = render()
+        with self._lock:
+            self._entries[key] = rendered
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+            }
+
+
+# A full matchday of tracked fixtures in every render variant fits comfortably.
+football_renders = RenderCache("football_renders", max_entries=1024)
@@ -0,0 +1,190 @@
+# modules/response_cache.py
+# Bounded LRU cache for provider responses with optional bot_memory/ persistence.
+# Entries carry their own expiry so long-lived payloads (standings, rosters, team
+# search results) survive restarts without being refetched.
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from modules import metrics
+from modules.storage import load_json_path, save_json_path, submit_json_path
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_VERSION = 1
+
+
+class ResponseCache:
+    """Size- and age-bounded LRU keyed by string, with hit/miss/eviction stats."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int,
+        default_ttl_sec: float,
+        path: Path | None = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("ResponseCache max_entries must be >= 1.")
+        self.name = name
+        self.max_entries = int(max_entries)
+        self.default_ttl_sec = float(default_ttl_sec)
+        self.path = path
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.RLock()
+        self._loaded = path is None
+        self._dirty = False
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def _ensure_loaded(self, now: float) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            raw = load_json_path(self.path)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("response_cache: %s could not load %s (%s); starting empty.", self.name, self.path.name, e)
+            return
+        if not isinstance(raw, dict) or raw.get("version") != CACHE_FILE_VERSION or not isinstance(raw.get("entries"), dict):
+            logger.warning("response_cache: %s ignoring unsupported cache file %s.", self.name, self.path.name)
+            return
+        restored = 0
+        entries = raw["entries"]
+        restorable = []
+        for key, entry in entries.items():
+            if not isinstance(entry, dict) or "value" not in entry:
+                continue
+            try:
+                expires_at = float(entry["expires_at"])
+                stored_at = float(entry.get("stored_at") or now)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if expires_at > now:
+                restorable.append((stored_at, str(key), entry["value"], expires_at))
+        for stored_at, key, value, expires_at in sorted(restorable, key=lambda item: item[0]):
+            self._entries[key] = {"value": value, "stored_at": stored_at, "expires_at": expires_at}
+            restored += 1
+        self._trim()
+        logger.info("response_cache: %s restored %d entr%s from disk.", self.name, restored, "y" if restored == 1 else "ies")
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+            self._dirty = True
+
+    def warm(self) -> None:
+        """Restore the persisted entries now rather than on the first lookup."""
+        with self._lock:
+            self._ensure_loaded(time.time())
+
+    def get(self, key: str, now: float | None = None) -> Any | None:
+        """Return a live cached value and mark it most recently used, else None."""
+        now = now or time.time()
+        with self._lock:
+            self._ensure_loaded(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                metrics.cache_lookups.inc(cache=self.name, result="miss")
+                return None
+            if entry["expires_at"] <= now:
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                self._dirty = True
+                metrics.cache_lookups.inc(cache=self.name, result="miss")
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            metrics.cache_lookups.inc(cache=self.name, result="hit")
+            return entry["value"]
+
+    def set(self, key: str, value: Any, *, ttl_sec: float | None = None, now: float | None = None) -> None:
+        """Store a value with its own TTL, evicting least recently used entries over the cap."""
+        now = now or time.time()
+        ttl = self.default_ttl_sec if ttl_sec is None else float(ttl_sec)
+        with self._lock:
+            self._ensure_loaded(now)
+            if ttl <= 0:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = {"value": value, "stored_at": now, "expires_at": now + ttl}
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self._trim()
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            self._ensure_loaded(time.time())
+            removed = self._entries.pop(key, None) is not None
+            if removed:
+                self._stats["invalidations"] += 1
+                self._dirty = True
+            return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        with self._lock:
+            self._ensure_loaded(time.time())
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._stats["invalidations"] += len(keys)
+                self._dirty = True
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded = True
+            self._stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+            self._dirty = True
+
+    def persist(self, now: float | None = None, *, background: bool = False) -> bool:
+        """Write live entries to disk when the cache changed; raises on write failure.
+
+        With background=True the write is queued on the storage writer thread and
+        failures are only logged there.
+        """
+        if self.path is None:
+            return False
+        now = now or time.time()
+        with self._lock:
+            self._ensure_loaded(now)
+            if not self._dirty:
+                return False
+            entries = {
+                key: dict(entry)
+                for key, entry in self._entries.items()
+                if entry["expires_at"] > now
+            }
+            writer = submit_json_path if background else save_json_path
+            writer(
+                self.path,
+                {"version": CACHE_FILE_VERSION, "entries": entries},
+                ensure_ascii=False,
+                compact=True,
+            )
+            self._dirty = False
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_loaded(time.time())
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+            }
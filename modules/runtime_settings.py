@@ -6,7 +6,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from modules.bot_mode import get_mode, set_mode
 from modules.configuration import load_effective_config
-from modules.storage import load, save
+from modules.storage import WatchedJSONFile
 
 MORNING_FILE = "goodmorning.json"
 def _operations_timezone() -> str:
@@ -19,6 +19,7 @@ MORNING_DEFAULTS = {
     "minute": 30,
     "timezone": "Europe/Rome",
 }
+_morning = WatchedJSONFile(MORNING_FILE, MORNING_DEFAULTS)
 
 
 def get_runtime_settings() -> dict:
@@ -31,7 +32,7 @@ def set_runtime_mode(mode: str) -> dict:
 
 
 def get_morning_schedule() -> dict:
-    value = load(MORNING_FILE, MORNING_DEFAULTS)
+    value = _morning.get()
     return {
         "enabled": bool(value.get("enabled", True)),
         "hour": int(value.get("hour", 6)),
@@ -53,5 +54,5 @@ def set_morning_schedule(*, enabled: bool, hour: int, minute: int, timezone: str
     except ZoneInfoNotFoundError as exc:
         raise ValueError("timezone must be a valid IANA timezone") from exc
     value = {"enabled": enabled, "hour": hour, "minute": minute, "timezone": timezone}
-    save(MORNING_FILE, value)
+    _morning.save(value)
     return value
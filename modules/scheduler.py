@@ -16,7 +16,8 @@ from config import (
     TENNIS_POST_START_WATCH_HOURS,
     TENNIS_PRE_ANNOUNCE_HOURS,
 )
-from modules import api_provider, match_lifecycle
+from modules import api_provider, match_lifecycle, metrics
+from modules.job_scheduler import Job, JobScheduler
 from modules.bot_mode import get_mode, is_verbose
 from modules.discord_poster import post_new_general_message
 from modules.ft_handler import fetch_and_post_ft
@@ -37,6 +38,26 @@ _FOOTBALL_SLEEP_REFRESH_SEC = 21600
 _TENNIS_INTERVAL_SEC = TENNIS_LIVE_POLL_INTERVAL_SEC  # compatibility alias
 _TENNIS_SLEEP_REFRESH_SEC = TENNIS_IDLE_DISCOVERY_INTERVAL_SEC
 _TENNIS_POST_START_WATCH_HOURS = TENNIS_POST_START_WATCH_HOURS
+# Each sport has its own lane so a slow cycle in one never delays the other.
+# Daily routines touch football memory and match state, so they share football's.
+_FOOTBALL_LANE = "football"
+_TENNIS_LANE = "tennis"
+_DAILY_CHECK_INTERVAL_SEC = 60
+_DAILY_MAX_RUNTIME_SEC = 900
+_PROVIDER_NOTICE_INTERVAL_SEC = 60
+_PROVIDER_NOTICE_MAX_RUNTIME_SEC = 120
+# A hung provider request must not freeze a sport forever. Cancelling a cycle
+# drops its unfinished fixtures, which the next run picks up again; an FT post
+# already under way still completes and is marked announced (see ft_handler).
+_SPORT_CYCLE_MAX_RUNTIME_SEC = 900
+_HEALTH_INTERVAL_SEC = 30
+_HEALTH_JITTER_SEC = 5
+_HEALTH_MAX_RUNTIME_SEC = 30
+# Longest a job held by startup (see register_operations_jobs) waits before running anyway.
+_STARTUP_HOLD_MAX_SEC = 300
+# Football, tennis, daily memory, provider notices, dashboard health and the
+# morning broadcast (registered by cogs.goodmorning) all run as jobs here.
+operations_jobs = JobScheduler("operations")
 _football_scheduler_state = {
     "mode": "sleeping",
     "next_football_check_utc": None,
@@ -137,8 +158,31 @@ def _set_football_scheduler_state(
         _last_logged_football_state = snapshot
 
 
+def _cycle_status(job_name: str) -> dict:
+    job = operations_jobs.get_job(job_name)
+    if job is None:
+        return {
+            "cycles": 0,
+            "cycle_running": False,
+            "last_cycle_started_utc": None,
+            "last_cycle_duration_sec": None,
+            "last_cycle_lateness_sec": None,
+            "cycle_overruns": 0,
+            "cycle_failures": 0,
+        }
+    return {
+        "cycles": job.runs,
+        "cycle_running": job.running,
+        "last_cycle_started_utc": job.last_started_utc,
+        "last_cycle_duration_sec": job.last_duration_sec,
+        "last_cycle_lateness_sec": job.last_lateness_sec,
+        "cycle_overruns": job.overruns,
+        "cycle_failures": job.failures + job.timeouts,
+    }
+
+
 def get_football_scheduler_status() -> dict:
-    return dict(_football_scheduler_state)
+    return {**_football_scheduler_state, **_cycle_status("football")}
 
 
 def _set_tennis_scheduler_state(
@@ -192,22 +236,41 @@ def _set_tennis_scheduler_state(
 
 
 def get_tennis_scheduler_status() -> dict:
-    return dict(_tennis_scheduler_state)
+    return {**_tennis_scheduler_state, **_cycle_status("tennis")}
+
+
+def _publish_provider_gauges(provider: dict, tennis_provider: dict) -> None:
+    espn = provider.get("espn_league_requests_today") or {}
+    enrichment = provider.get("enrichment_calls_today") or {}
+    tennis = tennis_provider.get("requests") or {}
+    for kind, count in (("full_discovery", espn.get("full_discovery")), ("active_refresh", espn.get("active_refresh"))):
+        metrics.provider_requests_today.set(count or 0, provider="espn_football", kind=kind)
+    for kind in ("discovery", "targeted"):
+        metrics.provider_requests_today.set(tennis.get(kind) or 0, provider="espn_tennis", kind=kind)
+    metrics.provider_requests_today.set(enrichment.get("used") or 0, provider="api_football", kind="enrichment")
+    metrics.provider_requests_today.set(enrichment.get("budget") or 0, provider="api_football", kind="enrichment_budget")
 
 
 def write_dashboard_health_snapshot() -> None:
     """Publish a safe cross-process snapshot for the dashboard."""
     from cogs.version import get_version_info
-    from modules.dashboard_health import write_bot_health
+    from modules.dashboard_health import write_bot_health, write_bot_metrics
+    from modules.startup import get_startup_report
 
+    provider = api_provider.get_status()
+    tennis_provider = api_provider.get_tennis_status()
     write_bot_health(
         commit=get_version_info(),
-        provider=api_provider.get_status(),
-        tennis_provider=api_provider.get_tennis_status(),
+        provider=provider,
+        tennis_provider=tennis_provider,
         football_scheduler=get_football_scheduler_status(),
         tennis_scheduler=get_tennis_scheduler_status(),
+        jobs=get_upcoming_jobs(),
         mode=get_mode(),
+        startup=get_startup_report(),
     )
+    _publish_provider_gauges(provider, tennis_provider)
+    write_bot_metrics(metrics.registry.snapshot())
 
 
 def _next_scheduled_football_wake(matches: list[dict], now_utc: datetime) -> tuple[datetime, datetime] | tuple[None, None]:
@@ -511,6 +574,8 @@ async def _tennis_poll_needed(bot, now_utc: datetime) -> bool:
 async def _tennis_poll_decision(bot, now_utc: datetime) -> TennisPollDecision:
     tennis_loop.ensure_tennis_state_loaded()
     tennis_loop.prune_tennis_state(now_utc)
+    # Idle tennis days never reach run_tennis_loop; persist migration and pruning here.
+    await tennis_loop.flush_tennis_state()
     matches = await api_provider.fetch_tennis_day(bot.http_session)
     selected: tuple[int, str, str, str] | None = None
     for match in matches:
@@ -584,102 +649,156 @@ async def _tennis_poll_decision(bot, now_utc: datetime) -> TennisPollDecision:
     )
 
 
-async def run_operations_loop(bot) -> None:
+async def _run_provider_notice_job(bot, now: datetime) -> None:
     global _last_provider_was_espn
 
-    logger.info("Starting UTC-first operations loop.")
-    next_football_check = utc_now()
-    next_tennis_check = utc_now()
-    next_daily_check = utc_now()
-
-    while True:
-        now = utc_now()
-
-        if now >= next_daily_check:
-            try:
-                await run_local_daily_routines(bot, now)
-            except Exception as e:
-                logger.error("[Scheduler] Local daily routines failed: %s", e, exc_info=True)
-            next_daily_check = now + timedelta(minutes=1)
-
-        current_provider_is_espn = api_provider.is_espn_healthy()
-        if _last_provider_was_espn is None:
-            _last_provider_was_espn = current_provider_is_espn
-        elif _last_provider_was_espn != current_provider_is_espn:
-            if is_verbose():
-                notice = (
-                    "Data provider recovered: back to ESPN primary."
-                    if current_provider_is_espn
-                    else "Data provider degraded: using API-Football fallback until ESPN recovers."
-                )
-                await post_new_general_message(bot, CHANNEL_ID, content=notice)
-            _last_provider_was_espn = current_provider_is_espn
-
-        if now >= next_football_check:
-            try:
-                football_snapshot = await build_football_cycle_snapshot(bot.http_session, now)
-                football_needed, wake_reason, wake_reason_detail = await _football_poll_decision(
-                    bot,
-                    now,
-                    snapshot=football_snapshot,
-                )
-                if football_needed:
-                    await run_football_cycle(bot, now, snapshot=football_snapshot)
-                    next_football_check = utc_now() + timedelta(seconds=api_provider.get_poll_interval())
-                    _set_football_scheduler_state(
-                        mode="awake",
-                        next_football_check_utc=next_football_check,
-                        wake_reason=wake_reason,
-                        wake_reason_detail=wake_reason_detail,
-                    )
-                else:
-                    next_football_check = await _plan_sleep_until_next_fixture(bot, utc_now())
-            except Exception as e:
-                logger.error("[Scheduler] Football cycle failed: %s", e, exc_info=True)
-                next_football_check = utc_now() + timedelta(seconds=api_provider.get_poll_interval())
-                _set_football_scheduler_state(
-                    mode="awake",
-                    next_football_check_utc=next_football_check,
-                    wake_reason="error_recovery",
-                    wake_reason_detail=str(e),
-                )
+    current_provider_is_espn = api_provider.is_espn_healthy()
+    if _last_provider_was_espn is None:
+        _last_provider_was_espn = current_provider_is_espn
+    elif _last_provider_was_espn != current_provider_is_espn:
+        if is_verbose():
+            notice = (
+                "Data provider recovered: back to ESPN primary."
+                if current_provider_is_espn
+                else "Data provider degraded: using API-Football fallback until ESPN recovers."
+            )
+            await post_new_general_message(bot, CHANNEL_ID, content=notice)
+        _last_provider_was_espn = current_provider_is_espn
+
+
+async def _run_football_job(bot, now: datetime) -> datetime:
+    try:
+        football_snapshot = await build_football_cycle_snapshot(bot.http_session, now)
+        football_needed, wake_reason, wake_reason_detail = await _football_poll_decision(
+            bot,
+            now,
+            snapshot=football_snapshot,
+        )
+        if football_needed:
+            await run_football_cycle(bot, now, snapshot=football_snapshot)
+            next_football_check = utc_now() + timedelta(seconds=api_provider.get_poll_interval())
+            _set_football_scheduler_state(
+                mode="awake",
+                next_football_check_utc=next_football_check,
+                wake_reason=wake_reason,
+                wake_reason_detail=wake_reason_detail,
+            )
+            return next_football_check
+        return await _plan_sleep_until_next_fixture(bot, utc_now())
+    except Exception as e:
+        logger.error("[Scheduler] Football cycle failed: %s", e, exc_info=True)
+        next_football_check = utc_now() + timedelta(seconds=api_provider.get_poll_interval())
+        _set_football_scheduler_state(
+            mode="awake",
+            next_football_check_utc=next_football_check,
+            wake_reason="error_recovery",
+            wake_reason_detail=str(e),
+        )
+        return next_football_check
 
-        if now >= next_tennis_check:
-            try:
-                tennis_decision = await _tennis_poll_decision(bot, now)
-                if tennis_decision.needed:
-                    await tennis_loop.run_tennis_loop(
-                        bot,
-                        matches=tennis_decision.matches,
-                        now_utc=tennis_decision.timestamp,
-                    )
-                    next_tennis_check = utc_now() + timedelta(seconds=tennis_decision.interval_sec)
-                    _set_tennis_scheduler_state(
-                        mode="awake",
-                        next_tennis_check_utc=next_tennis_check,
-                        wake_reason=tennis_decision.reason,
-                        wake_reason_detail=tennis_decision.reason_detail,
-                    )
-                else:
-                    next_tennis_check = await _plan_tennis_sleep_until_next_match(
-                        bot,
-                        utc_now(),
-                        matches=tennis_decision.matches,
-                    )
-            except Exception as e:
-                logger.error("[Scheduler] Tennis cycle failed: %s", e, exc_info=True)
-                next_tennis_check = utc_now() + timedelta(seconds=TENNIS_LIVE_POLL_INTERVAL_SEC)
-                _set_tennis_scheduler_state(
-                    mode="awake",
-                    next_tennis_check_utc=next_tennis_check,
-                    wake_reason="error_recovery",
-                    wake_reason_detail=str(e),
-                )
 
-        try:
-            write_dashboard_health_snapshot()
-        except Exception as exc:
-            logger.warning("Could not update dashboard health snapshot: %s", exc)
+async def _run_tennis_job(bot, now: datetime) -> datetime:
+    try:
+        tennis_decision = await _tennis_poll_decision(bot, now)
+        if tennis_decision.needed:
+            await tennis_loop.run_tennis_loop(
+                bot,
+                matches=tennis_decision.matches,
+                now_utc=tennis_decision.timestamp,
+            )
+            next_tennis_check = utc_now() + timedelta(seconds=tennis_decision.interval_sec)
+            _set_tennis_scheduler_state(
+                mode="awake",
+                next_tennis_check_utc=next_tennis_check,
+                wake_reason=tennis_decision.reason,
+                wake_reason_detail=tennis_decision.reason_detail,
+            )
+            return next_tennis_check
+        return await _plan_tennis_sleep_until_next_match(
+            bot,
+            utc_now(),
+            matches=tennis_decision.matches,
+        )
+    except Exception as e:
+        logger.error("[Scheduler] Tennis cycle failed: %s", e, exc_info=True)
+        next_tennis_check = utc_now() + timedelta(seconds=TENNIS_LIVE_POLL_INTERVAL_SEC)
+        _set_tennis_scheduler_state(
+            mode="awake",
+            next_tennis_check_utc=next_tennis_check,
+            wake_reason="error_recovery",
+            wake_reason_detail=str(e),
+        )
+        return next_tennis_check
+
 
-        next_due = min(next_daily_check, next_football_check, next_tennis_check)
-        await asyncio.sleep(max(1, (next_due - utc_now()).total_seconds()))
+async def _run_health_job(now: datetime) -> None:
+    try:
+        write_dashboard_health_snapshot()
+    except Exception as exc:
+        logger.warning("Could not update dashboard health snapshot: %s", exc)
+
+
+def register_operations_jobs(
+    bot,
+    scheduler: JobScheduler = operations_jobs,
+    *,
+    hold_until: dict[str, asyncio.Future] | None = None,
+) -> None:
+    """
+    Register the operations workloads; football and tennis each run on their own lane.
+
+    daily_memory keeps its default lane too: a standings sweep can take minutes
+    and must not hold back live/FT cycles. Football memory writes are already
+    serialised by football_memory's own lock.
+
+    hold_until maps job names to startup futures. Those jobs first run when
+    their future resolves (or after _STARTUP_HOLD_MAX_SEC), e.g. football after
+    the startup broadcast has seeded FT/live dedupe state, so it cannot repost
+    what the broadcast shows. Every other job starts at once.
+    """
+    scheduler.register(Job(
+        "daily_memory",
+        lambda now: run_local_daily_routines(bot, now),
+        interval_sec=_DAILY_CHECK_INTERVAL_SEC,
+        max_runtime_sec=_DAILY_MAX_RUNTIME_SEC,
+    ))
+    scheduler.register(Job(
+        "provider_notice",
+        lambda now: _run_provider_notice_job(bot, now),
+        interval_sec=_PROVIDER_NOTICE_INTERVAL_SEC,
+        max_runtime_sec=_PROVIDER_NOTICE_MAX_RUNTIME_SEC,
+    ))
+    scheduler.register(Job(
+        "football",
+        lambda now: _run_football_job(bot, now),
+        interval_sec=api_provider.get_poll_interval,
+        max_runtime_sec=_SPORT_CYCLE_MAX_RUNTIME_SEC,
+        lane=_FOOTBALL_LANE,
+    ))
+    scheduler.register(Job(
+        "tennis",
+        lambda now: _run_tennis_job(bot, now),
+        interval_sec=TENNIS_LIVE_POLL_INTERVAL_SEC,
+        max_runtime_sec=_SPORT_CYCLE_MAX_RUNTIME_SEC,
+        lane=_TENNIS_LANE,
+    ))
+    scheduler.register(Job(
+        "dashboard_health",
+        _run_health_job,
+        interval_sec=_HEALTH_INTERVAL_SEC,
+        jitter_sec=_HEALTH_JITTER_SEC,
+        max_runtime_sec=_HEALTH_MAX_RUNTIME_SEC,
+    ))
+    for name, future in (hold_until or {}).items():
+        scheduler.reschedule(name, utc_now() + timedelta(seconds=_STARTUP_HOLD_MAX_SEC))
+        future.add_done_callback(lambda _future, name=name: scheduler.reschedule(name, utc_now()))
+
+
+def get_upcoming_jobs(limit: int | None = None) -> list[dict]:
+    return operations_jobs.upcoming(limit)
+
+
+async def run_operations_loop(bot, *, hold_until: dict[str, asyncio.Future] | None = None) -> None:
+    logger.info("Starting UTC-first operations loop.")
+    register_operations_jobs(bot, hold_until=hold_until)
+    await operations_jobs.run()
@@ -0,0 +1,134 @@
+# modules/startup.py
+# Bot startup as a small dependency graph. Each step names the steps it needs and
+# starts as soon as they have finished, so provider discovery, tennis discovery,
+# state loads and cache warmup overlap instead of running one after another, and
+# the operations scheduler starts without waiting for the startup broadcast.
+# The per-step timings are logged and published in the dashboard health snapshot.
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+_last_report: dict | None = None
+
+
+@dataclass
+class Step:
+    """A named startup step; it runs once every step in `after` has succeeded."""
+
+    name: str
+    action: Callable[[], Awaitable[Any]]
+    after: tuple[str, ...] = ()
+    status: str | None = None
+    result: Any = None
+    error: str | None = None
+    started_ms: float | None = None
+    duration_ms: float | None = None
+    _task: asyncio.Task | None = field(default=None, repr=False)
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "after": list(self.after),
+            "status": self.status,
+            "started_ms": self.started_ms,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+class StartupPipeline:
+    """Runs registered steps concurrently, each as soon as its dependencies succeed.
+
+    A failing step is logged and recorded; steps that depend on it are skipped
+    rather than started, and the remaining steps carry on.
+    """
+
+    def __init__(self, name: str = "startup"):
+        self.name = name
+        self._steps: dict[str, Step] = {}
+        self._started: float | None = None
+
+    def add(self, name: str, action: Callable[[], Awaitable[Any]], *, after: tuple[str, ...] = ()) -> Step:
+        if name in self._steps:
+            raise ValueError(f"Startup step {name!r} is already registered.")
+        missing = [dependency for dependency in after if dependency not in self._steps]
+        if missing:
+            # Dependencies must be registered first, which also rules out cycles.
+            raise ValueError(f"Startup step {name!r} depends on unknown step(s) {missing}.")
+        step = self._steps[name] = Step(name, action, tuple(after))
+        return step
+
+    def done(self, name: str) -> asyncio.Future:
+        """Future resolved once the step has finished, succeeded or not; it never raises."""
+        step = self._steps[name]
+        if step._task is None:
+            raise RuntimeError(f"Startup step {name!r} has not been started.")
+        return asyncio.shield(step._task)
+
+    def start(self) -> None:
+        """Create a task per step; the ones without dependencies begin at once."""
+        self._started = time.perf_counter()
+        for step in self._steps.values():
+            step._task = asyncio.create_task(self._run_step(step), name=f"{self.name}:{step.name}")
+
+    async def run(self) -> dict:
+        """Run every step to completion and return the timing report."""
+        global _last_report
+        if self._started is None:
+            self.start()
+        await asyncio.gather(*(step._task for step in self._steps.values()))
+        report = _last_report = self.report()
+        breakdown = ", ".join(
+            f"{step['name']} {step['duration_ms']:.0f} ms" if step["status"] == OK else f"{step['name']} {step['status']}"
+            for step in report["steps"]
+        )
+        logger.info("Startup finished in %.0f ms: %s.", report["total_ms"], breakdown)
+        return report
+
+    async def _run_step(self, step: Step) -> None:
+        for dependency in step.after:
+            upstream = self._steps[dependency]
+            await asyncio.shield(upstream._task)
+            if upstream.status != OK:
+                step.status = SKIPPED
+                step.error = f"{dependency} {upstream.status}"
+                logger.warning("Startup step %s skipped: %s.", step.name, step.error)
+                return
+        step.started_ms = round((time.perf_counter() - self._started) * 1000, 1)
+        began = time.perf_counter()
+        try:
+            step.result = await step.action()
+            step.status = OK
+        except Exception as e:
+            step.status = FAILED
+            step.error = str(e)
+            logger.error("Startup step %s failed: %s", step.name, e, exc_info=True)
+        finally:
+            step.duration_ms = round((time.perf_counter() - began) * 1000, 1)
+
+    def result(self, name: str) -> Any:
+        return self._steps[name].result
+
+    def report(self) -> dict:
+        steps = sorted(self._steps.values(), key=lambda step: (step.started_ms is None, step.started_ms or 0))
+        finished = [step.started_ms + step.duration_ms for step in steps if step.started_ms is not None]
+        return {
+            "finished_utc": datetime.now(timezone.utc).isoformat(),
+            "total_ms": round(max(finished, default=0.0), 1),
+            "steps": [step.describe() for step in steps],
+        }
+
+
+def get_startup_report() -> dict | None:
+    """Timing report of the last completed startup, for the health snapshot."""
+    return _last_report
@@ -1,69 +1,398 @@
 # modules/storage.py
 # Thin read/write wrapper for bot_memory/ (Pi-owned runtime state).
-# All files are JSON. Paths are relative to the project root.
+# All files are JSON, optionally compact and/or gzip-compressed; readers detect
+# the format from the file contents. Paths are relative to the project root.
+# Coroutines hand writes to a single background writer thread so fsync never
+# blocks the event loop; queued writes to the same file coalesce to the newest.
 
+import asyncio
+import atexit
+import gzip
 import json
 import logging
 import os
 import pathlib
 import threading
+import time
 import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
 from copy import deepcopy
+from typing import Any
+
+from modules import metrics
+
+try:
+    import orjson
+except ImportError:  # Optional fast codec; the stdlib encoder is the fallback.
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 BOT_MEMORY_DIR = pathlib.Path(__file__).resolve().parent.parent / "bot_memory"
-_storage_lock = threading.RLock()
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_LEVEL = 6
+
+# Background writer state, guarded by _writer_cond. A path is either queued in
+# _pending_writes (payload may still be replaced) or being written in _inflight_writes.
+# At most one write per path is in flight, whether from the writer thread or a
+# synchronous save, so replaces of one file land in submission order.
+_writer_cond = threading.Condition()
+_pending_writes: OrderedDict[pathlib.Path, dict] = OrderedDict()
+_inflight_writes: dict[pathlib.Path, dict] = {}
+_writer_thread: threading.Thread | None = None
+_writer_stats = {"submitted": 0, "written": 0, "coalesced": 0, "failed": 0}
 
 
 def _path(filename: str) -> pathlib.Path:
     return BOT_MEMORY_DIR / filename
 
 
+def encode_json(
+    data: Any,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+    sort_keys: bool = False,
+) -> bytes:
+    """Serialize data as UTF-8 JSON bytes: indented by default, compact and/or gzip on request."""
+    if compact and not ensure_ascii and orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        payload = orjson.dumps(data, option=options)
+    elif compact:
+        payload = json.dumps(
+            data, ensure_ascii=ensure_ascii, sort_keys=sort_keys, separators=(",", ":")
+        ).encode("utf-8")
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys).encode("utf-8")
+    if compress:
+        payload = gzip.compress(payload, compresslevel=_GZIP_LEVEL, mtime=0)
+    return payload
+
+
+def decode_json(payload: bytes) -> Any:
+    """Parse JSON bytes written by encode_json, transparently inflating gzip payloads."""
+    if payload[:2] == _GZIP_MAGIC:
+        try:
+            payload = gzip.decompress(payload)
+        except (OSError, EOFError, zlib.error) as e:
+            raise json.JSONDecodeError(f"invalid gzip payload ({e})", "", 0) from e
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def load_json_path(path: pathlib.Path) -> Any:
+    """Read any storage JSON format; raises FileNotFoundError or json.JSONDecodeError.
+
+    A write still queued on the background writer is returned in place of the
+    file contents, so readers always see the newest submitted state.
+    """
+    payload = pending_payload(path)
+    return decode_json(payload if payload is not None else path.read_bytes())
+
+
 def load(filename: str, default: dict) -> dict:
     """Load a JSON file from bot_memory/. Returns default if missing or corrupt."""
     p = _path(filename)
-    with _storage_lock:
-        try:
-            with p.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.warning("storage: %s not found, using defaults.", filename)
-            return deepcopy(default)
-        except json.JSONDecodeError as e:
-            logger.error("storage: %s is corrupt (%s), using defaults.", filename, e)
-            return deepcopy(default)
+    # No lock needed: writers only ever os.replace a complete file into place.
+    try:
+        return load_json_path(p)
+    except FileNotFoundError:
+        logger.warning("storage: %s not found, using defaults.", filename)
+        return deepcopy(default)
+    except json.JSONDecodeError as e:
+        logger.error("storage: %s is corrupt (%s), using defaults.", filename, e)
+        return deepcopy(default)
 
 
 def save_text_path(path: pathlib.Path, text: str, *, mode: int | None = None) -> None:
     """Atomically replace a UTF-8 text file and raise if durable persistence fails."""
-    with _storage_lock:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.parent / f"{path.name}.{uuid.uuid4().hex}.tmp"
+    save_bytes_path(path, text.encode("utf-8"), mode=mode)
+
+
+def save_bytes_path(path: pathlib.Path, payload: bytes, *, mode: int | None = None) -> None:
+    """Atomically replace a file with payload and raise if durable persistence fails.
+
+    Supersedes any write for the same path still queued on the background writer,
+    and waits for one already in progress so the older payload cannot land last.
+    """
+    key = _writer_key(path)
+    with _writer_cond:
+        _writer_cond.wait_for(lambda: key not in _inflight_writes)
+        superseded = _pending_writes.pop(key, None)
+        _inflight_writes[key] = {"payload": payload, "mode": mode, "future": None}
+    error = None
+    try:
+        _write_bytes_atomic(path, payload, mode=mode)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        with _writer_cond:
+            _inflight_writes.pop(key, None)
+            _writer_cond.notify_all()
+        if superseded is not None:
+            _resolve_write(superseded["future"], error)
+
+
+def _write_bytes_atomic(path: pathlib.Path, payload: bytes, *, mode: int | None = None) -> None:
+    started = time.monotonic()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.parent / f"{path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        with tmp.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+        if mode is not None:
+            os.chmod(path, mode)
+        metrics.storage_write_seconds.observe(time.monotonic() - started)
+    except Exception:
         try:
-            with tmp.open("w", encoding="utf-8") as f:
-                f.write(text)
-                f.flush()
-                os.fsync(f.fileno())
-            if mode is not None:
-                os.chmod(tmp, mode)
-            os.replace(tmp, path)
-            if mode is not None:
-                os.chmod(path, mode)
-        except Exception:
-            try:
-                tmp.unlink(missing_ok=True)
-            finally:
-                logger.exception("storage: Failed to write %s", path)
-                raise
-
-
-def save_json_path(path: pathlib.Path, data: dict, *, ensure_ascii: bool = True) -> None:
+            tmp.unlink(missing_ok=True)
+        finally:
+            logger.exception("storage: Failed to write %s", path)
+            raise
+
+
+def save_json_path(
+    path: pathlib.Path,
+    data: dict,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+    sort_keys: bool = False,
+) -> None:
     """Atomically replace a JSON file and raise if durable persistence fails."""
-    payload = json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
-    save_text_path(path, payload)
+    payload = encode_json(
+        data,
+        ensure_ascii=ensure_ascii,
+        compact=compact,
+        compress=compress,
+        sort_keys=sort_keys,
+    )
+    save_bytes_path(path, payload)
 
 
-def save(filename: str, data: dict) -> None:
+def save(
+    filename: str,
+    data: dict,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+) -> None:
     """Atomically write bot_memory/filename, raising on persistence failure."""
-    save_json_path(_path(filename), data)
+    save_json_path(_path(filename), data, ensure_ascii=ensure_ascii, compact=compact, compress=compress)
+
+
+class WatchedJSONFile:
+    """In-memory copy of a small bot_memory/ JSON file shared with other processes.
+
+    get() serves the cached value and stat()s the file at most once per
+    recheck_sec; the file is only re-read when its inode, mtime or size changed,
+    which every atomic replace (including one from the dashboard process) does.
+    """
+
+    def __init__(self, filename: str, default: dict, *, recheck_sec: float = 1.0, clock=time.monotonic):
+        self.filename = filename
+        self.default = default
+        self.recheck_sec = recheck_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._value: dict | None = None
+        self._signature: tuple | None = None
+        self._checked_at: float | None = None
+        self._stats = {"reads": 0, "stats": 0}
+
+    def _current_signature(self) -> tuple | None:
+        self._stats["stats"] += 1
+        try:
+            st = _path(self.filename).stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def get(self) -> dict:
+        now = self._clock()
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= self.recheck_sec:
+                self._checked_at = now
+                signature = self._current_signature()
+                if self._value is None or signature != self._signature:
+                    self._stats["reads"] += 1
+                    self._value = load(self.filename, self.default) if signature is not None else deepcopy(self.default)
+                    self._signature = signature
+            return deepcopy(self._value)
+
+    def save(self, data: dict) -> None:
+        """Write through: persist data, then serve it without waiting for the next check."""
+        with self._lock:
+            save(self.filename, data)
+            self._value = deepcopy(data)
+            self._signature = self._current_signature()
+            self._checked_at = self._clock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self._checked_at = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+
+# --- Background writer ---
+def _writer_key(path: pathlib.Path) -> pathlib.Path:
+    return pathlib.Path(os.path.abspath(path))
+
+
+def _resolve_write(future: Future, error: Exception | None) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+def _ensure_writer_thread() -> None:
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    if _writer_thread is None:
+        atexit.register(flush_pending_writes, 10.0)
+    _writer_thread = threading.Thread(target=_writer_loop, name="storage-writer", daemon=True)
+    _writer_thread.start()
+
+
+def _writer_loop() -> None:
+    while True:
+        with _writer_cond:
+            # A path a synchronous save is writing stays queued until that save ends.
+            while (key := next((k for k in _pending_writes if k not in _inflight_writes), None)) is None:
+                _writer_cond.wait()
+            request = _pending_writes.pop(key)
+            _inflight_writes[key] = request
+        error = None
+        try:
+            _write_bytes_atomic(key, request["payload"], mode=request["mode"])
+        except Exception as e:
+            error = e
+        with _writer_cond:
+            _inflight_writes.pop(key, None)
+            _writer_stats["failed" if error else "written"] += 1
+            _writer_cond.notify_all()
+        _resolve_write(request["future"], error)
+
+
+def submit_bytes_path(path: pathlib.Path, payload: bytes, *, mode: int | None = None) -> Future:
+    """Queue an atomic, fsynced file replace on the writer thread without blocking.
+
+    A queued write to the same path that has not started yet is replaced by this
+    payload and shares its future, which resolves once the newest payload is
+    durable (or carries the write error).
+    """
+    key = _writer_key(path)
+    with _writer_cond:
+        _ensure_writer_thread()
+        _writer_stats["submitted"] += 1
+        queued = _pending_writes.get(key)
+        if queued is not None:
+            queued["payload"] = payload
+            queued["mode"] = mode
+            _writer_stats["coalesced"] += 1
+            return queued["future"]
+        future: Future = Future()
+        _pending_writes[key] = {"payload": payload, "mode": mode, "future": future}
+        _writer_cond.notify_all()
+        return future
+
+
+def submit_json_path(
+    path: pathlib.Path,
+    data: dict,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+    sort_keys: bool = False,
+) -> Future:
+    """Encode data now (a snapshot the caller may keep mutating) and queue the write."""
+    payload = encode_json(
+        data,
+        ensure_ascii=ensure_ascii,
+        compact=compact,
+        compress=compress,
+        sort_keys=sort_keys,
+    )
+    return submit_bytes_path(path, payload)
+
+
+async def save_bytes_path_async(path: pathlib.Path, payload: bytes, *, mode: int | None = None) -> None:
+    """Await a durable background write; raises like save_bytes_path on failure."""
+    # Shielded so a cancelled caller cannot cancel a write other callers share.
+    await asyncio.shield(asyncio.wrap_future(submit_bytes_path(path, payload, mode=mode)))
+
+
+async def save_json_path_async(
+    path: pathlib.Path,
+    data: dict,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+    sort_keys: bool = False,
+) -> None:
+    """Async counterpart of save_json_path; returns once the file is durable."""
+    future = submit_json_path(
+        path,
+        data,
+        ensure_ascii=ensure_ascii,
+        compact=compact,
+        compress=compress,
+        sort_keys=sort_keys,
+    )
+    await asyncio.shield(asyncio.wrap_future(future))
+
+
+async def save_async(
+    filename: str,
+    data: dict,
+    *,
+    ensure_ascii: bool = True,
+    compact: bool = False,
+    compress: bool = False,
+) -> None:
+    """Async counterpart of save for bot_memory/filename."""
+    await save_json_path_async(_path(filename), data, ensure_ascii=ensure_ascii, compact=compact, compress=compress)
+
+
+def pending_payload(path: pathlib.Path) -> bytes | None:
+    """Return the newest payload queued or being written for path, if any."""
+    key = _writer_key(path)
+    with _writer_cond:
+        request = _pending_writes.get(key) or _inflight_writes.get(key)
+        return request["payload"] if request is not None else None
+
+
+def flush_pending_writes(timeout: float | None = None) -> bool:
+    """Block until every queued write has finished; False if timeout expired first."""
+    with _writer_cond:
+        return _writer_cond.wait_for(lambda: not _pending_writes and not _inflight_writes, timeout)
+
+
+def get_writer_status() -> dict:
+    with _writer_cond:
+        return {
+            **_writer_stats,
+            "pending": len(_pending_writes) + len(_inflight_writes),
+        }
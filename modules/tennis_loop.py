@@ -1,12 +1,13 @@
 # modules/tennis_loop.py
 import logging
+from collections.abc import MutableMapping, MutableSet
 from datetime import datetime, timedelta
 
 from config import CHANNEL_ID, TENNIS_FINISHED_RETENTION_HOURS, TENNIS_PRE_ANNOUNCE_HOURS
-from modules import api_provider
+from modules import api_provider, live_board
 from modules.bot_mode import is_silent
 from modules.discord_poster import post_new_general_message, upsert_live_message
-from modules.storage import load, save
+from modules.storage import load, save_async
 from utils.time_utils import bot_now, to_bot_tz
 from utils.tennis_formatter import (
     format_tennis_final_message,
@@ -17,17 +18,112 @@ from utils.tennis_lifecycle import tennis_final_data_ready, tennis_final_within_
 
 logger = logging.getLogger(__name__)
 
-start_watch_prepared_ids: set[str] = set()
-final_announced_ids: set[str] = set()
-live_message_ids: dict[str, int] = {}
-live_state_keys: dict[str, str] = {}
+# One record per tracked match is the source of truth; the ID collections below
+# are live views over it. Changed records are flagged dirty and written together
+# once per tennis cycle, or immediately after a confirmed FT post.
 tennis_match_records: dict[str, dict] = {}
+_dirty_track_ids: set[str] = set()
+live_state_keys: dict[str, str] = {}
 _TENNIS_STATE_FILE = "tennis_state.json"
 _TENNIS_STATE_DEFAULT = {
     "version": 2,
     "matches": {},
 }
 _state_loaded = False
+# last_seen_at alone only dirties a record once it is this stale; it feeds the
+# retention check, which works in hours, and must not force a write every cycle.
+_LAST_SEEN_REFRESH = timedelta(hours=1)
+
+
+def _record(track_id: str) -> dict:
+    record = tennis_match_records.get(track_id)
+    if record is None:
+        record = tennis_match_records[track_id] = {
+            "start_watch_prepared": False,
+            "final_announced": False,
+            "live_message_id": None,
+        }
+    return record
+
+
+def _mark_dirty(track_id: str) -> None:
+    _dirty_track_ids.add(track_id)
+
+
+class _RecordFlagView(MutableSet):
+    """Track IDs whose record has a boolean flag set; mutations update the records."""
+
+    def __init__(self, flag: str):
+        self._flag = flag
+
+    def __contains__(self, track_id) -> bool:
+        record = tennis_match_records.get(track_id)
+        return bool(record and record.get(self._flag))
+
+    def __iter__(self):
+        return iter([track_id for track_id, record in tennis_match_records.items() if record.get(self._flag)])
+
+    def __len__(self) -> int:
+        return sum(1 for record in tennis_match_records.values() if record.get(self._flag))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._flag!r}, {set(self)!r})"
+
+    def add(self, track_id: str) -> None:
+        record = _record(track_id)
+        if not record.get(self._flag):
+            record[self._flag] = True
+            _mark_dirty(track_id)
+
+    def discard(self, track_id: str) -> None:
+        record = tennis_match_records.get(track_id)
+        if record and record.get(self._flag):
+            record[self._flag] = False
+            _mark_dirty(track_id)
+
+    def update(self, track_ids) -> None:
+        for track_id in track_ids:
+            self.add(track_id)
+
+
+class _LiveMessageIdView(MutableMapping):
+    """Track ID -> live Discord message ID, read from and written to the records."""
+
+    def __getitem__(self, track_id) -> int:
+        record = tennis_match_records.get(track_id)
+        if not record or record.get("live_message_id") is None:
+            raise KeyError(track_id)
+        return record["live_message_id"]
+
+    def __setitem__(self, track_id: str, message_id: int) -> None:
+        record = _record(track_id)
+        if record.get("live_message_id") != message_id:
+            record["live_message_id"] = message_id
+            _mark_dirty(track_id)
+
+    def __delitem__(self, track_id) -> None:
+        if track_id not in self:
+            raise KeyError(track_id)
+        tennis_match_records[track_id]["live_message_id"] = None
+        _mark_dirty(track_id)
+
+    def __iter__(self):
+        return iter([
+            track_id
+            for track_id, record in tennis_match_records.items()
+            if record.get("live_message_id") is not None
+        ])
+
+    def __len__(self) -> int:
+        return sum(1 for record in tennis_match_records.values() if record.get("live_message_id") is not None)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+start_watch_prepared_ids = _RecordFlagView("start_watch_prepared")
+final_announced_ids = _RecordFlagView("final_announced")
+live_message_ids = _LiveMessageIdView()
 
 
 def _is_tennis_local_today(start_time: str | None) -> bool:
@@ -116,7 +212,7 @@ def _load_state_once() -> None:
         record = dict(raw_record)
         record["start_watch_prepared"] = bool(record.get("start_watch_prepared"))
         record["final_announced"] = bool(record.get("final_announced"))
-        message_id = record.get("live_message_id")
+        message_id = None if record["final_announced"] else record.get("live_message_id")
         try:
             record["live_message_id"] = int(message_id) if message_id is not None else None
         except (TypeError, ValueError):
@@ -130,15 +226,9 @@ def _load_state_once() -> None:
             record["migrated_at"] = loaded_at
             normalized_dirty = True
         tennis_match_records[track_id] = record
-        if record["start_watch_prepared"]:
-            start_watch_prepared_ids.add(track_id)
-        if record["final_announced"]:
-            final_announced_ids.add(track_id)
-        if record["live_message_id"] is not None and not record["final_announced"]:
-            live_message_ids[track_id] = record["live_message_id"]
+        if migrated or normalized_dirty:
+            _mark_dirty(track_id)
 
-    if migrated or normalized_dirty:
-        _persist_state()
     if migrated:
         logger.info("Migrated tennis state to version 2 (%d match records).", len(matches))
     elif normalized_dirty:
@@ -152,37 +242,57 @@ def ensure_tennis_state_loaded() -> None:
 
 
 def _remember_match(track_id: str, match: dict, status_short: str | None) -> dict:
-    record = tennis_match_records.setdefault(track_id, {})
-    record["match_id"] = str(match.get("match_id") or track_id)
-    record["start_time"] = match.get("start_time")
-    record["last_status"] = status_short
-    record["last_seen_at"] = bot_now().isoformat()
+    record = _record(track_id)
+    now = bot_now()
+    seen = {
+        "match_id": str(match.get("match_id") or track_id),
+        "start_time": match.get("start_time"),
+        "last_status": status_short,
+    }
+    if any(record.get(key) != value for key, value in seen.items()) or _last_seen_stale(record, now):
+        record.update(seen, last_seen_at=now.isoformat())
+        _mark_dirty(track_id)
     return record
 
 
-def _persist_state() -> None:
-    all_ids = (
-        set(tennis_match_records)
-        | start_watch_prepared_ids
-        | final_announced_ids
-        | set(live_message_ids)
-    )
+def _last_seen_stale(record: dict, now: datetime) -> bool:
+    try:
+        return now - to_bot_tz(record["last_seen_at"]) >= _LAST_SEEN_REFRESH
+    except Exception:
+        return True
+
+
+def _state_snapshot() -> dict:
     matches: dict[str, dict] = {}
-    for track_id in sorted(all_ids):
-        record = dict(tennis_match_records.get(track_id, {}))
-        record["start_watch_prepared"] = track_id in start_watch_prepared_ids
-        record["final_announced"] = track_id in final_announced_ids
-        record["live_message_id"] = live_message_ids.get(track_id)
-        matches[track_id] = record
-    tennis_match_records.clear()
-    tennis_match_records.update(matches)
-    save(
-        _TENNIS_STATE_FILE,
-        {
-            "version": 2,
-            "matches": matches,
-        },
-    )
+    for track_id in sorted(tennis_match_records):
+        record = tennis_match_records[track_id]
+        matches[track_id] = {
+            **record,
+            "start_watch_prepared": bool(record.get("start_watch_prepared")),
+            "final_announced": bool(record.get("final_announced")),
+            "live_message_id": record.get("live_message_id"),
+        }
+    return {"version": 2, "matches": matches}
+
+
+async def _flush_state() -> bool:
+    """Write tennis_state.json when any record is dirty; returns once it is durable."""
+    if not _dirty_track_ids:
+        return False
+    flushed = set(_dirty_track_ids)
+    _dirty_track_ids.difference_update(flushed)
+    try:
+        await save_async(_TENNIS_STATE_FILE, _state_snapshot(), ensure_ascii=False, compact=True)
+    except Exception:
+        _dirty_track_ids.update(flushed)
+        raise
+    logger.debug("Persisted tennis state (%d dirty record(s)).", len(flushed))
+    return True
+
+
+async def flush_tennis_state() -> bool:
+    """Persist changes made outside a tennis cycle (load-time migration, pruning)."""
+    return await _flush_state()
 
 
 def prune_tennis_state(now=None) -> int:
@@ -211,12 +321,9 @@ def prune_tennis_state(now=None) -> int:
 
     for track_id in stale_ids:
         tennis_match_records.pop(track_id, None)
-        start_watch_prepared_ids.discard(track_id)
-        final_announced_ids.discard(track_id)
-        live_message_ids.pop(track_id, None)
         live_state_keys.pop(track_id, None)
+        _mark_dirty(track_id)
     if stale_ids:
-        _persist_state()
         logger.info("Pruned %d expired tennis lifecycle record(s).", len(stale_ids))
     return len(stale_ids)
 
@@ -228,6 +335,16 @@ def clear_tennis_state_today() -> None:
     logger.info("Kept rolling tennis lifecycle state across the local-day boundary.")
 
 
+async def _publish_live_board(bot, board_lines: dict[str, str]) -> None:
+    if not live_board.is_enabled("tennis"):
+        return
+    live_board.set_section("tennis", board_lines)
+    try:
+        await live_board.publish(bot)
+    except Exception:
+        logger.exception("Live board update failed after tennis cycle.")
+
+
 async def run_tennis_loop(
     bot,
     *,
@@ -235,9 +352,17 @@ async def run_tennis_loop(
     now_utc: datetime | None = None,
 ) -> None:
     if is_silent():
+        await _flush_state()
         return
     _load_state_once()
+    try:
+        await _run_tennis_cycle(bot, matches, now_utc)
+    finally:
+        # Every exit persists what changed, including the early returns below.
+        await _flush_state()
 
+
+async def _run_tennis_cycle(bot, matches, now_utc: datetime | None) -> None:
     if matches is None:
         try:
             matches = await api_provider.fetch_tennis_day(bot.http_session)
@@ -246,9 +371,12 @@ async def run_tennis_loop(
             return
 
     if not matches:
+        await _publish_live_board(bot, {})
         return
 
     live_ids_seen: set[str] = set()
+    board_mode = live_board.is_enabled("tennis")
+    board_lines: dict[str, str] = {}
 
     for match in matches:
         match_id = match.get("match_id")
@@ -278,7 +406,6 @@ async def run_tennis_loop(
                 continue
             _remember_match(track_id, match, status_short)
             start_watch_prepared_ids.add(track_id)
-            _persist_state()
             logger.info(f"Tennis start-watch prepared for {track_id}.")
             continue
 
@@ -287,22 +414,27 @@ async def run_tennis_loop(
                 # Ignore stale LIVE payloads that arrive after FT was already posted.
                 continue
             live_ids_seen.add(track_id)
+            if board_mode:
+                board_lines[track_id] = format_tennis_live_message(match)
             state_key = tennis_live_state_key(match)
             if live_state_keys.get(track_id) == state_key:
                 continue
 
-            msg = await upsert_live_message(
-                bot=bot,
-                channel_id=CHANNEL_ID,
-                message_id=live_message_ids.get(track_id),
-                content=format_tennis_live_message(match),
-            )
-            if msg is not None:
-                live_message_ids[track_id] = msg.id
+            if board_mode:
+                msg = None
+            else:
+                msg = await upsert_live_message(
+                    bot=bot,
+                    channel_id=CHANNEL_ID,
+                    message_id=live_message_ids.get(track_id),
+                    content=format_tennis_live_message(match),
+                )
+            if msg is not None or board_mode:
+                if msg is not None:
+                    live_message_ids[track_id] = msg.id
                 _remember_match(track_id, match, status_short)
                 old_key = live_state_keys.get(track_id)
                 live_state_keys[track_id] = state_key
-                _persist_state()
                 if old_key:
                     logger.info(f"Tennis live state changed for {track_id}: {old_key} -> {state_key}")
                 else:
@@ -340,14 +472,12 @@ async def run_tennis_loop(
                 final_announced_ids.add(track_id)
                 live_message_ids.pop(track_id, None)
                 live_state_keys.pop(track_id, None)
-                _persist_state()
+                # Confirmed post: make the dedupe durable before anything else can repost it.
+                await _flush_state()
                 logger.info("Tennis FT posted and persisted for %s.", track_id)
 
             else:
-                before = dict(tennis_match_records.get(track_id, {}))
                 _remember_match(track_id, match, status_short)
-                if tennis_match_records.get(track_id) != before:
-                    _persist_state()
 
             live_state_keys.pop(track_id, None)
 
@@ -355,3 +485,5 @@ async def run_tennis_loop(
     for mid in stale_live:
         live_state_keys.pop(mid, None)
     prune_tennis_state(now_utc or bot_now())
+    await _flush_state()
+    await _publish_live_board(bot, board_lines)
@@ -0,0 +1,111 @@
+"""Import-time profile of bot startup.
+
+Run:
+    python scripts/profile_imports.py [--top 15] [--first-use] [--json]
+
+Imports football_tracker_bot and every cog in a fresh interpreter under
+`python -X importtime`, then reports the slowest top-level imports, the cost of
+each cog and the peak resident memory. With --first-use it also constructs the
+dependencies the bot defers until a command needs them (DDGS for !ask), so the
+deferred cost shows up separately. Nothing connects to Discord.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+_MARKER = "profile_imports:"
+
+_PROBE = """
+import json, os, resource, sys
+def rss_kib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+import football_tracker_bot
+for name in sorted(os.listdir("cogs")):
+    if name.endswith(".py") and name != "__init__.py":
+        # __import__ rather than importlib.import_module: -X importtime only
+        # traces the former.
+        __import__(f"cogs.{name[:-3]}")
+ready = rss_kib()
+if FIRST_USE:
+    from ddgs import DDGS
+    DDGS()
+print(MARKER + json.dumps({"startup_rss_kib": ready, "rss_kib": rss_kib(), "modules": len(sys.modules)}))
+"""
+
+
+def _probe_source(first_use: bool) -> str:
+    return f"FIRST_USE = {first_use!r}\nMARKER = {_MARKER!r}\n{_PROBE}"
+
+
+def run_profile(first_use: bool = False) -> dict:
+    env = {**os.environ}
+    env.setdefault("BOT_TOKEN", "profile-token")
+    env.setdefault("API_KEY", "profile-api-key")
+    env.setdefault("CHANNEL_ID", "123456789")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _probe_source(first_use)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    summary = next((line[len(_MARKER):] for line in proc.stdout.splitlines() if line.startswith(_MARKER)), None)
+    if proc.returncode != 0 or summary is None:
+        raise SystemExit(f"Profile run failed:\n{proc.stderr[-2000:]}")
+
+    top_level: list[dict] = []
+    cogs: list[dict] = []
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        entry = {"module": m.group(4), "self_ms": int(m.group(1)) / 1000, "cumulative_ms": int(m.group(2)) / 1000}
+        if not m.group(3):
+            top_level.append(entry)
+        if entry["module"].startswith("cogs."):
+            cogs.append(entry)
+    return {
+        **json.loads(summary),
+        "total_ms": round(sum(entry["cumulative_ms"] for entry in top_level), 1),
+        "top_level": sorted(top_level, key=lambda entry: entry["cumulative_ms"], reverse=True),
+        "cogs": sorted(cogs, key=lambda entry: entry["cumulative_ms"], reverse=True),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="number of top-level imports to list")
+    parser.add_argument("--first-use", action="store_true", help="also load dependencies deferred until first use")
+    parser.add_argument("--json", action="store_true", help="print the profile as JSON")
+    args = parser.parse_args(argv)
+
+    profile = run_profile(first_use=args.first_use)
+    if args.json:
+        print(json.dumps(profile, indent=2))
+        return 0
+
+    print(f"Imports: {profile['total_ms']:.1f} ms, {profile['modules']} modules")
+    print(f"Peak RSS after startup imports: {profile['startup_rss_kib'] / 1024:.1f} MiB")
+    if args.first_use:
+        print(f"Peak RSS after first-use imports: {profile['rss_kib'] / 1024:.1f} MiB")
+    print("\nSlowest top-level imports (cumulative ms):")
+    for entry in profile["top_level"][: args.top]:
+        print(f"  {entry['cumulative_ms']:9.1f}  {entry['module']}")
+    print("\nCogs (cumulative ms, excluding modules already imported):")
+    for entry in profile["cogs"]:
+        print(f"  {entry['cumulative_ms']:9.1f}  {entry['module']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import shutil
 import subprocess
 import sys
@@ -25,7 +24,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from modules.storage import save_json_path  # noqa: E402
+from modules.storage import load_json_path, save_json_path  # noqa: E402
 
 FIXTURE_ID = "760516"
 SERVICE_NAME = "marco_van_botten"
@@ -83,8 +82,7 @@ BAD_EVENT_FINGERPRINT = [
 
 
 def _load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return load_json_path(path)
 
 
 def _event_fingerprint(events: list) -> list[tuple[int, int, str, str, str]]:
@@ -2,17 +2,32 @@
 
 Run:
     python scripts/simulate_lifecycle.py
+    python scripts/simulate_lifecycle.py --matchday [--timeline timeline.json] [--json]
 
-This script uses static fixtures only. It does not call Discord or providers.
+Without options this prints lifecycle predicates for static fixtures. With
+--matchday it replays a whole matchday through run_operations_loop under a
+virtual clock: a local stand-in HTTP server serves ESPN/API-Football responses
+built from a synthetic (or supplied) timeline, and a fake Discord channel
+records every send and edit. Nothing reaches Discord or the real providers, and
+bot state is written to a temporary directory.
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import json
+import logging
 import os
 import sys
+import tempfile
+import time
+from contextlib import ExitStack
 from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -20,7 +35,7 @@ if str(REPO_ROOT) not in sys.path:
 
 os.environ.setdefault("BOT_TOKEN", "simulation-token")
 os.environ.setdefault("API_KEY", "simulation-api-key")
-os.environ.setdefault("CHANNEL_ID", "0")
+os.environ.setdefault("CHANNEL_ID", "123456789")
 
 from modules import match_lifecycle  # noqa: E402
 
@@ -122,7 +137,552 @@ def print_state_pruning(name: str, match: dict) -> None:
         print("  live_message_id scenario: persisted ID would be reused; stale edit fallback is handled by discord_poster.")
 
 
-def main() -> int:
+# ── Matchday replay ──────────────────────────────────────────────────────────
+
+MATCHDAY = "2026-06-03"
+# Wall-clock shape of a football match: first half incl. stoppage, break, second half.
+_FIRST_HALF_MIN = 47
+_HALFTIME_MIN = 15
+_SECOND_HALF_MIN = 49
+# Real seconds between checks while background writes hold the virtual clock.
+_SETTLE_SEC = 0.002
+_PROVIDER_HOSTS = {
+    "https://site.api.espn.com/": "espn/",
+    "https://v3.football.api-sports.io/": "api-football/",
+}
+
+
+def synthetic_timeline(day: str = MATCHDAY) -> dict:
+    """Three football fixtures and one tennis match across one matchday (UTC)."""
+    from config import TRACKED_TENNIS_PLAYERS
+
+    tracked = sorted(TRACKED_TENNIS_PLAYERS)
+    return {
+        "start_utc": f"{day}T10:00:00Z",
+        "end_utc": f"{day}T23:30:00Z",
+        "football": [
+            {
+                "id": "sim-101",
+                "kickoff_utc": f"{day}T13:00:00Z",
+                "home": "Sim Rovers",
+                "away": "Sim Athletic",
+                "goals": [
+                    {"minute": 12, "team": "home", "player": "Ada Early"},
+                    {"minute": 58, "team": "away", "player": "Ben Level"},
+                    {"minute": 90, "extra": 3, "team": "home", "player": "Cy Late"},
+                ],
+            },
+            {
+                "id": "sim-102",
+                "kickoff_utc": f"{day}T18:45:00Z",
+                "home": "Sim United",
+                "away": "Sim City",
+                "goals": [{"minute": 33, "team": "away", "player": "Dee Solo"}],
+            },
+            {
+                "id": "sim-103",
+                "kickoff_utc": f"{day}T19:00:00Z",
+                "home": "Sim Wanderers",
+                "away": "Sim Town",
+                "goals": [
+                    {"minute": 5, "team": "home", "player": "Eve Quick"},
+                    {"minute": 45, "extra": 1, "team": "away", "player": "Finn Stoppage"},
+                    {"minute": 77, "team": "away", "player": "Gus Winner"},
+                ],
+            },
+        ],
+        "tennis": [
+            {
+                "id": "sim-t1",
+                "tour": "atp",
+                "start_utc": f"{day}T15:00:00Z",
+                "player_a": tracked[0].title() if tracked else "Sim Player",
+                "player_b": "Sim Opponent",
+                "sets": [[6, 4], [3, 6], [6, 3]],
+                "minutes_per_set": 45,
+            }
+        ],
+    }
+
+
+def _goal_wall_minute(goal: dict) -> float:
+    minute = int(goal["minute"])
+    extra = int(goal.get("extra") or 0)
+    if minute <= 45:
+        return minute + extra
+    return _FIRST_HALF_MIN + _HALFTIME_MIN + (minute - 45) + extra
+
+
+def _goal_time_utc(fixture: dict, goal: dict) -> datetime:
+    kickoff = match_lifecycle.parse_provider_utc(fixture["kickoff_utc"])
+    return kickoff + timedelta(minutes=_goal_wall_minute(goal))
+
+
+def _espn_football_event(fixture: dict, now_utc: datetime) -> dict:
+    kickoff = match_lifecycle.parse_provider_utc(fixture["kickoff_utc"])
+    elapsed = (now_utc - kickoff).total_seconds() / 60
+    second_half_start = _FIRST_HALF_MIN + _HALFTIME_MIN
+    full_time = second_half_start + _SECOND_HALF_MIN
+    if elapsed < 0:
+        state, period, name, description, minute = "pre", 0, "STATUS_SCHEDULED", "Scheduled", 0
+    elif elapsed < _FIRST_HALF_MIN:
+        state, period, name, description, minute = "in", 1, "STATUS_FIRST_HALF", "First Half", int(elapsed)
+    elif elapsed < second_half_start:
+        state, period, name, description, minute = "in", 1, "STATUS_HALFTIME", "Halftime", 45
+    elif elapsed < full_time:
+        minute = 45 + int(elapsed - second_half_start)
+        state, period, name, description = "in", 2, "STATUS_SECOND_HALF", "Second Half"
+    else:
+        state, period, name, description, minute = "post", 2, "STATUS_FULL_TIME", "Full Time", 90
+
+    scored = [goal for goal in fixture.get("goals", []) if state != "pre" and elapsed >= _goal_wall_minute(goal)]
+    team_ids = {"home": f"{fixture['id']}-home", "away": f"{fixture['id']}-away"}
+    score = {side: sum(1 for goal in scored if goal["team"] == side) for side in team_ids}
+    details = [
+        {
+            "type": {"id": "70", "text": "Goal"},
+            "clock": {
+                "displayValue": f"{goal['minute']}'+{goal['extra']}'" if goal.get("extra") else f"{goal['minute']}'"
+            },
+            "team": {"id": team_ids[goal["team"]]},
+            "scoringPlay": True,
+            "athletesInvolved": [{"fullName": goal["player"]}],
+        }
+        for goal in scored
+    ]
+    competitors = [
+        {
+            "homeAway": side,
+            "team": {"id": team_ids[side], "displayName": fixture[side]},
+            "score": str(score[side]),
+            "winner": state == "post" and score[side] > score["away" if side == "home" else "home"],
+        }
+        for side in ("home", "away")
+    ]
+    return {
+        "id": fixture["id"],
+        "date": fixture["kickoff_utc"],
+        "status": {
+            "period": period,
+            "displayClock": f"{minute}:00",
+            "clock": minute * 60,
+            "type": {
+                "state": state,
+                "name": name,
+                "description": description,
+                "detail": description,
+                "completed": state == "post",
+            },
+        },
+        "competitions": [{"competitors": competitors, "details": details}],
+    }
+
+
+def _espn_tennis_event(match: dict, now_utc: datetime) -> dict:
+    start = match_lifecycle.parse_provider_utc(match["start_utc"])
+    elapsed = (now_utc - start).total_seconds() / 60
+    sets = match["sets"]
+    played = max(0, min(len(sets), int(elapsed // match.get("minutes_per_set", 45)))) if elapsed >= 0 else 0
+    if elapsed < 0:
+        state, name = "pre", "STATUS_SCHEDULED"
+    elif played >= len(sets):
+        state, name = "post", "STATUS_FINAL"
+    else:
+        state, name = "in", "STATUS_IN_PROGRESS"
+    sets_a = sum(1 for a, b in sets[:played] if a > b)
+    sets_b = played - sets_a
+    competitors = [
+        {
+            "athlete": {"displayName": match[player]},
+            "linescores": [{"value": games[index]} for games in sets[:played]],
+            "winner": state == "post" and (sets_a > sets_b if index == 0 else sets_b > sets_a),
+        }
+        for index, player in enumerate(("player_a", "player_b"))
+    ]
+    return {
+        "id": match["id"],
+        "name": "Simulation Open",
+        "date": match["start_utc"],
+        "competitions": [
+            {
+                "id": f"{match['id']}-c",
+                "date": match["start_utc"],
+                "status": {"type": {"state": state, "name": name, "detail": name, "completed": state == "post"}},
+                "round": {"displayName": "Final"},
+                "competitors": competitors,
+            }
+        ],
+    }
+
+
+class _VirtualSelector:
+    """Selector wrapper that jumps the loop clock instead of sleeping when idle."""
+
+    def __init__(self, selector, loop: "VirtualClockLoop", is_settled):
+        self._selector = selector
+        self._loop = loop
+        self._is_settled = is_settled
+
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            return self._selector.select(None)
+        # Background file writes finish in real time before the clock may jump.
+        while not self._is_settled():
+            events = self._selector.select(_SETTLE_SEC)
+            if events:
+                return events
+        self._loop.advance(timeout)
+        return []
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose timers fire as soon as nothing else can run."""
+
+    def __init__(self, is_settled=lambda: True):
+        super().__init__()
+        self._offset = 0.0
+        self._selector = _VirtualSelector(self._selector, self, is_settled)
+
+    def time(self) -> float:
+        return super().time() + self._offset
+
+    def advance(self, seconds: float) -> None:
+        self._offset += max(0.0, seconds)
+
+
+class _VirtualTimeModule:
+    """Stand-in for the time module whose monotonic() follows the virtual loop clock."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def monotonic(self) -> float:
+        return self._loop.time()
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class _StandInSession:
+    """aiohttp session facade that sends provider URLs to the stand-in server."""
+
+    def __init__(self, session, base_url: str):
+        self._session = session
+        self._base_url = base_url
+
+    def get(self, url, **kwargs):
+        url = str(url)
+        for host, prefix in _PROVIDER_HOSTS.items():
+            if url.startswith(host):
+                url = f"{self._base_url}/{prefix}{url[len(host):]}"
+                break
+        return self._session.get(url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+def _build_discord_fakes(channel_id: int, clock):
+    import discord
+
+    def not_found():
+        return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+
+    class SimMessage:
+        def __init__(self, channel, message_id: int, content: str | None):
+            self.channel = channel
+            self.id = message_id
+            self.content = content
+
+        async def edit(self, *, content=None, **_kwargs):
+            if self.id not in self.channel.messages:
+                raise not_found()
+            self.channel.record("edit", content)
+            self.content = content
+            return self
+
+        async def delete(self):
+            if self.channel.messages.pop(self.id, None) is None:
+                raise not_found()
+            self.channel.record("delete", None)
+
+    class SimChannel(discord.TextChannel):
+        def __init__(self):
+            self.id = channel_id
+            self.name = "matchday-simulation"
+            self.messages: dict[int, SimMessage] = {}
+            self.calls: list[dict] = []
+            self._next_id = 1_000
+
+        def record(self, kind: str, content: str | None) -> None:
+            self.calls.append({"at": clock(), "kind": kind, "content": content or ""})
+
+        async def send(self, content=None, **_kwargs):
+            self._next_id += 1
+            message = SimMessage(self, self._next_id, content)
+            self.messages[message.id] = message
+            self.record("send", content)
+            return message
+
+        def get_partial_message(self, message_id: int):
+            return self.messages.get(int(message_id)) or SimMessage(self, int(message_id), None)
+
+        async def fetch_message(self, message_id: int):
+            self.record("fetch", None)
+            message = self.messages.get(int(message_id))
+            if message is None:
+                raise not_found()
+            return message
+
+        async def history(self, *, limit: int = 100):
+            self.record("history", None)
+            for message_id in sorted(self.messages, reverse=True)[:limit]:
+                yield self.messages[message_id]
+
+    class SimBot:
+        def __init__(self, http_session):
+            self.http_session = http_session
+            self.channel = SimChannel()
+
+        def get_channel(self, _channel_id: int):
+            return self.channel
+
+        async def wait_until_ready(self) -> None:
+            return None
+
+    return SimBot
+
+
+def _stand_in_app(timeline: dict, clock, counts: dict):
+    from aiohttp import web
+    from config import LEAGUE_SLUG_MAP
+    from utils.time_utils import to_bot_tz
+
+    default_slug = next(iter(LEAGUE_SLUG_MAP.values()), "sim.1")
+
+    def requested_day(request) -> str:
+        value = request.query.get("dates")
+        if value:
+            return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
+        return to_bot_tz(clock()).date().isoformat()
+
+    def local_day(value: str) -> str:
+        return to_bot_tz(value).date().isoformat()
+
+    async def soccer_scoreboard(request):
+        counts["espn_football"] += 1
+        day, slug = requested_day(request), request.match_info["slug"]
+        events = [
+            _espn_football_event(fixture, clock())
+            for fixture in timeline.get("football", [])
+            if fixture.get("league_slug", default_slug) == slug and local_day(fixture["kickoff_utc"]) == day
+        ]
+        return web.json_response({"events": events})
+
+    async def tennis_scoreboard(request):
+        counts["espn_tennis"] += 1
+        day, tour = requested_day(request), request.match_info["tour"]
+        events = [
+            _espn_tennis_event(match, clock())
+            for match in timeline.get("tennis", [])
+            if match.get("tour", "atp") == tour and local_day(match["start_utc"]) == day
+        ]
+        return web.json_response({"events": events})
+
+    async def espn_other(_request):
+        counts["espn_other"] += 1
+        return web.json_response({}, status=404)
+
+    async def api_football(_request):
+        counts["api_football"] += 1
+        return web.json_response({"errors": [], "results": 0, "response": []})
+
+    app = web.Application()
+    app.router.add_get("/espn/apis/site/v2/sports/soccer/{slug}/scoreboard", soccer_scoreboard)
+    app.router.add_get("/espn/apis/site/v2/sports/tennis/{tour}/scoreboard", tennis_scoreboard)
+    app.router.add_get("/espn/{tail:.*}", espn_other)
+    app.router.add_get("/api-football/{tail:.*}", api_football)
+    return app
+
+
+def _virtual_clock_patches(stack: ExitStack, loop: asyncio.AbstractEventLoop, virtual_utc_now) -> None:
+    from utils import time_utils
+
+    real_utc_now = time_utils.utc_now
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[0] not in {"modules", "utils", "cogs"}:
+            continue
+        if getattr(module, "utc_now", None) is real_utc_now:
+            stack.enter_context(patch.object(module, "utc_now", virtual_utc_now))
+        if getattr(module, "time", None) is time:
+            stack.enter_context(patch.object(module, "time", _VirtualTimeModule(loop)))
+
+
+def _summarize_cycles(durations: list[float]) -> dict:
+    if not durations:
+        return {"count": 0, "avg_ms": None, "max_ms": None, "total_ms": 0.0}
+    return {
+        "count": len(durations),
+        "avg_ms": round(1000 * sum(durations) / len(durations), 2),
+        "max_ms": round(1000 * max(durations), 2),
+        "total_ms": round(1000 * sum(durations), 2),
+    }
+
+
+def _goal_latencies(timeline: dict, calls: list[dict]) -> list[dict]:
+    rows = []
+    for fixture in timeline.get("football", []):
+        for goal in fixture.get("goals", []):
+            scored_at = _goal_time_utc(fixture, goal)
+            notified = next(
+                (
+                    call["at"]
+                    for call in calls
+                    if call["kind"] in {"send", "edit"} and call["at"] >= scored_at and goal["player"] in call["content"]
+                ),
+                None,
+            )
+            rows.append({
+                "fixture": fixture["id"],
+                "minute": f"{goal['minute']}+{goal['extra']}" if goal.get("extra") else str(goal["minute"]),
+                "player": goal["player"],
+                "scored_utc": scored_at.isoformat(),
+                "latency_sec": round((notified - scored_at).total_seconds(), 1) if notified else None,
+            })
+    return rows
+
+
+async def _replay(loop: "VirtualClockLoop", timeline: dict) -> dict:
+    import aiohttp
+    from aiohttp import web
+    from config import CHANNEL_ID
+    from modules import memory_queue, scheduler
+
+    start_utc = match_lifecycle.parse_provider_utc(timeline["start_utc"])
+    end_utc = match_lifecycle.parse_provider_utc(timeline["end_utc"])
+    started_at = loop.time()
+
+    def virtual_utc_now() -> datetime:
+        return start_utc + timedelta(seconds=loop.time() - started_at)
+
+    counts = {"espn_football": 0, "espn_tennis": 0, "espn_other": 0, "api_football": 0}
+    runner = web.AppRunner(_stand_in_app(timeline, virtual_utc_now, counts), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    cycle_wall = {"football": [], "tennis": []}
+
+    def timed(sport: str, job):
+        async def run(bot, now):
+            began = time.perf_counter()
+            try:
+                return await job(bot, now)
+            finally:
+                cycle_wall[sport].append(time.perf_counter() - began)
+        return run
+
+    with ExitStack() as stack:
+        _virtual_clock_patches(stack, loop, virtual_utc_now)
+        stack.enter_context(patch.object(scheduler, "_run_football_job", timed("football", scheduler._run_football_job)))
+        stack.enter_context(patch.object(scheduler, "_run_tennis_job", timed("tennis", scheduler._run_tennis_job)))
+        async with aiohttp.ClientSession() as session:
+            bot = _build_discord_fakes(CHANNEL_ID, virtual_utc_now)(
+                _StandInSession(session, f"http://127.0.0.1:{port}")
+            )
+            operations = asyncio.create_task(scheduler.run_operations_loop(bot))
+            worker = memory_queue.start_worker(bot)
+            await asyncio.sleep((end_utc - start_utc).total_seconds())
+            for task in (operations, worker):
+                task.cancel()
+            await asyncio.gather(operations, worker, return_exceptions=True)
+        await runner.cleanup()
+
+    calls = bot.channel.calls
+    return {
+        "window_utc": [start_utc.isoformat(), end_utc.isoformat()],
+        "provider_requests": counts,
+        "discord_calls": {
+            kind: sum(1 for call in calls if call["kind"] == kind)
+            for kind in ("send", "edit", "delete", "fetch", "history")
+        },
+        "cycles": {sport: _summarize_cycles(durations) for sport, durations in cycle_wall.items()},
+        "goal_latency": _goal_latencies(timeline, calls),
+    }
+
+
+def run_matchday(timeline: dict) -> dict:
+    """Replay timeline through the operations loop and return the benchmark report."""
+    if "modules.scheduler" in sys.modules:
+        # Loop modules bind BOT_MEMORY_DIR at import; only a fresh process can redirect it.
+        raise RuntimeError("run_matchday must run in a fresh interpreter so bot state stays out of bot_memory/.")
+    previous_cwd = os.getcwd()
+    # Bot state is fsynced on every write; tmpfs keeps that off the replay's wall clock.
+    scratch = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(prefix="matchday-sim-", dir=scratch) as workdir:
+        from modules import storage
+
+        # Before the loop modules import BOT_MEMORY_DIR, so all state lands in workdir.
+        storage.BOT_MEMORY_DIR = Path(workdir) / "bot_memory"
+        storage.BOT_MEMORY_DIR.mkdir()
+        os.chdir(workdir)
+        loop = VirtualClockLoop(is_settled=lambda: storage.get_writer_status()["pending"] == 0)
+        began = time.perf_counter()
+        try:
+            report = loop.run_until_complete(_replay(loop, timeline))
+        finally:
+            loop.close()
+            storage.flush_pending_writes(10.0)
+            os.chdir(previous_cwd)
+    report["replay_wall_sec"] = round(time.perf_counter() - began, 2)
+    return report
+
+
+def print_matchday_report(report: dict) -> None:
+    start, end = report["window_utc"]
+    print(f"Matchday replay {start} -> {end} in {report['replay_wall_sec']}s wall clock")
+    requests = report["provider_requests"]
+    print(
+        f"  provider requests: ESPN football {requests['espn_football']}, ESPN tennis {requests['espn_tennis']}, "
+        f"ESPN other {requests['espn_other']}, API-Football {requests['api_football']}"
+    )
+    print("  discord calls: " + ", ".join(f"{kind} {count}" for kind, count in report["discord_calls"].items()))
+    for sport, cycle in report["cycles"].items():
+        print(
+            f"  {sport} cycles: {cycle['count']} (avg {cycle['avg_ms']} ms, max {cycle['max_ms']} ms, "
+            f"total {cycle['total_ms']} ms wall clock)"
+        )
+    print("  goal notification latency:")
+    for row in report["goal_latency"]:
+        latency = f"{row['latency_sec']}s" if row["latency_sec"] is not None else "not notified"
+        print(f"    {row['fixture']} {row['minute']}' {row['player']}: {latency}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matchday", action="store_true", help="replay a whole matchday under a virtual clock")
+    parser.add_argument("--timeline", type=Path, help="JSON timeline to replay instead of the synthetic one")
+    parser.add_argument("--json", action="store_true", help="print the matchday report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show bot logs during the matchday replay")
+    args = parser.parse_args(argv)
+
+    if args.matchday or args.timeline:
+        logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR, format="%(levelname)s %(name)s: %(message)s")
+        timeline = json.loads(args.timeline.read_text(encoding="utf-8")) if args.timeline else synthetic_timeline()
+        report = run_matchday(timeline)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_matchday_report(report)
+        return 0
+
     print(f"UTC lifecycle simulation at now_utc={NOW_UTC.isoformat()}")
     start, end = match_lifecycle.provider_window(NOW_UTC)
     print(f"provider_window: {start.isoformat()} -> {end.isoformat()}")
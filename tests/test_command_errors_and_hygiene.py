@@ -173,6 +173,86 @@ class CommandErrorsAndHygieneTests(unittest.TestCase):
         self.assertIn("line 3", payload)
         self.assertIn("line 4", payload)
 
+    def test_log_export_reads_today_backwards_across_rotated_files(self):
+        from cogs import log as log_cog
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "bot.log"
+            (base.parent / "bot.log.2").write_text("not a log line\n", encoding="utf-8")
+            (base.parent / "bot.log.1").write_text(
+                "[2026-07-06 23:59:59] [ERROR   ] [tests] yesterday\n"
+                "[2026-07-07 00:00:01] [ERROR   ] [tests] early\n",
+                encoding="utf-8",
+            )
+            base.write_text(
+                "[2026-07-07 09:00:00] [INFO    ] [tests] morning\n"
+                "Traceback line without a timestamp\n"
+                "[2026-07-07 10:00:00] [ERROR   ] [tests] late\n",
+                encoding="utf-8",
+            )
+
+            today = log_cog._read_today_lines(base, "2026-07-07")
+            errors = log_cog._read_today_lines(base, "2026-07-07", mode="errors")
+            newest = log_cog._read_today_lines(base, "2026-07-07", limit=2)
+
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in today], ["early", "morning", "late"])
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in errors], ["early", "late"])
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in newest], ["morning", "late"])
+
+    def test_log_index_survives_rotation_and_reads_only_the_requested_minutes(self):
+        import calendar
+        import logging
+        import time as time_module
+
+        from modules.log_index import IndexedRotatingFileHandler, index_path, search_logs
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "bot.log"
+            handler = IndexedRotatingFileHandler(base, maxBytes=2500, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter(
+                fmt="[%(asctime)s] [%(levelname)-8s] [%(name)-20s] %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            ))
+            handler.formatter.converter = time_module.gmtime
+            start = calendar.timegm((2026, 7, 8, 0, 0, 0))
+            for i in range(120):
+                record = logging.LogRecord(
+                    "modules.scheduler" if i % 10 else "modules.live_loop",
+                    logging.ERROR if i == 95 else logging.INFO,
+                    __file__, 0, "tick %d", (i,), None,
+                )
+                record.created = start + i * 30
+                handler.emit(record)
+            handler.close()
+
+            self.assertTrue(index_path(base.with_name("bot.log.1")).exists())
+            result = search_logs(base, start="2026-07-08 00:40", end="2026-07-08 00:50")
+            errors = search_logs(base, start="2026-07-08 00:00", end="2026-07-08 00:59", min_level="WARNING")
+            live = search_logs(base, start="2026-07-08 00:20", end="2026-07-08 00:39", module="modules.live")
+            total_bytes = sum(path.stat().st_size for path in Path(tmp).glob("bot.log*") if path.suffix != ".idx")
+
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in result["lines"]], [str(i) for i in range(80, 102)])
+        self.assertLess(result["bytes_read"], total_bytes / 2)
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in errors["lines"]], ["95"])
+        self.assertEqual([line.rsplit(" ", 1)[-1] for line in live["lines"]], ["40", "50", "60", "70"])
+
+    def test_log_range_arguments_default_to_today_and_cross_midnight(self):
+        from datetime import date
+
+        from cogs import log as log_cog
+
+        today = date(2026, 7, 8)
+        self.assertEqual(
+            log_cog._parse_range("yesterday 21:40 21:55 errors", today),
+            {"start": "2026-07-07 21:40", "end": "2026-07-07 21:55", "min_level": "WARNING", "module": None},
+        )
+        self.assertEqual(
+            log_cog._parse_range("23:50 00:10 module modules.live_loop", today),
+            {"start": "2026-07-08 23:50", "end": "2026-07-09 00:10", "min_level": None, "module": "modules.live_loop"},
+        )
+        with self.assertRaises(ValueError):
+            log_cog._parse_range("21:40", today)
+
     def test_log_export_still_truncates_at_byte_limit(self):
         from cogs import log as log_cog
 
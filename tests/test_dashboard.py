@@ -1,10 +1,11 @@
+import asyncio
 import json
 import os
 import tempfile
 import unittest
 from copy import deepcopy
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aiohttp.test_utils import TestClient, TestServer
 
@@ -14,8 +15,10 @@ os.environ.setdefault("API_KEY", "test-api-key")
 
 class FakeController:
     supported = False
+    status_calls = 0
 
     async def status(self):
+        self.status_calls += 1
         return {"supported": False, "bot": "unsupported", "dashboard": "running"}
 
     async def restart_bot(self):
@@ -85,6 +88,24 @@ class DashboardConfigurationTests(unittest.TestCase):
                 with self.assertRaisesRegex(ConfigurationError, "changed since"):
                     save_complete_config(self.base, expected_revision="stale", default_path=default, local_path=local)
 
+    def test_effective_config_is_reused_until_a_source_file_changes(self):
+        from modules import configuration
+
+        with tempfile.TemporaryDirectory() as tmp:
+            default = Path(tmp) / "config.json"
+            local = Path(tmp) / "config.local.json"
+            default.write_text(json.dumps(self.base), encoding="utf-8")
+            with patch.dict("os.environ", {"CHANNEL_ID": ""}):
+                with patch.object(configuration, "_read_json_object", wraps=configuration._read_json_object) as read:
+                    first = configuration.load_effective_config(default, local)
+                    first["bot"]["name"] = "Mutated by caller"
+                    second = configuration.load_effective_config(default, local)
+                    self.assertEqual(read.call_count, 2)
+                    self.assertEqual(second["bot"]["name"], self.base["bot"]["name"])
+
+                    configuration.write_local_overrides({"bot": {"name": "Cached Bot"}}, default_path=default, local_path=local)
+                    self.assertEqual(configuration.load_effective_config(default, local)["bot"]["name"], "Cached Bot")
+
     def test_dashboard_transport_preserves_large_discord_ids(self):
         from modules.dashboard_service import _dashboard_safe_config, _normalize_dashboard_config
 
@@ -116,12 +137,61 @@ class DashboardHealthPublicationTests(unittest.TestCase):
              patch.object(scheduler.api_provider, "get_status", return_value={"active_provider": "espn"}), \
              patch.object(scheduler.api_provider, "get_tennis_status", return_value={"requests": {"total": 4}}), \
              patch("cogs.version.get_version_info", return_value={"sha": "abc123"}), \
-             patch("modules.dashboard_health.write_bot_health") as write:
+             patch.object(scheduler.metrics.registry, "snapshot", return_value={"storage_write_seconds": {}}), \
+             patch("modules.dashboard_health.write_bot_health") as write, \
+             patch("modules.dashboard_health.write_bot_metrics") as write_metrics:
             scheduler.write_dashboard_health_snapshot()
 
+        write_metrics.assert_called_once_with({"storage_write_seconds": {}})
         self.assertEqual(write.call_args.kwargs["mode"], "normal")
         self.assertEqual(write.call_args.kwargs["commit"]["sha"], "abc123")
         self.assertEqual(write.call_args.kwargs["tennis_provider"]["requests"]["total"], 4)
+        self.assertIn("startup", write.call_args.kwargs)
+
+
+class DashboardLogReadTests(unittest.TestCase):
+    def test_reverse_reader_matches_forward_split_across_block_boundaries(self):
+        from modules.dashboard_logs import read_logs
+        from modules.log_reader import iter_lines_reversed
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bot.log"
+            lines = [
+                f"[2026-07-07 12:00:{i:02d}] [{'ERROR   ' if i % 7 == 0 else 'INFO    '}] [modules.m{i % 3}] Zürich {i}"
+                for i in range(60)
+            ]
+            path.write_text("\r\n".join(lines[:30]) + "\n" + "\n".join(lines[30:]) + "\n", encoding="utf-8")
+
+            for block_size in (1, 7, 64, 1 << 16):
+                self.assertEqual(list(iter_lines_reversed(path, block_size=block_size)), lines[::-1])
+            self.assertEqual(read_logs(path, limit=5)["lines"], lines[-5:])
+            self.assertEqual(read_logs(path, mode="errors", limit=3)["lines"], [lines[42], lines[49], lines[56]])
+            self.assertEqual(read_logs(path, mode="module", module="modules.m1", limit=2)["lines"], [lines[55], lines[58]])
+            self.assertTrue(read_logs(Path(tmp) / "missing.log")["missing"])
+
+    def test_audit_pages_walk_back_through_rotations_while_entries_arrive(self):
+        from modules.dashboard_audit import AuditLog
+
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLog(Path(tmp) / "audit.jsonl", max_bytes=600, backups=3)
+            for i in range(12):
+                audit.record(username="admin", ip="127.0.0.1", action=f"action-{i}")
+            self.assertTrue((Path(tmp) / "audit.jsonl.1").exists())
+
+            first = audit.page(4)
+            self.assertEqual([e["action"] for e in first["entries"]], [f"action-{i}" for i in (11, 10, 9, 8)])
+            for i in range(12, 16):
+                audit.record(username="admin", ip="127.0.0.1", action=f"action-{i}")
+            seen = [e["action"] for e in first["entries"]]
+            cursor = first["next_cursor"]
+            while cursor:
+                page = audit.page(4, cursor)
+                seen += [e["action"] for e in page["entries"]]
+                cursor = page["next_cursor"]
+            self.assertEqual(seen, [f"action-{i}" for i in range(11, -1, -1)])
+            self.assertEqual(audit.recent(1)[0]["action"], "action-15")
+            with self.assertRaisesRegex(ValueError, "cursor"):
+                audit.page(4, "not-a-cursor")
 
 
 class DashboardApiTests(unittest.IsolatedAsyncioTestCase):
@@ -132,10 +202,11 @@ class DashboardApiTests(unittest.IsolatedAsyncioTestCase):
 
         self.tmp = tempfile.TemporaryDirectory()
         root = Path(self.tmp.name)
+        self.controller = FakeController()
         app = create_dashboard_app(
             user_store=UserStore(root / "users.json"),
             audit=AuditLog(root / "audit.jsonl"),
-            controller=FakeController(),
+            controller=self.controller,
         )
         self.client = TestClient(TestServer(app))
         await self.client.start_server()
@@ -160,6 +231,26 @@ class DashboardApiTests(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(response.status, 201)
 
+    async def test_full_password_queue_is_429_on_every_password_route(self):
+        from modules.dashboard_auth import PasswordQueueFull
+
+        login = await self._login()
+        headers = {"X-CSRF-Token": login["csrf"]}
+        busy = AsyncMock(side_effect=PasswordQueueFull("Too many password checks are in progress."))
+        with patch("modules.dashboard_service.run_password_task", busy):
+            responses = [
+                await self.client.post("/api/login", json={"username": "admin", "password": "admin"}),
+                await self.client.post(
+                    "/api/admins", json={"username": "operator.one", "password": "long-password"}, headers=headers
+                ),
+                await self.client.put(
+                    "/api/admins/admin/password", json={"current_password": "admin", "password": "long-password"}, headers=headers
+                ),
+            ]
+            for response in responses:
+                self.assertEqual(response.status, 429)
+                self.assertEqual((await response.json())["retry_after"], 1)
+
     async def test_default_warning_and_cookie_flags(self):
         response = await self.client.post("/api/login", json={"username": "admin", "password": "admin"})
         cookie_header = response.headers["Set-Cookie"]
@@ -169,6 +260,165 @@ class DashboardApiTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("HttpOnly", cookie_header)
         self.assertIn("SameSite=Strict", cookie_header)
 
+    async def test_unchanged_configuration_poll_is_not_modified(self):
+        await self._login()
+        response = await self.client.get("/api/config")
+        etag = response.headers["ETag"]
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
+        response = await self.client.get("/api/config", headers={"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        with patch.dict("os.environ", {"API_KEY": "rotated-api-key-9876"}):
+            response = await self.client.get("/api/config", headers={"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    async def test_status_stream_shares_one_poll_across_browsers(self):
+        self.assertEqual((await self.client.get("/api/status/stream")).status, 401)
+        await self._login()
+        health = {"timestamp": "2026-07-08T12:00:00+00:00", "age_seconds": 3, "stale": False, "mode": "normal"}
+        with patch("modules.dashboard_service.read_bot_health", return_value=health):
+            first = await self.client.get("/api/status/stream")
+            second = await self.client.get("/api/status/stream")
+            events = [await asyncio.wait_for(r.content.readuntil(b"\n\n"), timeout=2) for r in (first, second)]
+            first.close()
+            second.close()
+
+        self.assertEqual(first.headers["Content-Type"], "text/event-stream")
+        self.assertEqual(first.headers["Cache-Control"], "no-store")
+        for event in events:
+            name, data = event.decode().strip().split("\n")
+            self.assertEqual(name, "event: snapshot")
+            payload = json.loads(data.removeprefix("data: "))
+            self.assertEqual(payload["health"]["mode"], "normal")
+            self.assertNotIn("age_seconds", payload["health"])
+        self.assertEqual(self.controller.status_calls, 1)
+
+    async def test_metrics_export_merges_bot_snapshot_for_local_scrapers(self):
+        from modules.metrics import Registry
+
+        bot_registry = Registry()
+        bot_registry.counter("mvb_http_requests_total", "Outbound HTTP requests.", ("provider", "outcome")).inc(
+            3, provider="espn", outcome="2xx"
+        )
+        bot_registry.histogram("mvb_job_seconds", "Job duration.", ("job",), buckets=(1.0, 5.0)).observe(2.5, job="football")
+        published = {"timestamp": "2026-07-08T12:00:00+00:00", "metrics": bot_registry.snapshot()}
+
+        with patch("modules.dashboard_service.read_bot_metrics", return_value=published):
+            response = await self.client.get("/metrics")
+            text = await response.text()
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn("# TYPE mvb_http_requests_total counter", text)
+        self.assertIn('mvb_http_requests_total{process="bot",provider="espn",outcome="2xx"} 3', text)
+        self.assertIn('mvb_job_seconds_bucket{process="bot",job="football",le="1"} 0', text)
+        self.assertIn('mvb_job_seconds_bucket{process="bot",job="football",le="5"} 1', text)
+        self.assertIn('mvb_job_seconds_bucket{process="bot",job="football",le="+Inf"} 1', text)
+        self.assertIn('mvb_job_seconds_count{process="bot",job="football"} 1', text)
+        self.assertIn("mvb_bot_metrics_age_seconds", text)
+
+        proxied = await self.client.get("/metrics", headers={"X-Forwarded-For": "203.0.113.5"})
+        self.assertEqual(proxied.status, 401)
+
+    async def test_http_trace_and_storage_writes_are_recorded(self):
+        import aiohttp
+        from aiohttp import web
+
+        from modules import metrics, storage
+
+        async def ok(_request):
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/", ok)
+        server = TestServer(app)
+        await server.start_server()
+        before = metrics.http_requests.describe()["samples"]
+        try:
+            async with aiohttp.ClientSession(trace_configs=[metrics.http_trace_config()]) as session:
+                async with session.get(server.make_url("/")) as response:
+                    await response.read()
+        finally:
+            await server.close()
+        writes_before = sum(sample["count"] for sample in metrics.storage_write_seconds.describe()["samples"])
+        storage.save_json_path(Path(self.tmp.name) / "state.json", {"ok": True})
+
+        def count(samples):
+            return sum(s["value"] for s in samples if s["labels"] == {"provider": "other", "outcome": "2xx"})
+
+        self.assertEqual(count(metrics.http_requests.describe()["samples"]) - count(before), 1)
+        self.assertEqual(sum(sample["count"] for sample in metrics.storage_write_seconds.describe()["samples"]), writes_before + 1)
+
+
+class StatusFeedTests(unittest.IsolatedAsyncioTestCase):
+    async def test_broadcaster_sends_only_changes_and_stops_without_subscribers(self):
+        from modules.dashboard_stream import StatusBroadcaster
+
+        reads = []
+        current = {"health": {"mode": "normal", "age_seconds": 1}, "services": {"bot": "active"}}
+
+        async def read_status():
+            reads.append(1)
+            return deepcopy(current)
+
+        feed = StatusBroadcaster(read_status, poll_seconds=0.01)
+        queue = feed.subscribe()
+        self.assertEqual(await asyncio.wait_for(queue.get(), 1), ("snapshot", {"health": {"mode": "normal"}, "services": {"bot": "active"}}))
+        current["health"]["age_seconds"] = 9
+        current["services"]["bot"] = "inactive"
+        self.assertEqual(await asyncio.wait_for(queue.get(), 1), ("delta", {"services": {"bot": "inactive"}}))
+
+        feed.unsubscribe(queue)
+        await asyncio.sleep(0.05)
+        stopped_at = len(reads)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(reads), stopped_at)
+        await feed.close()
+
+    async def test_password_work_runs_off_loop_with_bounded_queue(self):
+        import threading
+
+        from modules import dashboard_auth, metrics
+
+        release = threading.Event()
+        capacity = dashboard_auth.PASSWORD_WORKERS + dashboard_auth.PASSWORD_QUEUE_LIMIT
+        timed_before = sum(s["count"] for s in metrics.dashboard_password_seconds.describe()["samples"])
+        waiting = [asyncio.create_task(dashboard_auth.run_password_task("login", release.wait)) for _ in range(capacity)]
+        await asyncio.sleep(0.01)
+
+        with self.assertRaises(dashboard_auth.PasswordQueueFull):
+            await dashboard_auth.run_password_task("login", release.wait)
+        self.assertEqual(metrics.dashboard_password_pending.describe()["samples"][0]["value"], capacity)
+
+        release.set()
+        self.assertTrue(all(await asyncio.gather(*waiting)))
+        self.assertEqual(metrics.dashboard_password_pending.describe()["samples"][0]["value"], 0)
+        timed_after = sum(s["count"] for s in metrics.dashboard_password_seconds.describe()["samples"])
+        self.assertEqual(timed_after - timed_before, capacity)
+
+    async def test_process_status_is_cached_and_shared_by_concurrent_callers(self):
+        from modules.dashboard_process import ProcessController
+
+        controller = ProcessController(Path("missing.env.deploy"))
+        controller.supported = True
+        calls = []
+
+        async def fake_run(*args, timeout=30):
+            calls.append(args)
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        with patch.object(controller, "_run", side_effect=fake_run):
+            results = await asyncio.gather(*(controller.status() for _ in range(3)))
+            await controller.status()
+            await controller.restart_bot()
+            await controller.status()
+
+        self.assertEqual(results[0], {"supported": True, "bot": "active", "dashboard": "active"})
+        self.assertEqual(len([call for call in calls if "is-active" in call]), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
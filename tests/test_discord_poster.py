@@ -54,6 +54,22 @@ class FakeMessage:
         return self
 
 
+class TrackedFakeTextChannel(FakeTextChannel):
+    def __init__(self, messages=None):
+        super().__init__(messages)
+        self.id = 555
+        self.history_calls = 0
+
+    def history(self, limit):
+        self.history_calls += 1
+        return super().history(limit)
+
+    async def send(self, content=None, suppress_embeds=False):
+        message = await super().send(content=content, suppress_embeds=suppress_embeds)
+        self.messages.insert(0, message)
+        return message
+
+
 class FakeBot:
     def __init__(self, channel):
         self.channel = channel
@@ -64,6 +80,14 @@ class FakeBot:
 
 class DiscordPosterTests(unittest.TestCase):
 
+    def setUp(self):
+        from modules import discord_poster
+        from modules.discord_dispatcher import OutboundDispatcher
+
+        patcher = patch.object(discord_poster, "outbound", OutboundDispatcher(limit=1000))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_upsert_live_message_posts_new_when_message_not_in_recent_history(self):
         from modules import discord_poster
 
@@ -166,6 +190,180 @@ class DiscordPosterTests(unittest.TestCase):
         self.assertIsNone(result)
         self.assertEqual(channel.sent, [])
 
+    def test_live_upsert_uses_message_index_after_first_history_read(self):
+        from modules import discord_poster
+        from modules.message_tracker import ChannelMessageTracker
+
+        existing = FakeMessage(42)
+        channel = TrackedFakeTextChannel(messages=[FakeMessage(44), FakeMessage(43), existing])
+        tracker = ChannelMessageTracker(10)
+
+        async def run():
+            with (
+                patch.object(discord_poster.discord, "TextChannel", FakeTextChannel),
+                patch.object(discord_poster, "message_tracker", tracker),
+                patch.object(discord_poster, "LIVE_UPDATE_EDIT_WINDOW_MESSAGES", 4),
+            ):
+                for content in ("first", "second"):
+                    await discord_poster.upsert_live_message(FakeBot(channel), 123, 42, content)
+                tracker.record(channel.id, 45)
+                tracker.record(channel.id, 46)
+                return await discord_poster.upsert_live_message(FakeBot(channel), 123, 42, "buried")
+
+        result = asyncio.run(run())
+
+        self.assertEqual(channel.history_calls, 1)
+        self.assertEqual(existing.edit_count, 2)
+        self.assertEqual(result.id, 9000)
+        self.assertEqual(tracker.is_recent(channel.id, 9000, 1), True)
+
+    def test_message_index_falls_back_to_history_when_window_is_unknown(self):
+        from modules.message_tracker import ChannelMessageTracker
+
+        tracker = ChannelMessageTracker(5)
+        self.assertIsNone(tracker.is_recent(1, 10, 3))
+        tracker.begin_sync(1)
+        tracker.record(1, 13)
+        tracker.forget(1, [11])
+        tracker.seed(1, [12, 11, 10], complete=False)
+        self.assertTrue(tracker.is_recent(1, 10, 3))
+        self.assertFalse(tracker.is_recent(1, 9, 3))
+
+        tracker.forget(1, [13])
+        self.assertIsNone(tracker.is_recent(1, 9, 3))
+
+        tracker.invalidate()
+        self.assertIsNone(tracker.is_recent(1, 10, 3))
+
+    def test_dispatcher_runs_urgent_before_live_and_coalesces_queued_edits(self):
+        from modules.discord_dispatcher import PRIORITY_LIVE, PRIORITY_URGENT, OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=1000)
+        order = []
+
+        def operation(label):
+            async def run():
+                order.append(label)
+                return label
+            return run
+
+        async def run():
+            blocker = asyncio.create_task(dispatcher.run(PRIORITY_LIVE, operation("blocker"), channel_id=1))
+            await asyncio.sleep(0)
+            first_edit = asyncio.create_task(
+                dispatcher.run(PRIORITY_LIVE, operation("edit-1"), channel_id=1, coalesce_key="m1")
+            )
+            second_edit = asyncio.create_task(
+                dispatcher.run(PRIORITY_LIVE, operation("edit-2"), channel_id=1, coalesce_key="m1")
+            )
+            urgent = asyncio.create_task(dispatcher.run(PRIORITY_URGENT, operation("ft"), channel_id=1))
+            return await asyncio.gather(blocker, first_edit, second_edit, urgent)
+
+        results = asyncio.run(run())
+
+        self.assertEqual(order, ["blocker", "ft", "edit-2"])
+        self.assertEqual(results, ["blocker", "edit-2", "edit-2", "ft"])
+        stats = dispatcher.stats()
+        self.assertEqual((stats["sent"], stats["coalesced"], stats["depth"]), (3, 1, 0))
+
+    def test_dispatcher_limits_each_channel_to_a_sliding_window(self):
+        from modules import discord_dispatcher
+        from modules.discord_dispatcher import OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=2, window_sec=5.0)
+        with patch.object(discord_dispatcher.time, "monotonic", side_effect=[0.0, 1.0, 4.0, 4.0, 5.5, 5.5]):
+            self.assertEqual(dispatcher._reserve(1), 0.0)
+            self.assertEqual(dispatcher._reserve(1), 0.0)
+            self.assertEqual(dispatcher._reserve(1), 1.0)
+            self.assertEqual(dispatcher._reserve(2), 0.0)
+            self.assertEqual(dispatcher._reserve(1), 0.0)
+            self.assertEqual(dispatcher._reserve(1), 0.5)
+
+    def test_throttled_channel_does_not_hold_up_other_channels(self):
+        from modules.discord_dispatcher import PRIORITY_LIVE, PRIORITY_URGENT, OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=1, window_sec=0.3)
+        order = []
+
+        def operation(label):
+            async def run():
+                order.append(label)
+                return label
+            return run
+
+        async def run():
+            first = asyncio.create_task(dispatcher.run(PRIORITY_LIVE, operation("busy-1"), channel_id=1))
+            await first
+            throttled = asyncio.create_task(dispatcher.run(PRIORITY_URGENT, operation("busy-2"), channel_id=1))
+            await asyncio.sleep(0.05)
+            other = await asyncio.wait_for(dispatcher.run(PRIORITY_LIVE, operation("other"), channel_id=2), 0.2)
+            return other, await throttled
+
+        self.assertEqual(asyncio.run(run()), ("other", "busy-2"))
+        self.assertEqual(order, ["busy-1", "other", "busy-2"])
+
+
+    def test_history_read_and_edit_take_two_pacing_slots(self):
+        from modules import discord_dispatcher
+        from modules.discord_dispatcher import OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=3, window_sec=5.0)
+        with patch.object(discord_dispatcher.time, "monotonic", side_effect=[0.0, 1.0, 2.0, 6.5]):
+            self.assertEqual(dispatcher._reserve(1, calls=2), 0.0)
+            self.assertEqual(dispatcher._reserve(1, calls=2), 4.0)
+            self.assertEqual(dispatcher._reserve(1), 0.0)
+            self.assertEqual(dispatcher._reserve(1, calls=2), 0.0)
+
+    def test_hung_operation_times_out_without_blocking_other_channels(self):
+        from modules.discord_dispatcher import PRIORITY_LIVE, PRIORITY_URGENT, OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=1000, timeout_sec=0.2)
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def post():
+            return "ft"
+
+        async def run():
+            hung = asyncio.create_task(dispatcher.run(PRIORITY_LIVE, hang, channel_id=1))
+            await asyncio.sleep(0)
+            posted = await asyncio.wait_for(dispatcher.run(PRIORITY_URGENT, post, channel_id=2), 0.1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(hung, 1)
+            return posted
+
+        self.assertEqual(asyncio.run(run()), "ft")
+        self.assertEqual(dispatcher.stats()["timed_out"], 1)
+
+    def test_cancelled_operation_or_lane_never_leaves_a_caller_waiting(self):
+        from modules.discord_dispatcher import PRIORITY_LIVE, OutboundDispatcher
+
+        dispatcher = OutboundDispatcher(limit=1000)
+
+        async def cancels_itself():
+            raise asyncio.CancelledError
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def ok():
+            return "ok"
+
+        async def run():
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(dispatcher.run(PRIORITY_LIVE, cancels_itself, channel_id=1), 1)
+            self.assertEqual(await dispatcher.run(PRIORITY_LIVE, ok, channel_id=1), "ok")
+
+            running = asyncio.create_task(dispatcher.run(PRIORITY_LIVE, hang, channel_id=1))
+            queued = asyncio.create_task(dispatcher.run(PRIORITY_LIVE, ok, channel_id=1))
+            await asyncio.sleep(0.01)
+            dispatcher._lanes[1]["task"].cancel()
+            results = await asyncio.wait_for(asyncio.gather(running, queued, return_exceptions=True), 1)
+            return [type(result) for result in results]
+
+        self.assertEqual(asyncio.run(run()), [asyncio.CancelledError, asyncio.CancelledError])
+
 
 if __name__ == "__main__":
     unittest.main()
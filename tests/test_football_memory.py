@@ -55,6 +55,137 @@ class FootballMemoryTests(unittest.TestCase):
         self.assertEqual(memory["teams"]["100"]["players"]["Scorer"]["goals"], 1)
         self.assertEqual(len(memory["matches"]), 1)
 
+    def test_match_that_fails_midway_leaves_no_partial_stats_in_a_saved_batch(self):
+        from modules import football_memory
+
+        def ft_match(fixture_id, home_id, away_id):
+            return {
+                "fixture": {"id": fixture_id, "date": "2026-05-24T18:00:00+00:00", "status": {"short": "FT"}},
+                "league": {"id": 135},
+                "teams": {"home": {"id": home_id, "name": f"T{home_id}"}, "away": {"id": away_id, "name": f"T{away_id}"}},
+                "goals": {"home": 1, "away": 0},
+                "events": [{
+                    "type": "Goal",
+                    "detail": "Normal Goal",
+                    "player": {"name": f"Scorer {home_id}"},
+                    "team": {"id": home_id, "name": f"T{home_id}"},
+                    "time": {"elapsed": 10},
+                }],
+            }
+
+        real_league_stats = football_memory._apply_league_player_stats
+
+        def fail_for_team_100(memory, league_id, team_names, player_stats):
+            if "100" in team_names:
+                raise RuntimeError("boom")
+            real_league_stats(memory, league_id, team_names, player_stats)
+
+        good, bad = ft_match("m2", "300", "400"), ft_match("m1", "100", "200")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_path = Path(tmpdir) / "football_memory.json"
+            with patch.object(football_memory, "MEMORY_PATH", memory_path):
+                with patch.object(football_memory, "_apply_league_player_stats", side_effect=fail_for_team_100):
+                    results = asyncio.run(football_memory.update_matches_in_memory(None, [good, bad]))
+                saved = json.loads(memory_path.read_text(encoding="utf-8"))
+                retry = asyncio.run(football_memory.update_match_in_memory(None, bad))
+                memory = json.loads(memory_path.read_text(encoding="utf-8"))
+
+        self.assertEqual([r["reason"] for r in results], ["updated", "failed_exception"])
+        self.assertEqual(set(saved["matches"]), {"m2"})
+        self.assertNotIn("100", saved["teams"])
+        self.assertEqual(set(saved["leaderboards"]["leagues"]["135"]["players"]), {"300|Scorer 300"})
+        self.assertEqual(retry, {"updated": True, "reason": "updated"})
+        self.assertEqual(memory["teams"]["100"]["stats"]["wins"], 1)
+        self.assertEqual(memory["teams"]["100"]["players"]["Scorer 100"]["goals"], 1)
+
+    def test_memory_queue_applies_batch_with_one_write_and_survives_restart(self):
+        from modules import football_memory, match_state, memory_queue
+
+        def ft_match(fixture_id, home_id, away_id):
+            return {
+                "fixture": {"id": fixture_id, "date": "2026-05-24T18:00:00+00:00", "status": {"short": "FT"}},
+                "league": {"id": 135},
+                "teams": {
+                    "home": {"id": home_id, "name": f"Team {home_id}"},
+                    "away": {"id": away_id, "name": f"Team {away_id}"},
+                },
+                "goals": {"home": 0, "away": 0},
+                "events": [],
+            }
+
+        async def enqueue_both(memory_dir):
+            await memory_queue.enqueue("q1", ft_match("q1", "100", "200"), memory_dir=memory_dir)
+            await memory_queue.enqueue("q2", ft_match("q2", "300", "400"), memory_dir=memory_dir)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_dir = Path(tmpdir)
+            memory_path = memory_dir / "football_memory.json"
+            asyncio.run(enqueue_both(memory_dir))
+            self.assertEqual(memory_queue.queued_count(memory_dir), 2)
+            with (
+                patch.object(football_memory, "MEMORY_PATH", memory_path),
+                patch.object(football_memory, "save_memory_async", wraps=football_memory.save_memory_async) as save,
+            ):
+                totals = asyncio.run(memory_queue.drain(None, memory_dir=memory_dir))
+                memory = json.loads(memory_path.read_text(encoding="utf-8"))
+            states = [match_state.get_fixture_state(fixture_id, memory_dir=memory_dir) for fixture_id in ("q1", "q2")]
+            remaining = memory_queue.queued_count(memory_dir)
+
+        self.assertEqual(totals, {"applied": 2, "dropped": 0, "failed": 0})
+        save.assert_awaited_once()
+        self.assertEqual(set(memory["matches"]), {"q1", "q2"})
+        self.assertTrue(all(state["memory_updated"] for state in states))
+        self.assertEqual(remaining, 0)
+
+    def test_queued_ft_batch_is_not_lost_to_a_concurrent_standings_refresh(self):
+        from modules import football_memory, memory_queue
+
+        match = {
+            "fixture": {"id": "q1", "date": "2026-05-24T18:00:00+00:00", "status": {"short": "FT"}},
+            "league": {"id": 135},
+            "teams": {"home": {"id": "100", "name": "Home"}, "away": {"id": "200", "name": "Away"}},
+            "goals": {"home": 1, "away": 0},
+            "events": [],
+        }
+
+        async def scenario(memory_dir):
+            standings_fetching = asyncio.Event()
+            release_standings = asyncio.Event()
+
+            async def slow_standings(session, league_id, slug):
+                standings_fetching.set()
+                await release_standings.wait()
+                return {"name": "Serie A", "standings": [{"team_id": "100"}], "last_updated": "now"}
+
+            with patch.object(football_memory, "update_league_standings", slow_standings):
+                refresh = asyncio.create_task(football_memory.update_standings_only(None))
+                await standings_fetching.wait()
+                await memory_queue.enqueue("q1", match, memory_dir=memory_dir)
+                drain = asyncio.create_task(memory_queue.drain(None, memory_dir=memory_dir))
+                await asyncio.sleep(0.05)
+                release_standings.set()
+                await refresh
+                return await drain
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_dir = Path(tmpdir)
+            memory_path = memory_dir / "football_memory.json"
+            memory_path.write_text(
+                json.dumps({"metadata": {}, "leagues": {}, "teams": {}, "matches": {}}),
+                encoding="utf-8",
+            )
+            with (
+                patch.object(football_memory, "MEMORY_PATH", memory_path),
+                patch.object(football_memory, "TRACKED_LEAGUE_IDS", [135]),
+                patch.object(football_memory, "LEAGUE_SLUG_MAP", {135: "ita.1"}),
+            ):
+                totals = asyncio.run(scenario(memory_dir))
+                memory = json.loads(memory_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(totals["applied"], 1)
+        self.assertIn("q1", memory["matches"])
+        self.assertEqual(memory["leagues"]["135"]["standings"], [{"team_id": "100"}])
+
     def test_match_memory_uses_canonical_fixture_id_for_mapped_provider_match(self):
         from modules import football_memory
 
@@ -441,6 +572,144 @@ class FootballMemoryTests(unittest.TestCase):
         self.assertEqual(team["players"]["Scorer"]["position"], "Forward")
 
 
+    def _ft_match(self, fixture_id, date, home_goals, away_goals, events, league_id=135):
+        return {
+            "fixture": {"id": fixture_id, "date": date, "status": {"short": "FT"}},
+            "league": {"id": league_id},
+            "teams": {
+                "home": {"id": "100", "name": "Home"},
+                "away": {"id": "200", "name": "Away"},
+            },
+            "goals": {"home": home_goals, "away": away_goals},
+            "events": events,
+        }
+
+    def _goal(self, player, team_id, minute):
+        return {
+            "type": "Goal",
+            "detail": "Normal Goal",
+            "player": {"name": player},
+            "team": {"id": team_id, "name": "Home" if team_id == "100" else "Away"},
+            "time": {"elapsed": minute},
+        }
+
+    def test_ft_updates_maintain_leaderboards_and_form_incrementally(self):
+        from modules import football_memory
+
+        first = self._ft_match(
+            "m1",
+            "2026-05-17T18:00:00+00:00",
+            2,
+            1,
+            [
+                self._goal("Striker", "100", 10),
+                self._goal("Striker", "100", 30),
+                self._goal("Visitor", "200", 50),
+                {
+                    "type": "Card",
+                    "detail": "Yellow Card",
+                    "player": {"name": "Visitor"},
+                    "team": {"id": "200", "name": "Away"},
+                    "time": {"elapsed": 60},
+                },
+            ],
+        )
+        second = self._ft_match(
+            "m2",
+            "2026-05-24T18:00:00+00:00",
+            1,
+            1,
+            [self._goal("Winger", "100", 5), self._goal("Visitor", "200", 70)],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_path = Path(tmpdir) / "football_memory.json"
+            with patch.object(football_memory, "MEMORY_PATH", memory_path):
+                asyncio.run(football_memory.update_match_in_memory(None, second))
+                asyncio.run(football_memory.update_match_in_memory(None, first))
+                asyncio.run(football_memory.update_match_in_memory(None, first))
+                memory = json.loads(memory_path.read_text(encoding="utf-8"))
+
+        scorers = football_memory.get_league_leaders(135, "goals", limit=5, memory=memory)
+        self.assertEqual(
+            [(row["name"], row["team_name"], row["value"]) for row in scorers],
+            [("Striker", "Home", 2), ("Visitor", "Away", 2), ("Winger", "Home", 1)],
+        )
+        cards = football_memory.get_league_leaders(135, "yellow_cards", memory=memory)
+        self.assertEqual([(row["name"], row["value"]) for row in cards], [("Visitor", 1)])
+        self.assertEqual(football_memory.get_league_leaders(135, "assists", memory=memory), [])
+        self.assertEqual(
+            [(row["name"], row["value"]) for row in football_memory.get_team_top_scorers("100", memory=memory)],
+            [("Striker", 2), ("Winger", 1)],
+        )
+        self.assertEqual(
+            [(entry["match_id"], entry["result"], entry["score"]) for entry in football_memory.get_team_form("100", memory=memory)],
+            [("m2", "D", "1-1"), ("m1", "W", "2-1")],
+        )
+        self.assertEqual(
+            [entry["result"] for entry in football_memory.get_team_form("200", memory=memory)],
+            ["D", "L"],
+        )
+
+    def test_top_rows_stay_bounded_and_exact(self):
+        from modules import football_memory
+
+        rows = []
+        for name, value in (("A", 1), ("B", 3), ("C", 2), ("A", 4), ("D", 1)):
+            football_memory._update_top_rows(rows, {"key": name, "name": name, "value": value}, size=3)
+        self.assertEqual([(row["name"], row["value"]) for row in rows], [("A", 4), ("B", 3), ("C", 2)])
+
+    def test_legacy_memory_leaderboards_are_rebuilt_before_counting(self):
+        from modules import football_memory
+
+        legacy = {
+            "metadata": {},
+            "leagues": {},
+            "teams": {
+                "100": {
+                    "name": "Home",
+                    "players": {
+                        "Veteran": {"goals": 7, "assists": 0, "yellow_cards": 0, "red_cards": 0},
+                        "Bench": {"goals": 0, "assists": 0, "yellow_cards": 0, "red_cards": 0},
+                    },
+                    "stats": {"wins": 3, "draws": 0, "losses": 0, "goals_for": 9, "goals_against": 1},
+                },
+            },
+            "matches": {
+                "old": {
+                    "league_id": 135,
+                    "home": {"id": "100", "name": "Home"},
+                    "away": {"id": "300", "name": "Other"},
+                    "score": {"home": 1, "away": 0},
+                    "status": "FT",
+                    "date": "2026-05-10T18:00:00+00:00",
+                    "events": [self._goal("Veteran", "100", 12)],
+                },
+            },
+        }
+        match = self._ft_match(
+            "new",
+            "2026-05-24T18:00:00+00:00",
+            1,
+            0,
+            [self._goal("Veteran", "100", 80)],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_path = Path(tmpdir) / "football_memory.json"
+            memory_path.write_text(json.dumps(legacy), encoding="utf-8")
+            with patch.object(football_memory, "MEMORY_PATH", memory_path):
+                asyncio.run(football_memory.update_match_in_memory(None, match))
+                memory = json.loads(memory_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(memory["leaderboards"]["version"], football_memory.LEADERBOARDS_VERSION)
+        self.assertEqual(memory["teams"]["100"]["top_scorers"], [{"key": "Veteran", "name": "Veteran", "value": 8}])
+        self.assertEqual(
+            [(row["name"], row["value"]) for row in football_memory.get_league_leaders(135, memory=memory)],
+            [("Veteran", 2)],
+        )
+        self.assertEqual([entry["match_id"] for entry in memory["teams"]["100"]["form"]], ["new", "old"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,8 +16,18 @@ os.environ.setdefault("CHANNEL_ID", "123456789")
 
 class FtAndLiveLoopTests(unittest.TestCase):
 
+    def setUp(self):
+        from modules import match_state
+
+        # Live-loop tests use the default state location; keep it out of bot_memory/.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch.object(match_state, "BOT_MEMORY_DIR", Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_terminal_non_ft_fixture_updates_state_without_posting(self):
-        from modules import ft_handler, match_state
+        from modules import ft_handler, match_state, memory_queue
         from modules import api_provider
 
         match = espn_match(fixture_id="abd-1")
@@ -28,19 +38,19 @@ class FtAndLiveLoopTests(unittest.TestCase):
             with (
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=match)),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock()) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("abd-1", memory_dir=memory_dir)
-                return state, post_msg, update_memory
+                return state, post_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            state, post_msg, update_memory = asyncio.run(run(Path(tmp)))
+            state, post_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         self.assertEqual(state["last_status"], "ABD")
         self.assertFalse(state.get("ft_announced", False))
         post_msg.assert_not_awaited()
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
 
     def test_ft_post_after_penalties_includes_winner_score_and_not_shootout_as_goals(self):
         from modules import ft_handler
@@ -107,8 +117,35 @@ class FtAndLiveLoopTests(unittest.TestCase):
         self.assertIn("90' - E. Haaland", content)
         self.assertIn("1 goal(s) missing from event data", content)
 
+    def test_ft_and_live_renders_are_memoized_until_inputs_change(self):
+        from modules import ft_handler, live_loop
+        from modules.render_cache import RenderCache
+
+        match = shootout_match()
+        cache = RenderCache("test_renders", max_entries=8)
+        with (
+            patch.object(ft_handler, "football_renders", cache),
+            patch.object(live_loop, "football_renders", cache),
+            patch.object(ft_handler, "format_match_events", wraps=ft_handler.format_match_events) as ft_format,
+            patch.object(live_loop, "format_match_events", wraps=live_loop.format_match_events) as live_format,
+        ):
+            first = ft_handler._build_ft_message(match)
+            self.assertEqual(ft_handler._build_ft_message(dict(match)), first)
+            warned = ft_handler._build_ft_message(match, show_missing_warning=True)
+            args = (match, "Home", "Away", match["goals"], match["events"], "PEN")
+            live_line = live_loop._render_live_line(*args)
+            self.assertEqual(live_loop._render_live_line(*args), live_line)
+            match["goals"] = {"home": 2, "away": 1}
+            changed = ft_handler._build_ft_message(match)
+
+        self.assertEqual(ft_format.call_count, 3)
+        self.assertEqual(live_format.call_count, 1)
+        self.assertEqual(warned, first)
+        self.assertNotEqual(changed, first)
+        self.assertEqual(cache.stats()["hits"], 2)
+
     def test_api_football_terminal_penalty_status_posts_and_updates_memory_once(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         match = shootout_match()
         match["fixture"]["status"] = {
@@ -124,13 +161,14 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=match)),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)) as post_msg,
                 patch.object(
-                    ft_handler,
-                    "update_match_in_memory",
-                    AsyncMock(return_value={"updated": True, "reason": "updated"}),
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": True, "reason": "updated"} for _match in matches]),
                 ) as update_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("shootout-1", memory_dir=memory_dir)
                 return state, post_msg, update_memory
 
@@ -143,8 +181,118 @@ class FtAndLiveLoopTests(unittest.TestCase):
         post_msg.assert_awaited_once()
         update_memory.assert_awaited_once()
 
+    def test_ft_post_goes_out_before_the_memory_update_is_queued(self):
+        from modules import api_provider, ft_handler, memory_queue
+
+        match = shootout_match()
+        match["fixture"]["status"] = {"short": "PEN", "long": "Match Finished", "elapsed": 120}
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        fake_message = type("FakeMessage", (), {"id": 123})()
+        order = []
+
+        async def post(*_args, **_kwargs):
+            order.append("post")
+            return fake_message
+
+        async def enqueue(fixture_id, *_args, **_kwargs):
+            order.append("enqueue")
+
+        async def run(memory_dir: Path):
+            with (
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=match)),
+                patch.object(ft_handler, "post_new_general_message", AsyncMock(side_effect=post)),
+                patch.object(memory_queue, "enqueue", AsyncMock(side_effect=enqueue)),
+            ):
+                await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(run(Path(tmp)))
+
+        self.assertEqual(order, ["post", "enqueue"])
+
+    def test_memory_queue_give_up_stops_ft_processing_from_requeueing(self):
+        from modules import api_provider, ft_handler, match_state, memory_queue
+
+        match = shootout_match()
+        match["fixture"]["status"] = {"short": "PEN", "long": "Match Finished", "elapsed": 120}
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        fake_message = type("FakeMessage", (), {"id": 123})()
+        polls = iter(range(100))
+
+        async def fresh_snapshot(_session, details):
+            # Each poll yields a slightly different snapshot, which used to reset the attempt count.
+            return {**details, "poll": next(polls)}
+
+        async def run(memory_dir: Path):
+            with (
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(side_effect=fresh_snapshot)),
+                patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)),
+                patch.object(
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": False, "reason": "failed_exception"}] * len(matches)),
+                ) as update_memory,
+            ):
+                for _cycle in range(memory_queue._MAX_ATTEMPTS + 3):
+                    await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                    await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
+                state = match_state.get_fixture_state("shootout-1", memory_dir=memory_dir)
+                return state, update_memory, memory_queue.is_queued("shootout-1", memory_dir=memory_dir)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state, update_memory, queued = asyncio.run(run(Path(tmp)))
+
+        self.assertEqual(update_memory.await_count, memory_queue._MAX_ATTEMPTS)
+        self.assertTrue(state["memory_update_failed"])
+        self.assertFalse(state["memory_updated"])
+        self.assertFalse(queued)
+
+    def test_cancelled_cycle_still_marks_in_flight_ft_post_announced(self):
+        from modules import api_provider, ft_handler, match_state, memory_queue
+
+        match = shootout_match()
+        match["fixture"]["status"] = {"short": "PEN", "long": "Match Finished", "elapsed": 120}
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        fake_message = type("FakeMessage", (), {"id": 123})()
+
+        async def run(memory_dir: Path):
+            posting = asyncio.Event()
+            release = asyncio.Event()
+
+            async def slow_post(*_args, **_kwargs):
+                posting.set()
+                await release.wait()
+                return fake_message
+
+            with (
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=match)),
+                patch.object(ft_handler, "post_new_general_message", AsyncMock(side_effect=slow_post)) as post_msg,
+                patch.object(memory_queue, "enqueue", AsyncMock()),
+            ):
+                cycle = asyncio.create_task(ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir))
+                await asyncio.wait_for(posting.wait(), 5)
+                cycle.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await cycle
+                # The next cycle joins the post still under way instead of sending another.
+                next_cycle = asyncio.create_task(
+                    ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                )
+                await asyncio.sleep(0)
+                release.set()
+                await next_cycle
+                await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                return match_state.get_fixture_state("shootout-1", memory_dir=memory_dir), post_msg
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state, post_msg = asyncio.run(run(Path(tmp)))
+
+        self.assertTrue(state["ft_announced"])
+        self.assertEqual(state["ft_message_id"], 123)
+        post_msg.assert_awaited_once()
+
     def test_api_football_terminal_penalty_result_updates_real_memory_before_flag(self):
-        from modules import api_provider, football_memory, ft_handler, match_state
+        from modules import api_provider, football_memory, ft_handler, match_state, memory_queue
 
         match = shootout_match()
         match["fixture"]["status"] = {
@@ -162,6 +310,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 patch.object(football_memory, "MEMORY_PATH", memory_path),
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("shootout-1", memory_dir=memory_dir)
                 return state
 
@@ -177,7 +326,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         self.assertEqual(memory["teams"]["100"]["stats"]["draws"], 1)
 
     def test_memory_skip_keeps_memory_updated_false_for_retry(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         match = shootout_match()
         match["fixture"]["status"] = {
@@ -193,12 +342,13 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=match)),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)),
                 patch.object(
-                    ft_handler,
-                    "update_match_in_memory",
-                    AsyncMock(return_value={"updated": False, "reason": "missing_required_data"}),
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": False, "reason": "missing_required_data"} for _match in matches]),
                 ),
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 return match_state.get_fixture_state("shootout-1", memory_dir=memory_dir)
 
         with tempfile.TemporaryDirectory() as tmp:
@@ -208,7 +358,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         self.assertFalse(state["memory_updated"])
 
     def test_ft_pending_missing_events_posts_without_warning_and_defers_memory(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         match = espn_match(fixture_id="pending-ft-events")
         match["fixture"]["status"] = {"short": "FT", "long": "Full Time", "elapsed": 90}
@@ -226,23 +376,23 @@ class FtAndLiveLoopTests(unittest.TestCase):
                     "score_key": "pending-ft-events:2:0",
                 }),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("pending-ft-events", memory_dir=memory_dir)
-                return state, post_msg, update_memory
+                return state, post_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            state, post_msg, update_memory = asyncio.run(run(Path(tmp)))
+            state, post_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         self.assertTrue(state["ft_announced"])
         self.assertFalse(state["memory_updated"])
         self.assertEqual(state["ft_message_id"], 321)
         self.assertNotIn("missing from event data", post_msg.await_args.kwargs["content"])
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
 
     def test_ft_existing_message_is_edited_when_enrichment_later_completes(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         pending = espn_match(fixture_id="editable-ft-events")
         pending["fixture"]["status"] = {"short": "FT", "long": "Full Time", "elapsed": 90}
@@ -278,13 +428,14 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)) as post_msg,
                 patch.object(ft_handler, "edit_general_message", AsyncMock(return_value=fake_message)) as edit_msg,
                 patch.object(
-                    ft_handler,
-                    "update_match_in_memory",
-                    AsyncMock(return_value={"updated": True, "reason": "updated"}),
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": True, "reason": "updated"} for _match in matches]),
                 ) as update_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, pending, memory_dir=memory_dir)
                 await ft_handler.process_terminal_fixture(fake_bot, pending, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("editable-ft-events", memory_dir=memory_dir)
                 return state, post_msg, edit_msg, update_memory
 
@@ -299,7 +450,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         self.assertEqual(update_memory.await_count, 1)
 
     def test_ft_exhausted_missing_events_edits_stored_message_with_warning(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         match = espn_match(fixture_id="exhausted-ft-events")
         match["fixture"]["status"] = {"short": "FT", "long": "Full Time", "elapsed": 90}
@@ -326,13 +477,14 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)) as post_msg,
                 patch.object(ft_handler, "edit_general_message", AsyncMock(return_value=fake_message)) as edit_msg,
                 patch.object(
-                    ft_handler,
-                    "update_match_in_memory",
-                    AsyncMock(return_value={"updated": True, "reason": "updated"}),
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": True, "reason": "updated"} for _match in matches]),
                 ) as update_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("exhausted-ft-events", memory_dir=memory_dir)
                 return state, post_msg, edit_msg, update_memory
 
@@ -347,7 +499,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         self.assertEqual(update_memory.await_count, 1)
 
     def test_fully_resolved_exhausted_ft_message_can_be_edited_after_late_enrichment(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         base = espn_match(fixture_id="late-complete-ft")
         base["fixture"]["status"] = {"short": "FT", "long": "Full Time", "elapsed": 90}
@@ -396,17 +548,17 @@ class FtAndLiveLoopTests(unittest.TestCase):
                 }),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock()) as post_msg,
                 patch.object(ft_handler, "edit_general_message", AsyncMock(return_value=fake_message)) as edit_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, base, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("late-complete-ft", memory_dir=memory_dir)
-                return state, post_msg, edit_msg, update_memory
+                return state, post_msg, edit_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            state, post_msg, edit_msg, update_memory = asyncio.run(run(Path(tmp)))
+            state, post_msg, edit_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         post_msg.assert_not_awaited()
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
         edit_msg.assert_awaited_once()
         edited_content = edit_msg.await_args.kwargs["content"]
         self.assertIn("Late Complete Scorer", edited_content)
@@ -457,6 +609,67 @@ class FtAndLiveLoopTests(unittest.TestCase):
 
         process_terminal.assert_not_awaited()
 
+    def test_fetch_and_post_ft_runs_fixtures_in_parallel_and_queues_memory_updates(self):
+        from modules import api_provider, ft_handler, match_state, memory_queue
+
+        now_utc = datetime(2026, 6, 3, 23, 0, tzinfo=timezone.utc)
+        matches = []
+        for index in range(6):
+            match = espn_match(fixture_id=f"sunday-{index}")
+            match["fixture"]["date"] = "2026-06-03T20:00:00Z"
+            match["fixture"]["status"] = {"short": "FT", "long": "Full Time", "elapsed": 90}
+            match["goals"] = {"home": 0, "away": 0}
+            matches.append(match)
+        # A second provider payload for the same fixture must not announce it twice.
+        matches.append(dict(matches[0]))
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        active = {"enrich": 0, "enrich_peak": 0}
+
+        async def slow_enrich(_session, match):
+            active["enrich"] += 1
+            active["enrich_peak"] = max(active["enrich_peak"], active["enrich"])
+            await asyncio.sleep(0.01)
+            active["enrich"] -= 1
+            return match
+
+        async def run(memory_dir: Path):
+            with (
+                patch.object(match_state, "BOT_MEMORY_DIR", memory_dir),
+                patch.object(memory_queue, "BOT_MEMORY_DIR", memory_dir),
+                patch.object(memory_queue, "_queue_lock", asyncio.Lock()),
+                patch.object(ft_handler, "_FT_FIXTURE_CONCURRENCY", 3),
+                patch.object(ft_handler, "utc_now", return_value=now_utc),
+                patch.object(api_provider, "fetch_relevant_football", AsyncMock(return_value=matches)),
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(side_effect=slow_enrich)),
+                patch.object(
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, batch: [{"updated": True, "reason": "updated"} for _m in batch]),
+                ) as update_memory,
+                patch.object(ft_handler, "post_new_general_message", AsyncMock(
+                    return_value=type("FakeMessage", (), {"id": 321})()
+                )) as post_msg,
+                patch.object(match_state, "expected_ft_due_fixture_ids", return_value=[]),
+            ):
+                await ft_handler.fetch_and_post_ft(fake_bot)
+                before = [match_state.get_fixture_state(f"sunday-{index}") for index in range(6)]
+                queued = memory_queue.queued_count()
+                await memory_queue.drain(None)
+                after = [match_state.get_fixture_state(f"sunday-{index}") for index in range(6)]
+                return post_msg, update_memory, before, queued, after, memory_queue.queued_count()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            post_msg, update_memory, before, queued, after, remaining = asyncio.run(run(Path(tmp)))
+
+        self.assertEqual(post_msg.await_count, 6)
+        self.assertEqual(active["enrich_peak"], 3)
+        self.assertTrue(all(state["ft_announced"] and not state["memory_updated"] for state in before))
+        self.assertEqual(queued, 6)
+        update_memory.assert_awaited_once()
+        self.assertEqual(len(update_memory.await_args.args[1]), 6)
+        self.assertTrue(all(state["memory_updated"] for state in after))
+        self.assertEqual(remaining, 0)
+
     def test_fetch_and_post_ft_allows_fully_resolved_exhausted_fixture_for_message_repair(self):
         from modules import api_provider, ft_handler, match_state
 
@@ -507,7 +720,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         process_terminal.assert_awaited_once()
 
     def test_process_terminal_fixture_skips_mapped_fallback_when_canonical_is_resolved(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         api_match = espn_match(fixture_id="1489379", league_id=1)
         api_match["canonical_fixture_id"] = "760429"
@@ -535,17 +748,17 @@ class FtAndLiveLoopTests(unittest.TestCase):
             with (
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=api_match)) as enrich,
                 patch.object(ft_handler, "post_new_general_message", AsyncMock()) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, api_match, memory_dir=memory_dir)
-                return enrich, post_msg, update_memory
+                return enrich, post_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            enrich, post_msg, update_memory = asyncio.run(run(Path(tmp)))
+            enrich, post_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         enrich.assert_not_awaited()
         post_msg.assert_not_awaited()
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
 
     def test_fetch_and_post_ft_uses_provider_alias_for_due_direct_fetch(self):
         from modules import api_provider, ft_handler, match_state
@@ -587,7 +800,7 @@ class FtAndLiveLoopTests(unittest.TestCase):
         fetch_fixture.assert_awaited_once_with(None, "1489379")
 
     def test_unmapped_api_football_terminal_fixture_does_not_post_or_update_memory(self):
-        from modules import api_provider, ft_handler
+        from modules import api_provider, ft_handler, memory_queue
 
         api_match = espn_match(fixture_id="1539002", league_id=1)
         api_match["provider"] = "api_football"
@@ -599,19 +812,19 @@ class FtAndLiveLoopTests(unittest.TestCase):
             with (
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=api_match)),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock()) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, api_match, memory_dir=memory_dir)
-                return post_msg, update_memory
+                return post_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            post_msg, update_memory = asyncio.run(run(Path(tmp)))
+            post_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         post_msg.assert_not_awaited()
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
 
     def test_incomplete_mapped_api_football_terminal_fixture_posts_without_warning_and_waits_for_memory(self):
-        from modules import api_provider, ft_handler, match_state
+        from modules import api_provider, ft_handler, match_state, memory_queue
 
         api_match = espn_match(fixture_id="1489379", league_id=1)
         api_match["canonical_fixture_id"] = "760429"
@@ -643,20 +856,20 @@ class FtAndLiveLoopTests(unittest.TestCase):
             with (
                 patch.object(api_provider, "enrich_fixture_events", AsyncMock(return_value=api_match)),
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=fake_message)) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock()) as update_memory,
+                patch.object(memory_queue, "enqueue", AsyncMock()) as queue_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, api_match, memory_dir=memory_dir)
                 state = match_state.get_fixture_state("760429", memory_dir=memory_dir)
-                return state, post_msg, update_memory
+                return state, post_msg, queue_memory
 
         with tempfile.TemporaryDirectory() as tmp:
-            state, post_msg, update_memory = asyncio.run(run(Path(tmp)))
+            state, post_msg, queue_memory = asyncio.run(run(Path(tmp)))
 
         self.assertTrue(state["ft_announced"])
         self.assertFalse(state["memory_updated"])
         post_msg.assert_awaited_once()
         self.assertNotIn("missing from event data", post_msg.await_args.kwargs["content"])
-        update_memory.assert_not_awaited()
+        queue_memory.assert_not_awaited()
 
     def test_live_penalty_update_includes_penalty_score(self):
         from modules import live_loop
@@ -1218,6 +1431,132 @@ class FtAndLiveLoopTests(unittest.TestCase):
         update_live_id.assert_called_once_with("stale-live-id", 888)
         self.assertEqual(live_ids["stale-live-id"], 888)
 
+    def test_live_loop_processes_fixtures_concurrently_within_bound(self):
+        from modules import live_loop
+        from modules import api_provider
+
+        matches = []
+        for index in range(6):
+            match = espn_match(fixture_id=f"parallel-{index}")
+            match["fixture"]["status"] = {"short": "1H", "elapsed": 10 + index}
+            match["goals"] = {"home": 1, "away": 0}
+            matches.append(match)
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        active = {"now": 0, "peak": 0}
+
+        async def slow_upsert(**kwargs):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return type("FakeMessage", (), {"id": 900})()
+
+        async def run():
+            live_loop.live_state_keys.clear()
+            live_loop.live_message_ids.clear()
+            live_loop._missing_since.clear()
+            live_loop._last_observed.clear()
+            live_loop._regression_hold.clear()
+            live_loop._last_sent_content.clear()
+            with (
+                patch.object(live_loop, "_LIVE_FIXTURE_CONCURRENCY", 3),
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(side_effect=lambda _session, match: match)),
+                patch.object(live_loop, "is_tracked_for_ft", return_value=True),
+                patch.object(live_loop.match_state, "get_fixture_state", return_value={}),
+                patch.object(live_loop.match_state, "upsert_fixture_from_match", return_value={}),
+                patch.object(live_loop.match_state, "update_live_message_id"),
+                patch.object(live_loop, "upsert_live_message", AsyncMock(side_effect=slow_upsert)) as upsert_live,
+                patch.object(live_loop, "prune_live_state", return_value=[]),
+            ):
+                await live_loop.run_live_loop(fake_bot, matches=matches)
+                return upsert_live, set(live_loop.live_state_keys)
+
+        upsert_live, live_ids = asyncio.run(run())
+
+        self.assertEqual(upsert_live.await_count, 6)
+        self.assertEqual(active["peak"], 3)
+        self.assertEqual(live_ids, {f"parallel-{index}" for index in range(6)})
+
+    def test_concurrent_enrichment_shares_one_live_payload_request(self):
+        from modules import api_provider
+
+        payload = {"response": []}
+
+        async def slow_fetch(_session):
+            await asyncio.sleep(0.01)
+            return payload
+
+        async def run():
+            with (
+                patch.object(api_provider, "_api_live_fixtures_cache", None),
+                patch.object(api_provider, "_api_live_fixtures_cache_ts", None),
+                patch.object(api_provider, "_api_live_fixtures_inflight", None),
+                patch.object(api_provider, "_consume_enrichment_api_call", return_value=True) as consume,
+                patch.object(api_provider.api_client, "fetch_live_fixtures_payload", AsyncMock(side_effect=slow_fetch)) as fetch,
+            ):
+                results = await asyncio.gather(
+                    *(api_provider._get_api_football_live_payload(None) for _ in range(4))
+                )
+                return results, consume, fetch
+
+        results, consume, fetch = asyncio.run(run())
+
+        self.assertEqual(results, [payload] * 4)
+        consume.assert_called_once()
+        fetch.assert_awaited_once()
+
+    def test_live_board_mode_edits_one_message_per_cycle_only_on_change(self):
+        from modules import live_board, live_loop
+        from modules import api_provider
+
+        def cycle_matches(away_goals):
+            matches = []
+            for index in range(5):
+                match = espn_match(fixture_id=f"board-{index}")
+                match["fixture"]["status"] = {"short": "1H", "elapsed": 30}
+                match["goals"] = {"home": 1, "away": away_goals if index == 0 else 0}
+                matches.append(match)
+            return matches
+
+        fake_bot = type("FakeBot", (), {"http_session": None})()
+        board_upsert = AsyncMock(return_value=type("FakeMessage", (), {"id": 700})())
+
+        async def run():
+            live_board.reset()
+            live_loop.live_state_keys.clear()
+            live_loop.live_message_ids.clear()
+            live_loop._missing_since.clear()
+            live_loop._last_observed.clear()
+            live_loop._regression_hold.clear()
+            live_loop._last_sent_content.clear()
+            with (
+                patch.object(live_board, "LIVE_BOARD_ENABLED", True),
+                patch.object(live_board, "load", return_value={"message_ids": []}),
+                patch.object(live_board, "save_async", AsyncMock()) as save_ids,
+                patch.object(live_board, "upsert_live_message", board_upsert),
+                patch.object(api_provider, "enrich_fixture_events", AsyncMock(side_effect=lambda _session, match: match)),
+                patch.object(live_loop, "is_tracked_for_ft", return_value=True),
+                patch.object(live_loop.match_state, "upsert_fixture_from_match", return_value={}),
+                patch.object(live_loop, "upsert_live_message", AsyncMock()) as per_match_upsert,
+                patch.object(live_loop, "prune_live_state", return_value=[]),
+            ):
+                await live_loop.run_live_loop(fake_bot, matches=cycle_matches(0))
+                await live_loop.run_live_loop(fake_bot, matches=cycle_matches(0))
+                await live_loop.run_live_loop(fake_bot, matches=cycle_matches(1))
+                live_board.reset()
+                return per_match_upsert, save_ids
+
+        per_match_upsert, save_ids = asyncio.run(run())
+
+        per_match_upsert.assert_not_awaited()
+        self.assertEqual(board_upsert.await_count, 2)
+        first, last = board_upsert.await_args_list
+        self.assertIsNone(first.kwargs["message_id"])
+        self.assertEqual(last.kwargs["message_id"], 700)
+        self.assertEqual(first.kwargs["content"].count("Football LIVE"), 5)
+        self.assertNotEqual(first.kwargs["content"], last.kwargs["content"])
+        save_ids.assert_awaited_once()
+
     def test_live_loop_cleans_missing_volatile_state_when_no_live_matches_returned(self):
         from modules import live_loop
         from modules import api_provider
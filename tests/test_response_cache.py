@@ -0,0 +1,133 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+os.environ.setdefault("BOT_TOKEN", "test-token")
+os.environ.setdefault("API_KEY", "test-api-key")
+os.environ.setdefault("CHANNEL_ID", "123456789")
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def test_lru_eviction_keeps_recently_used_entries(self):
+        from modules.response_cache import ResponseCache
+
+        cache = ResponseCache("test", max_entries=2, default_ttl_sec=60)
+        cache.set("a", 1, now=1000)
+        cache.set("b", 2, now=1000)
+        self.assertEqual(cache.get("a", now=1001), 1)
+        cache.set("c", 3, now=1002)
+
+        self.assertIsNone(cache.get("b", now=1003))
+        self.assertEqual(cache.get("a", now=1003), 1)
+        self.assertEqual(cache.get("c", now=1003), 3)
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_per_key_ttl_overrides_default(self):
+        from modules.response_cache import ResponseCache
+
+        cache = ResponseCache("test", max_entries=10, default_ttl_sec=60)
+        cache.set("short", "x", ttl_sec=5, now=1000)
+        cache.set("default", "y", now=1000)
+
+        self.assertIsNone(cache.get("short", now=1006))
+        self.assertEqual(cache.get("default", now=1059), "y")
+        self.assertIsNone(cache.get("default", now=1061))
+        self.assertEqual(cache.stats()["expirations"], 2)
+
+    def test_explicit_invalidation_by_key_and_prefix(self):
+        from modules.response_cache import ResponseCache
+
+        cache = ResponseCache("test", max_entries=10, default_ttl_sec=60)
+        for key in ("standings_ita.1", "standings_eng.1", "team_info_1_ita.1"):
+            cache.set(key, {"key": key}, now=1000)
+
+        self.assertTrue(cache.invalidate("team_info_1_ita.1"))
+        self.assertFalse(cache.invalidate("team_info_1_ita.1"))
+        self.assertEqual(cache.invalidate_prefix("standings_"), 2)
+        self.assertEqual(cache.stats()["entries"], 0)
+        self.assertEqual(cache.stats()["invalidations"], 3)
+
+    def test_persisted_entries_survive_restart_and_expired_entries_are_dropped(self):
+        from modules.response_cache import ResponseCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.json"
+            cache = ResponseCache("test", max_entries=10, default_ttl_sec=60, path=path)
+            cache.set("live", {"rows": [1, 2]}, now=1000)
+            cache.set("stale", {"rows": []}, ttl_sec=10, now=1000)
+            self.assertTrue(cache.persist(now=1001))
+            self.assertFalse(cache.persist(now=1002))
+
+            restarted = ResponseCache("test", max_entries=10, default_ttl_sec=60, path=path)
+            self.assertEqual(restarted.get("live", now=1030), {"rows": [1, 2]})
+            self.assertIsNone(restarted.get("stale", now=1030))
+            self.assertEqual(list(Path(tmpdir).glob("*.tmp")), [])
+
+    def test_corrupt_cache_file_starts_empty(self):
+        from modules.response_cache import ResponseCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.json"
+            path.write_text("{not json", encoding="utf-8")
+            cache = ResponseCache("test", max_entries=10, default_ttl_sec=60, path=path)
+            with self.assertLogs("modules.response_cache", level="WARNING"):
+                self.assertIsNone(cache.get("anything", now=1000))
+
+    def test_standings_cache_is_invalidated_after_new_ft_match(self):
+        from modules import football_memory, storage
+        from modules.response_cache import ResponseCache
+
+        match = {
+            "fixture": {"id": "m1", "date": "2026-05-24T18:00:00+00:00", "status": {"short": "FT"}},
+            "league": {"id": 135},
+            "teams": {"home": {"id": "100", "name": "Home"}, "away": {"id": "200", "name": "Away"}},
+            "goals": {"home": 1, "away": 0},
+            "events": [],
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResponseCache("test", max_entries=10, default_ttl_sec=60, path=Path(tmpdir) / "cache.json")
+            cache.set("standings_ita.1", {"standings": []})
+            cache.set("standings_eng.1", {"standings": []})
+            with (
+                patch.object(football_memory, "MEMORY_PATH", Path(tmpdir) / "football_memory.json"),
+                patch.object(football_memory, "LEAGUE_SLUG_MAP", {135: "ita.1", 39: "eng.1"}),
+                patch.object(football_memory, "espn_cache", cache),
+            ):
+                asyncio.run(football_memory.update_match_in_memory(None, match))
+            self.assertTrue(storage.flush_pending_writes(timeout=5))
+            persisted = json.loads((Path(tmpdir) / "cache.json").read_text(encoding="utf-8"))
+
+        self.assertIsNone(cache.get("standings_ita.1"))
+        self.assertIsNotNone(cache.get("standings_eng.1"))
+        self.assertEqual(set(persisted["entries"]), {"standings_eng.1"})
+
+    def test_team_search_results_are_cached_but_misses_are_not(self):
+        from modules import api_provider
+        from modules.response_cache import ResponseCache
+
+        cache = ResponseCache("test", max_entries=10, default_ttl_sec=60)
+        search = AsyncMock(side_effect=[("103", "ita.1"), None, None])
+        with (
+            patch.object(api_provider, "team_search_cache", cache),
+            patch.object(api_provider.espn_client, "search_team_espn", search),
+        ):
+            first = asyncio.run(api_provider._search_team_cached(object(), "AC  Milan"))
+            second = asyncio.run(api_provider._search_team_cached(object(), "ac milan"))
+            asyncio.run(api_provider._search_team_cached(object(), "Nowhere FC"))
+            asyncio.run(api_provider._search_team_cached(object(), "Nowhere FC"))
+
+        self.assertEqual(first, ("103", "ita.1"))
+        self.assertEqual(second, ("103", "ita.1"))
+        self.assertEqual(search.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import asyncio
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("BOT_TOKEN", "test-token")
+os.environ.setdefault("API_KEY", "test-api-key")
+os.environ.setdefault("CHANNEL_ID", "123456789")
+
+from scripts import simulate_lifecycle as sim
+from utils import espn_client
+
+
+class MatchdaySimulatorTests(unittest.TestCase):
+    def test_synthetic_football_timeline_normalizes_like_espn(self):
+        fixture = {
+            "id": "sim-1",
+            "kickoff_utc": "2026-06-03T13:00:00Z",
+            "home": "Sim Rovers",
+            "away": "Sim Athletic",
+            "goals": [
+                {"minute": 12, "team": "home", "player": "Ada Early"},
+                {"minute": 90, "extra": 3, "team": "home", "player": "Cy Late"},
+            ],
+        }
+        kickoff = datetime(2026, 6, 3, 13, 0, tzinfo=timezone.utc)
+
+        def at(minutes):
+            return espn_client._normalize_event(sim._espn_football_event(fixture, kickoff + timedelta(minutes=minutes)), 1)
+
+        self.assertEqual(at(-5)["fixture"]["status"]["short"], "NS")
+        self.assertIsNone(at(-5)["goals"]["home"])
+
+        first_half = at(20)
+        self.assertEqual(first_half["fixture"]["status"]["short"], "1H")
+        self.assertEqual(first_half["goals"], {"home": 1, "away": 0})
+        self.assertEqual(first_half["events"][0]["player"]["name"], "Ada Early")
+
+        self.assertEqual(at(50)["fixture"]["status"]["short"], "HT")
+
+        final = at(200)
+        self.assertEqual(final["fixture"]["status"]["short"], "FT")
+        self.assertEqual(final["goals"], {"home": 2, "away": 0})
+        self.assertEqual(final["events"][1]["time"], {"elapsed": 90, "extra": 3})
+        self.assertEqual(final["winner"], "Sim Rovers")
+        self.assertEqual(
+            sim._goal_time_utc(fixture, fixture["goals"][1]),
+            kickoff + timedelta(minutes=sim._FIRST_HALF_MIN + sim._HALFTIME_MIN + 48),
+        )
+
+    def test_virtual_clock_loop_fires_long_timers_immediately(self):
+        loop = sim.VirtualClockLoop()
+        try:
+            started = loop.time()
+            loop.run_until_complete(asyncio.sleep(6 * 3600))
+            elapsed = loop.time() - started
+        finally:
+            loop.close()
+
+        self.assertGreaterEqual(elapsed, 6 * 3600)
+        self.assertLess(elapsed, 6 * 3600 + 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
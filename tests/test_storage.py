@@ -1,9 +1,16 @@
+import asyncio
 import json
+import os
+import threading
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+os.environ.setdefault("BOT_TOKEN", "test-token")
+os.environ.setdefault("API_KEY", "test-api-key")
+os.environ.setdefault("CHANNEL_ID", "123456789")
+
 
 class StorageTests(unittest.TestCase):
 
@@ -31,6 +38,84 @@ class StorageTests(unittest.TestCase):
             self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"mode": "verbose"})
             self.assertEqual(list(target.parent.glob("*.tmp")), [])
 
+    def test_watched_file_serves_memory_and_picks_up_external_replace(self):
+        from modules import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_dir = Path(tmpdir)
+            ticks = iter([0.0, 0.2, 0.4, 0.6, 5.0, 5.1])
+            with patch.object(storage, "BOT_MEMORY_DIR", memory_dir):
+                watched = storage.WatchedJSONFile(
+                    "state.json",
+                    {"mode": "verbose"},
+                    recheck_sec=1.0,
+                    clock=lambda: next(ticks),
+                )
+                self.assertEqual(watched.get(), {"mode": "verbose"})
+
+                watched.save({"mode": "normal"})
+                self.assertEqual(watched.get(), {"mode": "normal"})
+
+                # Another process atomically replaces the file.
+                storage.save_json_path(memory_dir / "state.json", {"mode": "silent"})
+                self.assertEqual(watched.get(), {"mode": "normal"})
+                self.assertEqual(watched.get(), {"mode": "silent"})
+                self.assertEqual(watched.get(), {"mode": "silent"})
+
+            self.assertEqual(watched.stats()["reads"], 2)
+
+    def test_compact_and_gzip_formats_round_trip_through_auto_detecting_reader(self):
+        from modules import storage
+
+        data = {"teams": {"100": {"name": "Inter", "players": {"Lautaro Martínez": {"goals": 3}}}}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            indented = Path(tmpdir) / "indented.json"
+            compact = Path(tmpdir) / "compact.json"
+            compressed = Path(tmpdir) / "compressed.json"
+            storage.save_json_path(indented, data, ensure_ascii=False)
+            storage.save_json_path(compact, data, ensure_ascii=False, compact=True)
+            storage.save_json_path(compressed, data, ensure_ascii=False, compact=True, compress=True)
+
+            self.assertNotIn(b"\n", compact.read_bytes())
+            self.assertLess(compact.stat().st_size, indented.stat().st_size)
+            self.assertEqual(compressed.read_bytes()[:2], b"\x1f\x8b")
+            for path in (indented, compact, compressed):
+                self.assertEqual(storage.load_json_path(path), data)
+
+    def test_compact_output_is_identical_without_optional_codec(self):
+        from modules import storage
+
+        data = {"b": [1, 2], "a": {"z": "é", "y": None}}
+        with patch.object(storage, "orjson", None):
+            fallback = storage.encode_json(data, ensure_ascii=False, compact=True, sort_keys=True)
+        self.assertEqual(json.loads(fallback), data)
+        self.assertEqual(fallback, storage.encode_json(data, ensure_ascii=False, compact=True, sort_keys=True))
+
+    def test_truncated_gzip_state_loads_defaults(self):
+        from modules import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_dir = Path(tmpdir)
+            payload = storage.encode_json({"mode": "silent"}, compress=True)
+            (memory_dir / "state.json").write_bytes(payload[: len(payload) // 2])
+            with patch.object(storage, "BOT_MEMORY_DIR", memory_dir):
+                with self.assertLogs("modules.storage", level="ERROR"):
+                    self.assertEqual(storage.load("state.json", {"mode": "verbose"}), {"mode": "verbose"})
+
+    def test_compressed_football_memory_round_trips(self):
+        from modules import football_memory
+
+        memory = {"metadata": {}, "leagues": {}, "teams": {"100": {"name": "Milan"}}, "matches": {}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory_path = Path(tmpdir) / "football_memory.json"
+            with (
+                patch.object(football_memory, "MEMORY_PATH", memory_path),
+                patch.object(football_memory, "COMPRESS_FOOTBALL_MEMORY", True),
+            ):
+                football_memory.save_memory(memory)
+                self.assertEqual(memory_path.read_bytes()[:2], b"\x1f\x8b")
+                self.assertEqual(football_memory.load_memory(), memory)
+
     def test_football_memory_write_failure_is_visible_to_caller(self):
         from modules import football_memory
 
@@ -42,6 +127,101 @@ class StorageTests(unittest.TestCase):
             with self.assertRaises(OSError):
                 football_memory.save_memory({"metadata": {}, "leagues": {}, "teams": {}, "matches": {}})
 
+    def test_background_writes_coalesce_and_readers_see_newest_payload(self):
+        from modules import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "health.json"
+            release = threading.Event()
+            real_write = storage._write_bytes_atomic
+
+            def slow_write(path, payload, *, mode=None):
+                release.wait(5)
+                real_write(path, payload, mode=mode)
+
+            with patch.object(storage, "_write_bytes_atomic", side_effect=slow_write) as write:
+                storage.submit_json_path(target, {"n": 0})
+                second = storage.submit_json_path(target, {"n": 1})
+                third = storage.submit_json_path(target, {"n": 2})
+                self.assertIs(second, third)
+                self.assertEqual(storage.load_json_path(target), {"n": 2})
+                release.set()
+                third.result(timeout=5)
+                self.assertTrue(storage.flush_pending_writes(timeout=5))
+
+            self.assertLessEqual(write.call_count, 2)
+            self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"n": 2})
+            self.assertEqual(list(target.parent.glob("*.tmp")), [])
+
+    def test_async_save_returns_after_durable_write_and_raises_failures(self):
+        from modules import storage
+
+        async def scenario(target):
+            await storage.save_json_path_async(target, {"mode": "silent"})
+            self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"mode": "silent"})
+            with patch.object(storage.os, "replace", side_effect=OSError("disk failure")):
+                with self.assertRaises(OSError):
+                    await storage.save_json_path_async(target, {"mode": "verbose"})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "state.json"
+            asyncio.run(scenario(target))
+            self.assertEqual(storage.load_json_path(target), {"mode": "silent"})
+            self.assertEqual(list(target.parent.glob("*.tmp")), [])
+
+    def test_synchronous_save_supersedes_queued_background_write(self):
+        from modules import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blocker = Path(tmpdir) / "blocker.json"
+            target = Path(tmpdir) / "state.json"
+            release = threading.Event()
+            real_write = storage._write_bytes_atomic
+
+            def gated_write(path, payload, *, mode=None):
+                if Path(path).name == "blocker.json":
+                    release.wait(5)
+                real_write(path, payload, mode=mode)
+
+            with patch.object(storage, "_write_bytes_atomic", side_effect=gated_write):
+                storage.submit_json_path(blocker, {})
+                queued = storage.submit_json_path(target, {"mode": "stale"})
+                storage.save_json_path(target, {"mode": "fresh"})
+                release.set()
+                queued.result(timeout=5)
+                self.assertTrue(storage.flush_pending_writes(timeout=5))
+
+            self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"mode": "fresh"})
+
+    def test_synchronous_save_waits_for_in_flight_background_write(self):
+        from modules import storage
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "state.json"
+            writing = threading.Event()
+            release = threading.Event()
+            real_write = storage._write_bytes_atomic
+
+            def gated_write(path, payload, *, mode=None):
+                if b"stale" in payload:
+                    writing.set()
+                    release.wait(5)
+                real_write(path, payload, mode=mode)
+
+            with patch.object(storage, "_write_bytes_atomic", side_effect=gated_write):
+                in_flight = storage.submit_json_path(target, {"mode": "stale"})
+                self.assertTrue(writing.wait(5))
+                saver = threading.Thread(target=storage.save_json_path, args=(target, {"mode": "fresh"}))
+                saver.start()
+                saver.join(0.2)
+                self.assertTrue(saver.is_alive())
+                release.set()
+                saver.join(5)
+                in_flight.result(timeout=5)
+                self.assertTrue(storage.flush_pending_writes(timeout=5))
+
+            self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"mode": "fresh"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -76,6 +76,7 @@ class TennisPreferenceTests(unittest.TestCase):
                 patch.object(tennis_loop, "is_silent", return_value=False),
                 patch.object(tennis_loop, "_load_state_once"),
                 patch.object(tennis_loop, "prune_tennis_state"),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
             ):
                 asyncio.run(
                     tennis_loop.run_tennis_loop(
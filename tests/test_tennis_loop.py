@@ -55,6 +55,7 @@ class TennisLoopTests(unittest.TestCase):
         tennis_loop.live_message_ids.clear()
         tennis_loop.live_state_keys.clear()
         tennis_loop.tennis_match_records.clear()
+        tennis_loop._dirty_track_ids.clear()
         tennis_loop._state_loaded = False
         self.now = to_bot_tz("2026-06-12T10:00:00+00:00")
 
@@ -69,7 +70,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -100,7 +101,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -124,7 +125,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 72),
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -149,7 +150,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
                 patch.object(tennis_loop, "bot_now", return_value=now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -172,7 +173,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -204,7 +205,7 @@ class TennisLoopTests(unittest.TestCase):
                         "last_reset_date": None,
                     }),
                 ),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[match])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -238,7 +239,7 @@ class TennisLoopTests(unittest.TestCase):
                         "last_reset_date": "2026-06-12",
                     }),
                 ),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -264,7 +265,7 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[live, ft])),
                 patch.object(tennis_loop, "upsert_live_message", AsyncMock(return_value=fake_live_msg)) as upsert_live,
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock(return_value=fake_ft_msg)) as post_msg,
@@ -280,6 +281,134 @@ class TennisLoopTests(unittest.TestCase):
         self.assertIn("ft-1", tennis_loop.final_announced_ids)
         self.assertTrue(save_state.called)
 
+    def test_live_board_mode_lists_tennis_on_the_shared_board(self):
+        from modules import api_provider, live_board, tennis_loop
+
+        live_a = tennis_match(match_id="live-a", status="LIVE")
+        live_b = tennis_match(match_id="live-b", status="LIVE")
+        fake_bot = SimpleNamespace(http_session=None)
+
+        async def run():
+            live_board.reset()
+            with (
+                patch.object(live_board, "LIVE_BOARD_ENABLED", True),
+                patch.object(live_board, "LIVE_BOARD_INCLUDE_TENNIS", True),
+                patch.object(live_board, "load", Mock(return_value={"message_ids": []})),
+                patch.object(live_board, "save_async", AsyncMock()),
+                patch.object(live_board, "upsert_live_message", AsyncMock(return_value=SimpleNamespace(id=800))) as board,
+                patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
+                patch.object(tennis_loop, "bot_now", return_value=self.now),
+                patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
+                patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[live_a, live_b])),
+                patch.object(tennis_loop, "upsert_live_message", AsyncMock()) as per_match,
+            ):
+                await tennis_loop.run_tennis_loop(fake_bot)
+                await tennis_loop.run_tennis_loop(fake_bot)
+                live_board.reset()
+                return board, per_match
+
+        board, per_match = asyncio.run(run())
+
+        per_match.assert_not_awaited()
+        board.assert_awaited_once()
+        self.assertEqual(board.await_args.kwargs["content"].count("Tennis LIVE"), 2)
+        self.assertIn("live-a", tennis_loop.live_state_keys)
+
+    def test_cycle_writes_once_and_flushes_immediately_after_confirmed_ft(self):
+        from modules import api_provider, tennis_loop
+
+        prepared = tennis_match(match_id="ns-1")
+        live_a = tennis_match(match_id="live-a", status="LIVE")
+        live_b = tennis_match(match_id="live-b", status="LIVE")
+        ft = tennis_match(match_id="ft-1", status="FT")
+        fake_bot = SimpleNamespace(http_session=None)
+        writes = []
+
+        async def run(matches):
+            with (
+                patch.object(tennis_loop, "TENNIS_PRE_ANNOUNCE_HOURS", 4),
+                patch.object(tennis_loop, "bot_now", return_value=self.now),
+                patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
+                patch.object(
+                    tennis_loop,
+                    "save_async",
+                    AsyncMock(side_effect=lambda _name, state, **_format: writes.append(state)),
+                ),
+                patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=matches)),
+                patch.object(tennis_loop, "upsert_live_message", AsyncMock(return_value=SimpleNamespace(id=900))),
+                patch.object(tennis_loop, "post_new_general_message", AsyncMock(return_value=SimpleNamespace(id=901))),
+            ):
+                await tennis_loop.run_tennis_loop(fake_bot)
+
+        asyncio.run(run([prepared, live_a, live_b]))
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(set(writes[0]["matches"]), {"ns-1", "live-a", "live-b"})
+        self.assertEqual(tennis_loop.live_message_ids["live-a"], 900)
+
+        writes.clear()
+        asyncio.run(run([ft, live_a]))
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0]["matches"]["ft-1"]["final_announced"])
+        self.assertFalse(tennis_loop._dirty_track_ids)
+
+    def test_still_visible_announced_match_is_not_rewritten_every_cycle(self):
+        from modules import api_provider, tennis_loop
+
+        ft = tennis_match(match_id="ft-1", status="FT")
+        fake_bot = SimpleNamespace(http_session=None)
+        writes = []
+
+        async def run(now):
+            with (
+                patch.object(tennis_loop, "bot_now", return_value=now),
+                patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
+                patch.object(
+                    tennis_loop,
+                    "save_async",
+                    AsyncMock(side_effect=lambda _name, state, **_format: writes.append(state)),
+                ),
+                patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
+                patch.object(tennis_loop, "post_new_general_message", AsyncMock(return_value=SimpleNamespace(id=901))),
+            ):
+                await tennis_loop.run_tennis_loop(fake_bot)
+
+        asyncio.run(run(self.now))
+        self.assertEqual(len(writes), 1)
+        for minutes in (1, 2, 30):
+            asyncio.run(run(self.now + timedelta(minutes=minutes)))
+        self.assertEqual(len(writes), 1)
+        asyncio.run(run(self.now + timedelta(hours=2)))
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(
+            writes[-1]["matches"]["ft-1"]["last_seen_at"], (self.now + timedelta(hours=2)).isoformat()
+        )
+
+    def test_migration_is_persisted_on_cycles_without_tennis(self):
+        from modules import api_provider, tennis_loop
+
+        legacy = {"pre_announced_ids": [], "final_announced_ids": ["legacy-ft"], "last_reset_date": "2026-06-12"}
+        fake_bot = SimpleNamespace(http_session=None)
+
+        async def run(fetch):
+            with (
+                patch.object(tennis_loop, "bot_now", return_value=self.now),
+                patch.object(tennis_loop, "load", Mock(return_value=dict(legacy))),
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
+                patch.object(api_provider, "fetch_tennis_day", fetch),
+            ):
+                await tennis_loop.run_tennis_loop(fake_bot)
+                return save_state
+
+        for fetch in (AsyncMock(return_value=[]), AsyncMock(side_effect=RuntimeError("espn down"))):
+            tennis_loop.tennis_match_records.clear()
+            tennis_loop._dirty_track_ids.clear()
+            tennis_loop._state_loaded = False
+            save_state = asyncio.run(run(fetch))
+            save_state.assert_awaited_once()
+            self.assertEqual(save_state.call_args.args[1]["version"], 2)
+            self.assertTrue(save_state.call_args.args[1]["matches"]["legacy-ft"]["final_announced"])
+
     def test_live_message_id_survives_restart_and_is_reused(self):
         from modules import api_provider, tennis_loop
 
@@ -293,8 +422,8 @@ class TennisLoopTests(unittest.TestCase):
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
                 patch.object(
                     tennis_loop,
-                    "save",
-                    Mock(side_effect=lambda _name, state: saved_states.append(state)),
+                    "save_async",
+                    AsyncMock(side_effect=lambda _name, state, **_format: saved_states.append(state)),
                 ),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[live])),
                 patch.object(
@@ -314,13 +443,14 @@ class TennisLoopTests(unittest.TestCase):
         tennis_loop.live_message_ids.clear()
         tennis_loop.live_state_keys.clear()
         tennis_loop.tennis_match_records.clear()
+        tennis_loop._dirty_track_ids.clear()
         tennis_loop._state_loaded = False
 
         async def restarted_run():
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=persisted)),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[live])),
                 patch.object(
                     tennis_loop,
@@ -354,7 +484,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=state)),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -384,7 +514,7 @@ class TennisLoopTests(unittest.TestCase):
         async def run():
             with (
                 patch.object(tennis_loop, "load", Mock(return_value=state)) as load_state,
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
             ):
                 decision = await scheduler._tennis_poll_decision(fake_bot, self.now)
@@ -419,14 +549,18 @@ class TennisLoopTests(unittest.TestCase):
         })
         tennis_loop.final_announced_ids.update({"expired", "recent"})
 
-        with patch.object(tennis_loop, "save", Mock()) as save_state:
+        tennis_loop._dirty_track_ids.clear()
+
+        with patch.object(tennis_loop, "save_async", AsyncMock()) as save_state:
             removed = tennis_loop.prune_tennis_state(now)
+            save_state.assert_not_called()
+            self.assertTrue(asyncio.run(tennis_loop._flush_state()))
 
         self.assertEqual(removed, 1)
         self.assertNotIn("expired", tennis_loop.tennis_match_records)
         self.assertIn("recent", tennis_loop.tennis_match_records)
         self.assertIn("live", tennis_loop.tennis_match_records)
-        self.assertTrue(save_state.called)
+        self.assertEqual(set(save_state.await_args.args[1]["matches"]), {"recent", "live"})
 
     def test_prune_uses_migration_time_when_start_time_is_missing(self):
         from modules import tennis_loop
@@ -440,7 +574,7 @@ class TennisLoopTests(unittest.TestCase):
         }
         tennis_loop.final_announced_ids.add("legacy")
 
-        with patch.object(tennis_loop, "save", Mock()):
+        with patch.object(tennis_loop, "save_async", AsyncMock()):
             removed = tennis_loop.prune_tennis_state(now)
 
         self.assertEqual(removed, 1)
@@ -461,7 +595,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -489,7 +623,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock(return_value=SimpleNamespace(id=502))) as post_msg,
             ):
@@ -513,7 +647,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(
                     tennis_loop,
@@ -547,7 +681,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(
                     tennis_loop,
@@ -579,7 +713,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()) as save_state,
+                patch.object(tennis_loop, "save_async", AsyncMock()) as save_state,
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(tennis_loop, "post_new_general_message", AsyncMock()) as post_msg,
             ):
@@ -608,7 +742,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(
                     tennis_loop,
@@ -641,7 +775,7 @@ class TennisLoopTests(unittest.TestCase):
             with (
                 patch.object(tennis_loop, "bot_now", return_value=self.now),
                 patch.object(tennis_loop, "load", Mock(return_value=tennis_loop._TENNIS_STATE_DEFAULT.copy())),
-                patch.object(tennis_loop, "save", Mock()),
+                patch.object(tennis_loop, "save_async", AsyncMock()),
                 patch.object(api_provider, "fetch_tennis_day", AsyncMock(return_value=[ft])),
                 patch.object(
                     tennis_loop,
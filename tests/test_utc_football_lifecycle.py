@@ -1,5 +1,6 @@
 import asyncio
 import json
+import logging
 import os
 import tempfile
 import unittest
@@ -369,7 +370,7 @@ class UtcFootballLifecycleTests(unittest.TestCase):
         self.assertTrue(legacy_still_exists)
 
     def test_ft_and_memory_flags_retry_independently(self):
-        from modules import ft_handler
+        from modules import ft_handler, memory_queue
         from modules import match_state
 
         match = espn_match(fixture_id="independent-1")
@@ -388,20 +389,26 @@ class UtcFootballLifecycleTests(unittest.TestCase):
         async def run(memory_dir: Path):
             with (
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=object())) as post_msg,
-                patch.object(ft_handler, "update_match_in_memory", AsyncMock(side_effect=RuntimeError("memory down"))) as update_memory,
+                patch.object(
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=RuntimeError("memory down")),
+                ) as update_memory,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 first = match_state.get_fixture_state("independent-1", memory_dir=memory_dir)
 
             with (
                 patch.object(ft_handler, "post_new_general_message", AsyncMock(return_value=None)) as post_msg_retry,
                 patch.object(
-                    ft_handler,
-                    "update_match_in_memory",
-                    AsyncMock(return_value={"updated": True, "reason": "updated"}),
+                    memory_queue,
+                    "update_matches_in_memory",
+                    AsyncMock(side_effect=lambda _session, matches: [{"updated": True, "reason": "updated"} for _m in matches]),
                 ) as update_memory_retry,
             ):
                 await ft_handler.process_terminal_fixture(fake_bot, match, memory_dir=memory_dir)
+                await memory_queue.drain(fake_bot.http_session, memory_dir=memory_dir)
                 second = match_state.get_fixture_state("independent-1", memory_dir=memory_dir)
 
             return first, second, post_msg, update_memory, post_msg_retry, update_memory_retry
@@ -1452,6 +1459,258 @@ class UtcFootballLifecycleTests(unittest.TestCase):
         self.assertEqual(len(logs.output), 1)
         self.assertIn("sleep reason=unresolved_ft_due", logs.output[0])
 
+    def test_job_scheduler_runs_planned_jobs_serially_per_lane_and_skips_overruns(self):
+        from modules.job_scheduler import Job, JobScheduler
+
+        async def scenario():
+            jobs = JobScheduler("test")
+            events = []
+            active = {"operations": 0}
+            overlap_seen = []
+
+            def lane_job(name, delay):
+                async def action(now):
+                    active["operations"] += 1
+                    overlap_seen.append(active["operations"] > 1)
+                    events.append(name)
+                    await asyncio.sleep(delay)
+                    active["operations"] -= 1
+                    return datetime.now(timezone.utc) + timedelta(hours=1)
+                return action
+
+            async def slow(now):
+                events.append("slow")
+                await asyncio.sleep(0.25)
+
+            jobs.register(Job("football", lane_job("football", 0.05), interval_sec=60, lane="operations"))
+            jobs.register(Job("tennis", lane_job("tennis", 0.05), interval_sec=60, lane="operations"))
+            jobs.register(Job("health", slow, interval_sec=0.1))
+            runner = asyncio.create_task(jobs.run())
+            await asyncio.sleep(0.4)
+            runner.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await runner
+            return jobs, events, overlap_seen
+
+        with self.assertLogs("modules.job_scheduler", level="DEBUG") as logs:
+            jobs, events, overlap_seen = asyncio.run(scenario())
+
+        self.assertEqual(events.count("football"), 1)
+        self.assertEqual(events.count("tennis"), 1)
+        self.assertFalse(any(overlap_seen))
+        self.assertGreaterEqual(jobs.get_job("health").skipped, 1)
+        skip_logs = [record for record in logs.records if "Job health is still running" in record.getMessage()]
+        self.assertTrue(skip_logs)
+        self.assertTrue(all(record.levelno == logging.DEBUG for record in skip_logs))
+        upcoming = [job["name"] for job in jobs.upcoming()]
+        self.assertEqual(upcoming[-2:], ["football", "tennis"])
+        self.assertGreater(jobs.get_job("football").next_due, datetime.now(timezone.utc) + timedelta(minutes=59))
+
+    def test_football_job_interval_follows_the_provider_poll_interval(self):
+        from modules import api_provider, scheduler
+        from modules.job_scheduler import JobScheduler
+
+        jobs = JobScheduler("test")
+        scheduler.register_operations_jobs(object(), jobs)
+        football = jobs.get_job("football")
+
+        with patch.object(api_provider, "_espn_healthy", True):
+            self.assertEqual(football.interval(), api_provider.ESPN_POLL_INTERVAL)
+            self.assertEqual(jobs.get_job("football").describe()["interval_sec"], api_provider.ESPN_POLL_INTERVAL)
+        with patch.object(api_provider, "_espn_healthy", False):
+            self.assertEqual(football.interval(), api_provider.FALLBACK_POLL_INTERVAL)
+
+    def test_operations_loop_registers_each_workload_as_a_job(self):
+        from modules import scheduler
+        from modules.job_scheduler import JobScheduler
+
+        jobs = JobScheduler("test")
+        scheduler.register_operations_jobs(object(), jobs)
+
+        self.assertEqual(
+            {job["name"] for job in jobs.upcoming()},
+            {"daily_memory", "provider_notice", "football", "tennis", "dashboard_health"},
+        )
+        self.assertNotEqual(jobs.get_job("football").lane, jobs.get_job("tennis").lane)
+        self.assertNotEqual(jobs.get_job("daily_memory").lane, jobs.get_job("football").lane)
+
+    def test_startup_pipeline_overlaps_independent_steps_and_skips_dependents_of_failures(self):
+        from modules import startup
+
+        events = []
+
+        def step(name, delay, fail=False):
+            async def action():
+                events.append(f"{name}:start")
+                await asyncio.sleep(delay)
+                events.append(f"{name}:end")
+                if fail:
+                    raise RuntimeError(f"{name} broke")
+                return name
+            return action
+
+        async def scenario():
+            pipeline = startup.StartupPipeline()
+            pipeline.add("football_discovery", step("football_discovery", 0.1))
+            pipeline.add("tennis_discovery", step("tennis_discovery", 0.1))
+            pipeline.add("caches", step("caches", 0.01, fail=True))
+            pipeline.add("broadcast", step("broadcast", 0), after=("football_discovery", "tennis_discovery"))
+            pipeline.add("scheduler", step("scheduler", 0), after=("caches",))
+            with self.assertRaises(ValueError):
+                pipeline.add("orphan", step("orphan", 0), after=("missing",))
+            pipeline.start()
+            broadcast_done = pipeline.done("broadcast")
+            report = await pipeline.run()
+            self.assertTrue(broadcast_done.done())
+            return pipeline, report
+
+        with self.assertLogs("modules.startup", level="INFO") as logs:
+            pipeline, report = asyncio.run(scenario())
+
+        self.assertLess(events.index("tennis_discovery:start"), events.index("football_discovery:end"))
+        self.assertGreater(events.index("broadcast:start"), events.index("tennis_discovery:end"))
+        self.assertNotIn("scheduler:start", events)
+        statuses = {step["name"]: step["status"] for step in report["steps"]}
+        self.assertEqual(statuses, {
+            "football_discovery": "ok",
+            "tennis_discovery": "ok",
+            "caches": "failed",
+            "broadcast": "ok",
+            "scheduler": "skipped",
+        })
+        self.assertEqual(pipeline.result("football_discovery"), "football_discovery")
+        self.assertLess(report["total_ms"], 190)
+        self.assertIs(startup.get_startup_report(), report)
+        self.assertIn("Startup finished in", logs.output[-1])
+
+    def test_startup_holds_football_and_tennis_jobs_until_their_steps_finish(self):
+        from modules import scheduler
+        from modules.job_scheduler import JobScheduler
+
+        async def scenario():
+            jobs = JobScheduler("test")
+            broadcast = asyncio.get_running_loop().create_future()
+            scheduler.register_operations_jobs(object(), jobs, hold_until={"football": broadcast})
+            held_until = jobs.get_job("football").next_due
+            broadcast.set_result(None)
+            await asyncio.sleep(0)
+            return jobs, held_until
+
+        before = datetime.now(timezone.utc)
+        jobs, held_until = asyncio.run(scenario())
+
+        self.assertGreater(held_until, before + timedelta(minutes=4))
+        self.assertLess(jobs.get_job("football").next_due, before + timedelta(minutes=1))
+        self.assertLess(jobs.get_job("tennis").next_due, before + timedelta(minutes=1))
+
+    def test_startup_holds_every_posting_job_until_the_greeting_is_out(self):
+        import football_tracker_bot
+        from modules import scheduler
+        from modules.job_scheduler import JobScheduler
+        from modules.startup import StartupPipeline
+
+        async def scenario():
+            greeting = asyncio.Event()
+            pipeline = StartupPipeline()
+            pipeline.add("tennis_discovery", AsyncMock())
+            pipeline.add("broadcast", greeting.wait)
+            pipeline.start()
+            jobs = JobScheduler("test")
+            scheduler.register_operations_jobs(
+                object(), jobs, hold_until=football_tracker_bot._startup_holds(pipeline, True),
+            )
+            held = {job["name"]: job["next_due_utc"] for job in jobs.upcoming()}
+            greeting.set()
+            await pipeline.run()
+            await asyncio.sleep(0)
+            return jobs, held
+
+        before = datetime.now(timezone.utc)
+        jobs, held = asyncio.run(scenario())
+
+        for name in ("daily_memory", "provider_notice", "football"):
+            self.assertGreater(held[name], before + timedelta(minutes=4), name)
+            self.assertLess(jobs.get_job(name).next_due, before + timedelta(minutes=1), name)
+        self.assertLess(held["dashboard_health"], before + timedelta(minutes=1))
+        self.assertEqual(football_tracker_bot._startup_holds(None, False), {})
+
+    def test_slow_football_cycle_does_not_delay_tennis_and_cycle_timing_is_reported(self):
+        from modules import scheduler
+        from modules.job_scheduler import JobScheduler
+
+        events = []
+
+        async def slow_football(_bot, now):
+            events.append("football_start")
+            await asyncio.sleep(0.3)
+            events.append("football_end")
+            return datetime.now(timezone.utc) + timedelta(hours=1)
+
+        async def tennis(_bot, now):
+            events.append("tennis")
+            return datetime.now(timezone.utc) + timedelta(hours=1)
+
+        async def scenario():
+            runner = asyncio.create_task(jobs.run())
+            await asyncio.sleep(0.45)
+            runner.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await runner
+
+        jobs = JobScheduler("test")
+        with patch.object(scheduler, "operations_jobs", jobs), \
+             patch.object(scheduler, "_run_football_job", slow_football), \
+             patch.object(scheduler, "_run_tennis_job", tennis), \
+             patch.object(scheduler, "_run_provider_notice_job", AsyncMock()), \
+             patch.object(scheduler, "run_local_daily_routines", AsyncMock()), \
+             patch.object(scheduler, "write_dashboard_health_snapshot"):
+            scheduler.register_operations_jobs(object(), jobs)
+            asyncio.run(scenario())
+            football_status = scheduler.get_football_scheduler_status()
+            tennis_status = scheduler.get_tennis_scheduler_status()
+
+        self.assertLess(events.index("tennis"), events.index("football_end"))
+        self.assertEqual(football_status["cycles"], 1)
+        self.assertGreaterEqual(football_status["last_cycle_duration_sec"], 0.3)
+        self.assertGreaterEqual(football_status["last_cycle_lateness_sec"], 0)
+        self.assertEqual(tennis_status["cycles"], 1)
+        self.assertLess(tennis_status["last_cycle_duration_sec"], 0.3)
+
+
+    def test_slow_daily_memory_sweep_does_not_delay_football(self):
+        from modules import scheduler
+        from modules.job_scheduler import JobScheduler
+
+        events = []
+
+        async def slow_daily(_bot, now):
+            events.append("daily_start")
+            await asyncio.sleep(0.3)
+            events.append("daily_end")
+
+        async def football(_bot, now):
+            events.append("football")
+            return datetime.now(timezone.utc) + timedelta(hours=1)
+
+        async def scenario():
+            runner = asyncio.create_task(jobs.run())
+            await asyncio.sleep(0.4)
+            runner.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await runner
+
+        jobs = JobScheduler("test")
+        with patch.object(scheduler, "operations_jobs", jobs), \
+             patch.object(scheduler, "_run_football_job", football), \
+             patch.object(scheduler, "_run_tennis_job", AsyncMock()), \
+             patch.object(scheduler, "_run_provider_notice_job", AsyncMock()), \
+             patch.object(scheduler, "run_local_daily_routines", slow_daily), \
+             patch.object(scheduler, "write_dashboard_health_snapshot"):
+            scheduler.register_operations_jobs(object(), jobs)
+            asyncio.run(scenario())
+
+        self.assertLess(events.index("daily_start"), events.index("football"))
+        self.assertLess(events.index("football"), events.index("daily_end"))
 
 if __name__ == "__main__":
     unittest.main()